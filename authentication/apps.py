@@ -4,3 +4,10 @@ from django.apps import AppConfig
 class AuthenticationConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "authentication"
+
+    def ready(self):
+        from employee_management_system.response_cache import track_versions
+
+        from . import signals  # noqa: F401
+
+        track_versions(self.get_model("User"), ignore_fields={"last_login"})
@@ -1,6 +1,13 @@
 from django.contrib.auth import get_user_model
 from django.contrib.auth.backends import ModelBackend
+from django.contrib.postgres.aggregates import ArrayAgg
+from django.db.models import Case, Q, Value, When
 from django.utils import timezone
+from rest_framework.authentication import TokenAuthentication
+from rest_framework.exceptions import AuthenticationFailed
+
+from .last_login import record_login
+from .token_cache import token_cache
 
 UserModel = get_user_model()
 
@@ -8,16 +15,69 @@ UserModel = get_user_model()
 class CustomAuthenticationBackend(ModelBackend):
 
     def authenticate(self, request, email=None, username=None, password=None):
-        if username:
-            user = UserModel.objects.filter(username=username).first()
-            if user and user.check_password(password) and user.is_active:
-                user.last_login = timezone.now()
-                user.save(update_fields=["last_login"])
-                return user
-        if email:
-            user = UserModel.objects.filter(email=email).first()
-            if user and user.check_password(password) and user.is_active:
-                user.last_login = timezone.now()
-                user.save(update_fields=["last_login"])
-                return user
+        identifier = username or email
+        if not identifier or password is None:
+            return None
+
+        user = self.get_login_user(identifier)
+        if user is None:
+            # Run the hasher anyway so unknown logins take as long as bad passwords.
+            UserModel().set_password(password)
+            return None
+
+        if user.check_password(password) and user.is_active:
+            record_login(user, timezone.now())
+            return user
         return None
+
+    def get_login_user(self, identifier):
+        """
+        Find the user logging in by username or email in a single query,
+        loading the role and API token alongside it. A username match wins
+        over an email match.
+        """
+        return (
+            UserModel.objects.filter(Q(username=identifier) | Q(email=identifier))
+            .select_related("role", "auth_token")
+            .order_by(
+                Case(When(username=identifier, then=Value(0)), default=Value(1)), "pk"
+            )
+            .first()
+        )
+
+
+class CachedTokenAuthentication(TokenAuthentication):
+    """
+    Token authentication backed by an in-process LRU, so the token, user,
+    role and employee ID lookups run once per token instead of on every
+    request.
+    ``request.auth`` is the token key.
+    """
+
+    def authenticate_credentials(self, key):
+        user = token_cache.get(key)
+        if user is not None:
+            return (user, key)
+
+        model = self.get_model()
+        try:
+            token = (
+                model.objects.select_related("user__role")
+                .annotate(
+                    employee_ids=ArrayAgg(
+                        "user__employee__id",
+                        filter=Q(user__employee__isnull=False),
+                        default=Value([]),
+                    )
+                )
+                .get(key=key)
+            )
+        except model.DoesNotExist:
+            raise AuthenticationFailed("Invalid token.")
+
+        if not token.user.is_active:
+            raise AuthenticationFailed("User inactive or deleted.")
+
+        token.user.employee_ids = frozenset(token.employee_ids)
+        token_cache.set(key, token.user)
+        return (token.user, key)
@@ -0,0 +1,35 @@
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+
+import django
+from django.contrib.auth.hashers import make_password
+
+# Worker processes import this module before Django is set up, so it must not
+# import models at module level.
+
+
+def _setup_worker():
+    django.setup()
+
+
+def password_hashing_pool(workers):
+    """Process pool for hashing passwords off the calling process."""
+    return ProcessPoolExecutor(
+        max_workers=workers,
+        mp_context=multiprocessing.get_context("spawn"),
+        initializer=_setup_worker,
+    )
+
+
+def hash_passwords(passwords, executor=None, workers=1):
+    """
+    Hash ``passwords`` with the configured hasher, in parallel when an
+    ``executor`` from ``password_hashing_pool`` with ``workers`` processes is
+    given. ``None`` produces an unusable password.
+    """
+    passwords = list(passwords)
+    if executor is None:
+        return [make_password(password) for password in passwords]
+
+    chunksize = max(1, len(passwords) // (workers * 4))
+    return list(executor.map(make_password, passwords, chunksize=chunksize))
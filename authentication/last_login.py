@@ -0,0 +1,72 @@
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.db import close_old_connections
+from django.db.models import Case, DateTimeField, Value, When
+
+from .models import User
+
+logger = logging.getLogger("custom_logger")
+
+
+class LastLoginWriter:
+    """
+    Collects ``last_login`` timestamps and writes them from a background
+    thread every ``interval`` seconds, one UPDATE per ``batch_size`` users, so
+    logins never wait on (or contend for) a write to the user row.
+    """
+
+    def __init__(self, interval=5, batch_size=500):
+        self.interval = interval
+        self.batch_size = batch_size
+        self.pending = {}
+        self.lock = threading.Lock()
+        self.wakeup = threading.Event()
+        self.thread = None
+
+    def record(self, user_id, timestamp):
+        with self.lock:
+            self.pending[user_id] = timestamp
+            if self.thread is None:
+                self.thread = threading.Thread(
+                    target=self.run, name="last-login-writer", daemon=True
+                )
+                self.thread.start()
+                atexit.register(self.flush)
+
+    def run(self):
+        while True:
+            self.wakeup.wait(self.interval)
+            self.wakeup.clear()
+            close_old_connections()
+            try:
+                self.flush()
+            except Exception as e:
+                logger.error(f"Error writing last_login updates: {e}")
+
+    def flush(self):
+        with self.lock:
+            pending, self.pending = list(self.pending.items()), {}
+
+        for start in range(0, len(pending), self.batch_size):
+            batch = pending[start : start + self.batch_size]
+            User.objects.filter(pk__in=[user_id for user_id, _ in batch]).update(
+                last_login=Case(
+                    *[When(pk=user_id, then=Value(when)) for user_id, when in batch],
+                    output_field=DateTimeField(),
+                )
+            )
+
+
+writer = LastLoginWriter(interval=getattr(settings, "LAST_LOGIN_FLUSH_INTERVAL", 5))
+
+
+def record_login(user, timestamp):
+    """Set ``user.last_login`` and persist it, in the background if enabled."""
+    user.last_login = timestamp
+    if getattr(settings, "LAST_LOGIN_ASYNC", True):
+        writer.record(user.pk, timestamp)
+    else:
+        user.save(update_fields=["last_login"])
@@ -0,0 +1,54 @@
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from django.core.management.base import BaseCommand
+from django.db import connection
+from rest_framework.test import APIRequestFactory
+
+from authentication.last_login import writer
+from authentication.views import LoginView
+from employee_management_system.latency import summarize
+
+
+class Command(BaseCommand):
+    help = "Measure login latency and throughput with concurrent clients."
+
+    def add_arguments(self, parser):
+        parser.add_argument("username", help="Username or email to log in with.")
+        parser.add_argument("password")
+        parser.add_argument("--concurrency", type=int, default=16)
+        parser.add_argument("--requests", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        view = LoginView.as_view()
+        factory = APIRequestFactory()
+        payload = {
+            "email_or_username": options["username"],
+            "password": options["password"],
+        }
+
+        def login(_):
+            request = factory.post("/auth/login/", payload, format="json")
+            started = time.perf_counter()
+            try:
+                response = view(request)
+                return time.perf_counter() - started, response.status_code == 200
+            finally:
+                connection.close()
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=options["concurrency"]) as executor:
+            results = list(executor.map(login, range(options["requests"])))
+        elapsed = time.perf_counter() - started
+        writer.flush()
+
+        summary = summarize([latency for latency, _ in results], elapsed)
+        failures = sum(1 for _, ok in results if not ok)
+        self.stdout.write(
+            f"{summary['count']} logins, {failures} failed, "
+            f"{summary['throughput_per_s']:.1f}/s with {options['concurrency']} clients"
+        )
+        self.stdout.write(
+            f"p50 {summary['p50_ms']:.1f} ms, p95 {summary['p95_ms']:.1f} ms, "
+            f"p99 {summary['p99_ms']:.1f} ms, max {summary['max_ms']:.1f} ms"
+        )
@@ -4,12 +4,13 @@ import re
 from django.db import IntegrityError
 from rest_framework import serializers
 
+from employee_management_system.fieldsets import SparseFieldsetMixin
 from employees.models import Role
 
 from .models import User
 
 
-class UserSerializer(serializers.ModelSerializer):
+class UserSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     role = serializers.PrimaryKeyRelatedField(
         queryset=Role.objects.all(), required=False, allow_null=True
     )
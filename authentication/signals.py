@@ -0,0 +1,39 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework.authtoken.models import Token
+
+from employees.models import Employee, Role
+
+from .models import User
+from .token_cache import token_cache
+
+LOGIN_ONLY_FIELDS = {"last_login"}
+
+
+@receiver(post_delete, sender=Token)
+def invalidate_deleted_token(sender, instance, **kwargs):
+    token_cache.invalidate(key=instance.key)
+
+
+@receiver(post_save, sender=User)
+def invalidate_saved_user(sender, instance, created, update_fields=None, **kwargs):
+    if created or (update_fields and set(update_fields) <= LOGIN_ONLY_FIELDS):
+        return
+    token_cache.invalidate(user_id=instance.pk)
+
+
+@receiver(post_delete, sender=User)
+def invalidate_deleted_user(sender, instance, **kwargs):
+    token_cache.invalidate(user_id=instance.pk)
+
+
+@receiver(post_save, sender=Role)
+@receiver(post_delete, sender=Role)
+def invalidate_role_users(sender, instance, **kwargs):
+    token_cache.invalidate(role_id=instance.pk)
+
+
+@receiver(post_save, sender=Employee)
+@receiver(post_delete, sender=Employee)
+def invalidate_employee_user(sender, instance, **kwargs):
+    token_cache.invalidate(user_id=instance.user_id)
@@ -1,3 +1,31 @@
+import uuid
+
 from django.test import TestCase
 
-# Create your tests here.
+from .customAuthentication import CustomAuthenticationBackend
+from .models import User
+
+
+class LoginLookupTests(TestCase):
+    def create_user(self, number, username, email):
+        return User.objects.create(
+            id=uuid.UUID(int=number), username=username, email=email
+        )
+
+    def test_username_match_wins_over_email_matches_sorting_first(self):
+        self.create_user(1, "ada", "shared@example.com")
+        self.create_user(2, "grace", "shared@example.com")
+        owner = self.create_user(3, "shared@example.com", "owner@example.com")
+
+        backend = CustomAuthenticationBackend()
+
+        self.assertEqual(backend.get_login_user("shared@example.com"), owner)
+
+    def test_falls_back_to_an_email_match(self):
+        self.create_user(2, "grace", "shared@example.com")
+        first = self.create_user(1, "ada", "shared@example.com")
+
+        backend = CustomAuthenticationBackend()
+
+        self.assertEqual(backend.get_login_user("shared@example.com"), first)
+        self.assertIsNone(backend.get_login_user("nobody@example.com"))
@@ -0,0 +1,89 @@
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+
+
+class TokenCache:
+    """
+    Bounded, thread-safe LRU of token key -> user (with its role loaded).
+
+    The cache is per process and signals only clear the process that saved
+    the change, so ``timeout`` is the window during which other workers keep
+    accepting a deleted token or a deactivated user; keep it to a few
+    seconds. Callers get a copy of the cached user so per-request attribute
+    changes never leak into the next request.
+    """
+
+    def __init__(self, max_size=10000, timeout=5):
+        self.max_size = max_size
+        self.timeout = timeout
+        self.entries = OrderedDict()
+        self.lock = threading.Lock()
+        self.hits = self.misses = self.evictions = self.invalidations = 0
+
+    def get(self, key):
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None or entry[0] < time.monotonic():
+                if entry is not None:
+                    del self.entries[key]
+                self.misses += 1
+                return None
+            self.entries.move_to_end(key)
+            self.hits += 1
+            user = entry[1]
+
+        return self.copy_user(user)
+
+    def set(self, key, user):
+        user = self.copy_user(user)
+        with self.lock:
+            self.entries[key] = (time.monotonic() + self.timeout, user)
+            self.entries.move_to_end(key)
+            while len(self.entries) > self.max_size:
+                self.entries.popitem(last=False)
+                self.evictions += 1
+
+    def copy_user(self, user):
+        user = copy.copy(user)
+        if user.role is not None:
+            user.role = copy.copy(user.role)
+        return user
+
+    def invalidate(self, key=None, user_id=None, role_id=None):
+        """Drop the entry for ``key`` and every entry of ``user_id``/``role_id``."""
+        with self.lock:
+            stale = [
+                cached_key
+                for cached_key, (_, user) in self.entries.items()
+                if cached_key == key
+                or (user_id is not None and user.pk == user_id)
+                or (role_id is not None and user.role_id == role_id)
+            ]
+            for cached_key in stale:
+                del self.entries[cached_key]
+            self.invalidations += len(stale)
+
+    def clear(self):
+        with self.lock:
+            self.entries.clear()
+
+    def stats(self):
+        with self.lock:
+            return {
+                "size": len(self.entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+            }
+
+
+token_cache = TokenCache(
+    max_size=getattr(settings, "TOKEN_CACHE_MAX_SIZE", 10000),
+    timeout=getattr(settings, "TOKEN_CACHE_TIMEOUT", 5),
+)
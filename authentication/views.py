@@ -6,6 +6,8 @@ from rest_framework.views import APIView
 
 from employee_management_system.CustomResponse import CustomResponse
 from employee_management_system.exceptions import custom_exception_handler
+from employee_management_system.metrics import SerializerTimingMixin
+from employee_management_system.response_cache import cache_response
 from employees.models import CUSTOM_PERMISSIONS
 from permissions.permissions import CustomUserPermission
 
@@ -13,7 +15,7 @@ from .models import User
 from .serializers import LoginSerializer, UserSerializer
 
 
-class UserViewSet(viewsets.ModelViewSet):
+class UserViewSet(SerializerTimingMixin, viewsets.ModelViewSet):
     queryset = User.objects.all()
     serializer_class = UserSerializer
     permission_classes = [CustomUserPermission]
@@ -111,7 +113,10 @@ class LoginView(APIView):
                     data={},
                 )
 
-            token, _ = Token.objects.get_or_create(user=user)
+            try:
+                token = user.auth_token
+            except Token.DoesNotExist:
+                token, _ = Token.objects.get_or_create(user=user)
 
             return CustomResponse(
                 status_code=status.HTTP_200_OK,
@@ -132,6 +137,7 @@ class LoginView(APIView):
 
 
 class PermissionListView(APIView):
+    @cache_response()
     def get(self, request, *args, **kwargs):
         try:
             custom_permissions_names = list(CUSTOM_PERMISSIONS.values())
@@ -4,3 +4,8 @@ from django.apps import AppConfig
 class DepartmentsConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "departments"
+
+    def ready(self):
+        from employee_management_system.response_cache import track_versions
+
+        track_versions(self.get_model("Department"))
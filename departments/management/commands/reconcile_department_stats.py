@@ -0,0 +1,26 @@
+from django.core.management.base import BaseCommand
+
+from departments.stats import reconcile_department_stats
+
+
+class Command(BaseCommand):
+    help = "Recompute department headcount, manager count and payroll counters."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--department",
+            type=int,
+            action="append",
+            dest="departments",
+            help="Only reconcile this department; may be repeated.",
+        )
+
+    def handle(self, *args, **options):
+        drifted = reconcile_department_stats(options["departments"])
+        if drifted:
+            ids = ", ".join(str(pk) for pk in drifted)
+            self.stdout.write(
+                self.style.WARNING(f"Fixed {len(drifted)} departments: {ids}.")
+            )
+        else:
+            self.stdout.write(self.style.SUCCESS("Department statistics are correct."))
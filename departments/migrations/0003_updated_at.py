@@ -0,0 +1,18 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:56
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("departments", "0002_alter_department_description"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="department",
+            name="updated_at",
+            field=models.DateTimeField(auto_now=True),
+        ),
+    ]
@@ -0,0 +1,120 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:16
+
+from django.db import migrations, models
+from django.db.models import Count, DecimalField, Q, Sum, Value
+from django.db.models.functions import Coalesce, Lower
+from django.db.models.lookups import Exact
+
+# Pay periods per year by pay period with non-letters removed, as
+# employees.payroll scaled them when this migration was written. A missing
+# pay period counts as monthly, an unrecognised one as nothing.
+PAY_PERIOD_FACTORS = {
+    "hourly": 2080,
+    "hour": 2080,
+    "perhour": 2080,
+    "daily": 260,
+    "day": 260,
+    "perday": 260,
+    "weekly": 52,
+    "week": 52,
+    "perweek": 52,
+    "biweekly": 26,
+    "fortnightly": 26,
+    "semimonthly": 24,
+    "twicemonthly": 24,
+    "monthly": 12,
+    "month": 12,
+    "permonth": 12,
+    "quarterly": 4,
+    "quarter": 4,
+    "annual": 1,
+    "year": 1,
+    "yearly": 1,
+    "annually": 1,
+    "peryear": 1,
+}
+
+
+def annual_pay(prefix):
+    pay_period = Lower(
+        models.Func(
+            models.F(f"{prefix}pay_period"),
+            models.Value("[^A-Za-z]"),
+            models.Value(""),
+            models.Value("g"),
+            function="REGEXP_REPLACE",
+            output_field=models.CharField(),
+        )
+    )
+    factor = models.Case(
+        models.When(
+            models.Q(**{f"{prefix}pay_period__isnull": True})
+            | models.Q(**{f"{prefix}pay_period": ""}),
+            then=models.Value(12),
+        ),
+        *[
+            models.When(Exact(pay_period, models.Value(key)), then=models.Value(factor))
+            for key, factor in PAY_PERIOD_FACTORS.items()
+        ],
+        default=models.Value(0),
+    )
+    return models.F(f"{prefix}pay_rate") * factor
+
+
+def populate_department_stats(apps, schema_editor):
+    Department = apps.get_model("departments", "Department")
+    Employee = apps.get_model("employees", "Employee")
+    alias = schema_editor.connection.alias
+
+    rows = (
+        Employee.objects.using(alias)
+        .exclude(department=None)
+        .order_by()
+        .values("department_id")
+        .annotate(
+            headcount=Count("pk"),
+            manager_count=Count("pk", filter=Q(manager=True)),
+            payroll_total=Coalesce(
+                Sum(annual_pay("current_salary__")),
+                Value(0),
+                output_field=DecimalField(max_digits=14, decimal_places=2),
+            ),
+        )
+    )
+    for row in rows:
+        Department.objects.using(alias).filter(pk=row.pop("department_id")).update(
+            **row
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("departments", "0003_updated_at"),
+        ("employees", "0010_leavebalance"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="department",
+            name="headcount",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="department",
+            name="manager_count",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AddField(
+            model_name="department",
+            name="payroll_total",
+            field=models.DecimalField(
+                decimal_places=2,
+                default=0,
+                editable=False,
+                help_text="Annual cost of the current salaries, see departments.stats",
+                max_digits=14,
+            ),
+        ),
+        migrations.RunPython(populate_department_stats, migrations.RunPython.noop),
+    ]
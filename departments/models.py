@@ -2,6 +2,8 @@
 from django.conf import settings
 from django.db import models
 
+STAT_FIELDS = ("headcount", "manager_count", "payroll_total")
+
 
 class Department(models.Model):
     id = models.AutoField(primary_key=True)
@@ -14,6 +16,28 @@ class Department(models.Model):
         blank=True,
         related_name="employees",
     )
+    updated_at = models.DateTimeField(auto_now=True)
+    headcount = models.PositiveIntegerField(default=0, editable=False)
+    manager_count = models.PositiveIntegerField(default=0, editable=False)
+    payroll_total = models.DecimalField(
+        max_digits=14,
+        decimal_places=2,
+        default=0,
+        editable=False,
+        help_text="Annual cost of the current salaries, see departments.stats",
+    )
 
     def __str__(self):
         return self.name
+
+    def save(self, *args, **kwargs):
+        # The statistics are only written with queryset updates (see
+        # departments.stats), so saving a loaded department must not write
+        # back values that may have changed since it was read.
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name not in STAT_FIELDS
+            ]
+        super().save(*args, **kwargs)
@@ -1,14 +1,42 @@
 from rest_framework import serializers
 
+from employee_management_system.fieldsets import SparseFieldsetMixin
+
 from .models import Department
 
 
-class DepartmentSerializer(serializers.ModelSerializer):
+class DepartmentStatsSerializer(serializers.Serializer):
+    headcount = serializers.IntegerField()
+    manager_count = serializers.IntegerField()
+    payroll_total = serializers.DecimalField(max_digits=14, decimal_places=2)
+
+
+class DepartmentSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
+    """
+    ``stats`` is only included when the context sets ``include_stats``, which
+    ``DepartmentViewSet`` does for ``?stats=``; serializers nesting this one
+    never get it. The maintained counters are used unless the view put live
+    statistics for the object in ``department_stats``.
+    """
+
     manager = serializers.SerializerMethodField()
+    stats = serializers.SerializerMethodField()
 
     class Meta:
         model = Department
-        fields = ["id", "name", "manager", "description"]
+        fields = ["id", "name", "manager", "description", "stats"]
+        select_related = ["manager"]
+        expandable_fields = {"manager": "manager_id"}
+
+    def get_fields(self):
+        fields = super().get_fields()
+        if not self.context.get("include_stats"):
+            fields.pop("stats", None)
+        return fields
+
+    def get_stats(self, obj):
+        stats = self.context.get("department_stats") or {}
+        return DepartmentStatsSerializer(stats.get(obj.pk, obj)).data
 
     def get_manager(self, obj):
         if obj.manager:
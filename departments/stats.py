@@ -0,0 +1,190 @@
+from decimal import Decimal
+
+from django.db import transaction
+from django.db.models import Count, DecimalField, F, Q, Sum, Value
+from django.db.models.functions import Coalesce, Greatest
+
+from employee_management_system.response_cache import bump_version
+from employees.models import Employee
+from employees.payroll import annual_pay
+
+from .models import STAT_FIELDS, Department
+
+STATS_QUERY_PARAM = "stats"
+
+
+def get_stats_mode(request):
+    """
+    ``"counters"`` or ``"live"`` when the request asks for department
+    statistics with ``?stats=``, ``None`` otherwise.
+    """
+    if request is None:
+        return None
+    params = getattr(request, "query_params", request.GET)
+    value = (params.get(STATS_QUERY_PARAM) or "").lower()
+    if value in ("", "0", "false", "no"):
+        return None
+    return "live" if value == "live" else "counters"
+
+
+def empty_stats():
+    return {"headcount": 0, "manager_count": 0, "payroll_total": Decimal("0.00")}
+
+
+def live_department_stats(department_ids=None):
+    """
+    Statistics of the given departments (every department by default)
+    computed from their employees and current salaries in one grouped query.
+    """
+    employees = Employee.objects.exclude(department=None)
+    if department_ids is not None:
+        employees = employees.filter(department_id__in=department_ids)
+    rows = (
+        employees.order_by()
+        .values("department_id")
+        .annotate(
+            headcount=Count("pk"),
+            manager_count=Count("pk", filter=Q(manager=True)),
+            payroll_total=Coalesce(
+                Sum(annual_pay("current_salary__")),
+                Value(Decimal("0")),
+                output_field=DecimalField(max_digits=14, decimal_places=2),
+            ),
+        )
+    )
+    stats = {department_id: empty_stats() for department_id in department_ids or ()}
+    for row in rows:
+        stats[row.pop("department_id")] = row
+    return stats
+
+
+def payroll_shares(employees):
+    """
+    ``{employee_id: (department_id, annual pay of the current salary)}`` of
+    the given employees that count towards a department's ``payroll_total``.
+    """
+    rows = (
+        employees.exclude(department=None)
+        .exclude(current_salary=None)
+        .values_list("pk", "department_id", annual_pay("current_salary__"))
+    )
+    return {pk: (department_id, amount) for pk, department_id, amount in rows}
+
+
+def count_employee(changes, department_id, manager, sign=1):
+    """Add (or with ``sign=-1`` remove) one employee to ``changes``."""
+    if department_id is None:
+        return
+    changes.setdefault(department_id, empty_stats())
+    changes[department_id]["headcount"] += sign
+    if manager:
+        changes[department_id]["manager_count"] += sign
+
+
+def add_payroll(changes, shares, sign=1):
+    """
+    Add (or with ``sign=-1`` remove) ``(department_id, amount)`` pairs to the
+    ``payroll_total`` deltas of ``changes``.
+    """
+    for department_id, amount in shares:
+        if department_id is None:
+            continue
+        changes.setdefault(department_id, empty_stats())
+        changes[department_id]["payroll_total"] += sign * amount
+
+
+def apply_stat_changes(changes):
+    """
+    Add the per-department deltas of ``changes`` to the counters with
+    ``F()`` updates clamped at zero, in department order so concurrent
+    writers never deadlock. Drift left by the clamp is corrected by
+    ``reconcile_department_stats``.
+    """
+    updated = False
+    with transaction.atomic():
+        for department_id in sorted(changes):
+            deltas = {
+                field: delta for field, delta in changes[department_id].items() if delta
+            }
+            if deltas:
+                Department.objects.filter(pk=department_id).update(
+                    **{
+                        field: Greatest(
+                            F(field) + delta,
+                            Value(0),
+                            output_field=Department._meta.get_field(field),
+                        )
+                        for field, delta in deltas.items()
+                    }
+                )
+                updated = True
+    if updated:
+        bump_version(Department)
+
+
+def update_department_stats(previous=None, current=None, payroll=0):
+    """
+    Move an employee, and ``payroll``, the annual pay of their current
+    salary, from the ``(department_id, manager)`` of ``previous`` to that of
+    ``current``.
+    """
+    changes = {}
+    if previous is not None:
+        count_employee(changes, *previous, sign=-1)
+        add_payroll(changes, [(previous[0], payroll)], sign=-1)
+    if current is not None:
+        count_employee(changes, *current)
+        add_payroll(changes, [(current[0], payroll)])
+    apply_stat_changes(changes)
+
+
+def update_payroll_totals(previous, current):
+    """
+    Apply the difference between two ``payroll_shares`` snapshots of the
+    same employees, taken before and after their current salaries changed.
+    """
+    changes = {}
+    add_payroll(changes, previous.values(), sign=-1)
+    add_payroll(changes, current.values())
+    apply_stat_changes(changes)
+
+
+def count_new_employees(employees):
+    """
+    Add employees created with ``bulk_create``, which sends no signals, and
+    their current salaries to the counters of their departments.
+    """
+    changes = {}
+    for employee in employees:
+        count_employee(changes, employee.department_id, employee.manager)
+    shares = payroll_shares(
+        Employee.objects.filter(pk__in=[employee.pk for employee in employees])
+    )
+    add_payroll(changes, shares.values())
+    apply_stat_changes(changes)
+
+
+def reconcile_department_stats(department_ids=None):
+    """
+    Compare the counters of the given departments (every department by
+    default) with ``live_department_stats`` and fix the ones that drifted.
+    Returns the IDs of the fixed departments.
+    """
+    with transaction.atomic():
+        departments = Department.objects.select_for_update().order_by("pk")
+        if department_ids is not None:
+            departments = departments.filter(pk__in=department_ids)
+        departments = list(departments.only("pk", *STAT_FIELDS))
+        stats = live_department_stats([department.pk for department in departments])
+
+        drifted = []
+        for department in departments:
+            expected = stats[department.pk]
+            if any(getattr(department, f) != expected[f] for f in STAT_FIELDS):
+                for field in STAT_FIELDS:
+                    setattr(department, field, expected[field])
+                drifted.append(department)
+        Department.objects.bulk_update(drifted, STAT_FIELDS, batch_size=500)
+    if drifted:
+        bump_version(Department)
+    return [department.pk for department in drifted]
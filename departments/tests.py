@@ -1,3 +1,87 @@
+import datetime
+from decimal import Decimal
+
 from django.test import TestCase
 
-# Create your tests here.
+from authentication.models import User
+from employees.models import Employee, Salary
+
+from .models import STAT_FIELDS, Department
+from .stats import live_department_stats
+
+
+class DepartmentStatsTests(TestCase):
+    def setUp(self):
+        self.engineering = Department.objects.create(name="Engineering")
+        self.sales = Department.objects.create(name="Sales")
+        self.employee = self.create_employee("ada", self.engineering)
+        Salary.objects.create(
+            employee=self.employee,
+            pay_rate=1000,
+            pay_period="monthly",
+            start_date=datetime.date(2023, 1, 1),
+        )
+
+    def create_employee(self, username, department):
+        user = User.objects.create(username=username, email=f"{username}@example.com")
+        return Employee.objects.create(user=user, department=department)
+
+    def assertCountersMatchLiveStats(self):
+        departments = [self.engineering, self.sales]
+        live = live_department_stats([department.pk for department in departments])
+        for department in departments:
+            department.refresh_from_db()
+            for field in STAT_FIELDS:
+                self.assertEqual(getattr(department, field), live[department.pk][field])
+
+    def test_salary_changes_move_the_payroll_total(self):
+        self.engineering.refresh_from_db()
+        self.assertEqual(self.engineering.payroll_total, Decimal("12000.00"))
+
+        newer = Salary.objects.create(
+            employee=self.employee,
+            pay_rate=2000,
+            pay_period="monthly",
+            start_date=datetime.date(2024, 1, 1),
+        )
+        self.assertCountersMatchLiveStats()
+        self.assertEqual(self.engineering.payroll_total, Decimal("24000.00"))
+
+        newer.pay_period = "annual"
+        newer.save()
+        self.assertCountersMatchLiveStats()
+        self.assertEqual(self.engineering.payroll_total, Decimal("2000.00"))
+
+        newer.employee = self.create_employee("grace", self.sales)
+        newer.save()
+        self.assertCountersMatchLiveStats()
+        self.assertEqual(self.engineering.payroll_total, Decimal("12000.00"))
+        self.assertEqual(self.sales.payroll_total, Decimal("2000.00"))
+
+        newer.delete()
+        self.assertCountersMatchLiveStats()
+        self.assertEqual(self.sales.payroll_total, Decimal("0.00"))
+
+    def test_moving_and_deleting_employees(self):
+        self.employee.department = self.sales
+        self.employee.manager = True
+        self.employee.save()
+        self.assertCountersMatchLiveStats()
+        self.assertEqual(self.sales.manager_count, 1)
+        self.assertEqual(self.sales.payroll_total, Decimal("12000.00"))
+
+        self.employee.delete()
+        self.assertCountersMatchLiveStats()
+        self.assertEqual(self.sales.headcount, 0)
+        self.assertEqual(self.sales.payroll_total, Decimal("0.00"))
+
+    def test_decrements_stop_at_zero(self):
+        Department.objects.filter(pk=self.engineering.pk).update(
+            headcount=0, payroll_total=0
+        )
+
+        self.employee.delete()
+
+        self.engineering.refresh_from_db()
+        self.assertEqual(self.engineering.headcount, 0)
+        self.assertEqual(self.engineering.payroll_total, Decimal("0.00"))
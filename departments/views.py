@@ -2,20 +2,27 @@ from django.db.models import Q
 from rest_framework import status
 from rest_framework.viewsets import ModelViewSet
 
+from authentication.models import User
 from employee_management_system.CustomResponse import CustomResponse
 from employee_management_system.exceptions import custom_exception_handler
+from employee_management_system.metrics import SerializerTimingMixin
 from employee_management_system.pagination import CustomPageNumberPagination
+from employee_management_system.queries import optimize_queryset
+from employee_management_system.response_cache import cache_response
 from permissions.permissions import *
 
 from .models import Department
 from .serializers import DepartmentSerializer
+from .stats import get_stats_mode, live_department_stats
 
 
-class DepartmentViewSet(ModelViewSet):
+class DepartmentViewSet(SerializerTimingMixin, ModelViewSet):
     queryset = Department.objects.all()
     serializer_class = DepartmentSerializer
     permission_classes = [DynamicRolePermission]
+    query_budget = {"list": 3, "retrieve": 2}
     pagination_class = CustomPageNumberPagination
+    cursor_ordering = ("id",)
 
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -26,6 +33,7 @@ class DepartmentViewSet(ModelViewSet):
                 Q(name__icontains=search_query) | Q(description__icontains=search_query)
             )
 
+        queryset = optimize_queryset(queryset, self.get_serializer())
         return queryset.order_by("id")
 
     def list(self, request, *args, **kwargs):
@@ -40,15 +48,34 @@ class DepartmentViewSet(ModelViewSet):
         except Exception as e:
             return custom_exception_handler(e, None)
 
+    def get_serializer_context(self):
+        context = super().get_serializer_context()
+        context["include_stats"] = get_stats_mode(self.request) is not None
+        return context
+
+    def get_stats_context(self, departments):
+        """Serializer context, with live statistics when ``?stats=live``."""
+        context = self.get_serializer_context()
+        if get_stats_mode(self.request) == "live":
+            context["department_stats"] = live_department_stats(
+                [department.pk for department in departments]
+            )
+        return context
+
+    @cache_response(models=(Department, User))
     def list(self, request, *args, **kwargs):
         try:
             queryset = self.filter_queryset(self.get_queryset())
             page = self.paginate_queryset(queryset)
             if page is not None:
-                serializer = self.get_serializer(page, many=True)
+                serializer = self.get_serializer(
+                    page, many=True, context=self.get_stats_context(page)
+                )
                 return self.get_paginated_response(serializer.data)
 
-            serializer = self.get_serializer(queryset, many=True)
+            serializer = self.get_serializer(
+                queryset, many=True, context=self.get_stats_context(queryset)
+            )
             return CustomResponse(
                 status_code=status.HTTP_200_OK,
                 message="Departments fetched successfully",
@@ -70,10 +97,13 @@ class DepartmentViewSet(ModelViewSet):
         except Exception as e:
             return custom_exception_handler(e, None)
 
+    @cache_response(models=(Department, User))
     def retrieve(self, request, *args, **kwargs):
         try:
             instance = self.get_object()
-            serializer = self.get_serializer(instance)
+            serializer = self.get_serializer(
+                instance, context=self.get_stats_context([instance])
+            )
             return CustomResponse(
                 status_code=status.HTTP_200_OK,
                 message="Department retrieved successfully",
@@ -0,0 +1,257 @@
+import datetime
+import time
+
+from django.db import transaction
+from rest_framework.renderers import JSONRenderer
+from rest_framework.request import Request
+from rest_framework.test import APIRequestFactory
+
+from authentication.models import User
+from authentication.serializers import UserSerializer
+from departments.models import Department
+from departments.serializers import DepartmentSerializer
+from employees.models import CUSTOM_PERMISSIONS, Employee, Role, Salary
+from employees.serializers import EmployeeSerializer, RoleSerializer, SalarySerializer
+from employees.views import EmployeeViewSet, SalaryViewSet
+from permissions.permissions import DynamicRolePermission
+
+from .CustomResponse import CustomResponse
+from .latency import summarize
+from .pagination import CustomPageNumberPagination
+from .queries import optimize_queryset
+from .renderers import MessagePackRenderer, ORJSONRenderer, msgpack, orjson
+
+DEFAULT_SIZES = (1, 100, 10000)
+
+
+class Rollback(Exception):
+    pass
+
+
+class BenchmarkData:
+    """Rows created for one benchmark run, inside a transaction rolled back afterwards."""
+
+    def __init__(self, size):
+        self.size = size
+        self.role = Role.objects.create(
+            name="Benchmark", permissions=list(CUSTOM_PERMISSIONS.values())
+        )
+        self.departments = Department.objects.bulk_create(
+            [Department(name=f"Benchmark {index}") for index in range(size)]
+        )
+        self.users = User.objects.bulk_create(
+            [
+                User(
+                    username=f"benchmark{index}",
+                    email=f"benchmark{index}@example.com",
+                    first_name="Bench",
+                    last_name=str(index),
+                    password="!",
+                    role=self.role,
+                )
+                for index in range(size)
+            ]
+        )
+        self.employees = Employee.objects.bulk_create(
+            [
+                Employee(
+                    user=user,
+                    department=self.departments[index % len(self.departments)],
+                    hire_date=datetime.date(2020, 1, 1),
+                )
+                for index, user in enumerate(self.users)
+            ]
+        )
+        Salary.objects.bulk_create(
+            [
+                Salary(
+                    employee=employee,
+                    pay_rate=1000,
+                    pay_period="monthly",
+                    start_date=datetime.date(2021, 1, 1),
+                )
+                for employee in self.employees
+            ]
+        )
+        self.roles = Role.objects.bulk_create(
+            [
+                Role(name=f"Role {index}", permissions=["Can list all employees"])
+                for index in range(size)
+            ]
+        )
+
+
+def loaded(queryset, serializer_class, size):
+    """Fetch ``size`` rows with the relations ``serializer_class`` reads."""
+    return list(optimize_queryset(queryset, serializer_class())[:size])
+
+
+def serialize(serializer_class, queryset):
+    def run(data):
+        instances = loaded(queryset, serializer_class, data.size)
+        return lambda: serializer_class(instances, many=True).data
+
+    return run
+
+
+def validate(serializer_class, payload):
+    def run(data):
+        payloads = [payload(data, index) for index in range(data.size)]
+
+        def call():
+            serializer = serializer_class(data=payloads, many=True)
+            serializer.is_valid()
+            return serializer
+
+        return call
+
+    return run
+
+
+def user_payload(data, index):
+    return {
+        "username": f"new{index}",
+        "email": f"new{index}@example.com",
+        "first_name": "New",
+        "last_name": str(index),
+        "password": "Passw0rd!",
+    }
+
+
+def check_permissions(view_class, action, method):
+    def run(data):
+        user = data.users[0]
+        user.is_admin = False
+        user.employee_ids = frozenset([data.employees[0].pk])
+        view = view_class()
+        view.action = action
+        request = Request(getattr(APIRequestFactory(), method)("/"))
+        request.user = user
+        permission = DynamicRolePermission()
+        objects = data.employees
+
+        def call():
+            for obj in objects:
+                permission.has_permission(request, view)
+                permission.has_object_permission(request, view, obj)
+
+        return call
+
+    return run
+
+
+def paginate(query):
+    def run(data):
+        pagination = CustomPageNumberPagination()
+        view = EmployeeViewSet()
+        request = Request(
+            APIRequestFactory().get(
+                f"/employees/?{query(data)}", SERVER_NAME="localhost"
+            )
+        )
+        queryset = Employee.objects.order_by("id")
+
+        def call():
+            page = pagination.paginate_queryset(queryset, request, view)
+            return pagination.get_paginated_response([employee.pk for employee in page])
+
+        return call
+
+    return run
+
+
+def render(renderer_class):
+    def run(data):
+        instances = loaded(Salary.objects.order_by("id"), SalarySerializer, data.size)
+        envelope = CustomResponse(
+            status_code=200,
+            message="Salaries fetched successfully.",
+            data=SalarySerializer(instances, many=True).data,
+        ).data
+        renderer = renderer_class()
+        return lambda: renderer.render(envelope, renderer.media_type)
+
+    return run
+
+
+BENCHMARKS = {
+    "serialize.employee": serialize(
+        EmployeeSerializer, Employee.objects.order_by("id")
+    ),
+    "serialize.salary": serialize(SalarySerializer, Salary.objects.order_by("id")),
+    "serialize.department": serialize(
+        DepartmentSerializer, Department.objects.order_by("id")
+    ),
+    "serialize.role": serialize(RoleSerializer, Role.objects.order_by("id")),
+    "serialize.user": serialize(UserSerializer, User.objects.order_by("username")),
+    "validate.employee": validate(
+        EmployeeSerializer,
+        lambda data, index: {
+            "user": user_payload(data, index),
+            "department": data.departments[0].pk,
+            "hire_date": "2024-01-01",
+        },
+    ),
+    "validate.salary": validate(
+        SalarySerializer,
+        lambda data, index: {
+            "employee": data.employees[index % data.size].pk,
+            "pay_rate": "1500.00",
+            "pay_period": "monthly",
+            "start_date": "2024-01-01",
+        },
+    ),
+    "validate.department": validate(
+        DepartmentSerializer,
+        lambda data, index: {"name": f"Department {index}", "description": "x"},
+    ),
+    "validate.role": validate(
+        RoleSerializer,
+        lambda data, index: {
+            "name": f"Role {index}",
+            "permissions": ["employee_list", "Can view all departments"],
+        },
+    ),
+    "validate.user": validate(UserSerializer, user_payload),
+    "permission.employee_list": check_permissions(EmployeeViewSet, "list", "get"),
+    "permission.salary_update": check_permissions(SalaryViewSet, "update", "put"),
+    "pagination.page": paginate(
+        lambda data: f"page={max(1, data.size // 100)}&page_size=50&count=exact"
+    ),
+    "pagination.cursor": paginate(lambda data: "cursor=&page_size=50"),
+    "render.json": render(JSONRenderer),
+}
+if orjson is not None:
+    BENCHMARKS["render.orjson"] = render(ORJSONRenderer)
+if msgpack is not None:
+    BENCHMARKS["render.msgpack"] = render(MessagePackRenderer)
+
+
+def run_benchmarks(names=None, sizes=DEFAULT_SIZES, repeat=5, stdout=None):
+    """
+    Time every selected benchmark at every size and return
+    ``{"<name>[<size>]": summary}`` with latency figures in milliseconds.
+    """
+    results = {}
+    for size in sizes:
+        try:
+            with transaction.atomic():
+                data = BenchmarkData(size)
+                for name, benchmark in BENCHMARKS.items():
+                    if names and name not in names:
+                        continue
+                    call = benchmark(data)
+                    call()
+                    samples = []
+                    for _ in range(repeat):
+                        started = time.perf_counter()
+                        call()
+                        samples.append(time.perf_counter() - started)
+                    key = f"{name}[{size}]"
+                    results[key] = summarize(samples)
+                    if stdout:
+                        stdout.write(f"{key}: {results[key]['p50_ms']:.3f} ms")
+                raise Rollback
+        except Rollback:
+            pass
+    return results
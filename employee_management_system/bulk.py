@@ -0,0 +1,68 @@
+import io
+
+from django.core.management.color import no_style
+from django.db import connections
+
+COPY_ESCAPES = str.maketrans({"\\": "\\\\", "\t": "\\t", "\n": "\\n", "\r": "\\r"})
+
+
+def copy_value(value):
+    if value is None:
+        return "\\N"
+    if isinstance(value, bool):
+        return "t" if value else "f"
+    return str(value).translate(COPY_ESCAPES)
+
+
+def copy_instances(model, objs, using="default", batch_size=10000):
+    """
+    Insert unsaved ``objs`` with PostgreSQL ``COPY`` (``bulk_create`` on
+    other databases). Like ``bulk_create`` no signals are sent and ``save``
+    is not called; primary keys set on the instances are written as is.
+    Only scalar columns are supported; generated columns are skipped.
+    """
+    connection = connections[using]
+    if connection.vendor != "postgresql":
+        model.objects.using(using).bulk_create(objs, batch_size=batch_size)
+        return
+
+    fields = [
+        field
+        for field in model._meta.concrete_fields
+        if not field.generated
+        and not (field.primary_key and objs and getattr(objs[0], field.attname) is None)
+    ]
+    columns = ", ".join(connection.ops.quote_name(field.column) for field in fields)
+    table = connection.ops.quote_name(model._meta.db_table)
+
+    with connection.cursor() as cursor:
+        for start in range(0, len(objs), batch_size):
+            buffer = io.StringIO()
+            for obj in objs[start : start + batch_size]:
+                buffer.write(
+                    "\t".join(
+                        copy_value(
+                            field.get_db_prep_save(
+                                field.pre_save(obj, add=True), connection
+                            )
+                        )
+                        for field in fields
+                    )
+                )
+                buffer.write("\n")
+            sql = f"COPY {table} ({columns}) FROM STDIN"
+            if hasattr(cursor.cursor, "copy_expert"):
+                buffer.seek(0)
+                cursor.cursor.copy_expert(sql, buffer)
+            else:
+                with cursor.cursor.copy(sql) as copy:
+                    copy.write(buffer.getvalue())
+
+
+def reset_sequences(*models, using="default"):
+    """Move the primary key sequences of ``models`` past the largest ID."""
+    connection = connections[using]
+    statements = connection.ops.sequence_reset_sql(no_style(), models)
+    with connection.cursor() as cursor:
+        for statement in statements:
+            cursor.execute(statement)
@@ -0,0 +1,118 @@
+import hashlib
+from datetime import timezone
+
+from django.utils.cache import get_conditional_response, patch_vary_headers
+from django.utils.http import http_date, quote_etag
+
+
+class ConditionalGetMixin:
+    """
+    Answer ``If-None-Match``/``If-Modified-Since`` on ``list`` and
+    ``retrieve`` with 304 before anything is serialized.
+
+    ``conditional_timestamp_fields`` names every ``updated_at`` the rendered
+    payload depends on, following relations (``user__updated_at``). A single
+    object is validated from the instance already loaded by ``get_object``,
+    skipping relations a sparse fieldset left out; a list from the rows of
+    the page already fetched and the paginator's total and next/previous
+    flags, so no extra query runs. Validators are combined with the full
+    URL, the caller and the negotiated media type so each page, user and
+    representation gets its own ETag, and responses vary on ``Accept``.
+    Lists only honour ``If-None-Match``, because a Last-Modified date alone
+    cannot reveal deleted rows.
+    """
+
+    conditional_timestamp_fields = ("updated_at",)
+
+    def get_loaded_value(self, instance, attribute):
+        """Read ``attribute`` without loading deferred columns or relations."""
+        if attribute in instance.get_deferred_fields():
+            return None
+        field = instance._meta.get_field(attribute)
+        if field.is_relation and not field.is_cached(instance):
+            return None
+        return getattr(instance, attribute)
+
+    def get_object_timestamp(self, instance):
+        timestamps = []
+        for path in self.conditional_timestamp_fields:
+            value = instance
+            for attribute in path.split("__"):
+                value = self.get_loaded_value(value, attribute)
+                if value is None:
+                    break
+            if value is not None:
+                timestamps.append(value)
+        return max(timestamps, default=None)
+
+    def get_pagination_state(self):
+        paginator = self.paginator
+        return tuple(
+            getattr(paginator, name, None)
+            for name in ("total", "has_next", "has_previous")
+        )
+
+    def make_etag(self, request, *parts):
+        signature = repr(
+            (
+                request.get_full_path(),
+                str(request.user.pk),
+                getattr(request, "accepted_media_type", None),
+                *parts,
+            )
+        ).encode("utf-8")
+        return quote_etag(hashlib.sha1(signature).hexdigest())
+
+    def check_object_modified(self, request, instance):
+        """Return a 304 response if the client's copy of ``instance`` is current."""
+        last_modified = self.get_object_timestamp(instance)
+        self.conditional_headers = self.build_headers(
+            self.make_etag(request, instance.pk, last_modified), last_modified
+        )
+        return self.conditional_response(
+            request,
+            last_modified=(
+                int(last_modified.timestamp()) if last_modified is not None else None
+            ),
+        )
+
+    def check_list_modified(self, request, rows):
+        """
+        Return a 304 response if the client's copy of the list page made of
+        ``rows`` (already fetched, not yet serialized) is current.
+        """
+        rows = [(row.pk, self.get_object_timestamp(row)) for row in rows]
+        last_modified = max(
+            (timestamp for _, timestamp in rows if timestamp is not None), default=None
+        )
+        self.conditional_headers = self.build_headers(
+            self.make_etag(request, self.get_pagination_state(), rows), last_modified
+        )
+        return self.conditional_response(request)
+
+    def build_headers(self, etag, last_modified):
+        headers = {"ETag": etag}
+        if last_modified is not None:
+            headers["Last-Modified"] = http_date(
+                last_modified.astimezone(timezone.utc).timestamp()
+            )
+        return headers
+
+    def conditional_response(self, request, last_modified=None):
+        response = get_conditional_response(
+            request, etag=self.conditional_headers["ETag"], last_modified=last_modified
+        )
+        if response is not None:
+            for header, value in self.conditional_headers.items():
+                response[header] = value
+            patch_vary_headers(response, ("Accept",))
+        return response
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        response = super().finalize_response(request, response, *args, **kwargs)
+        headers = getattr(self, "conditional_headers", None)
+        if headers and response.status_code == 200:
+            for header, value in headers.items():
+                response[header] = value
+            patch_vary_headers(response, ("Accept",))
+        return response
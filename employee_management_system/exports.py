@@ -0,0 +1,117 @@
+import csv
+import json
+
+from django.core.serializers.json import DjangoJSONEncoder
+from django.http import StreamingHttpResponse
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.response import Response
+
+from employee_management_system.exceptions import custom_exception_handler
+
+
+class NDJSONRenderer(BaseRenderer):
+    media_type = "application/x-ndjson"
+    format = "ndjson"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        return json.dumps(data, cls=DjangoJSONEncoder) + "\n"
+
+
+class CSVRenderer(BaseRenderer):
+    media_type = "text/csv"
+    format = "csv"
+    charset = "utf-8"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        """
+        Render an object, or a list of them, as CSV rows under a header of
+        every key seen; nested values are written as their ``str()``.
+        """
+        if not data:
+            return ""
+        rows = data if isinstance(data, list) else [data]
+        columns = list(dict.fromkeys(key for row in rows for key in row))
+        values = ([row.get(column) for column in columns] for row in rows)
+        return "".join(stream_csv(columns, values, chunk_size=len(rows)))
+
+
+class Echo:
+    """File-like object handing back whatever ``csv.writer`` writes to it."""
+
+    def write(self, value):
+        return value
+
+
+def stream_ndjson(columns, rows, chunk_size):
+    encoder = DjangoJSONEncoder()
+    chunk = []
+    for row in rows:
+        chunk.append(encoder.encode(dict(zip(columns, row))))
+        if len(chunk) >= chunk_size:
+            yield "\n".join(chunk) + "\n"
+            chunk = []
+    if chunk:
+        yield "\n".join(chunk) + "\n"
+
+
+def stream_csv(columns, rows, chunk_size):
+    writer = csv.writer(Echo())
+    yield writer.writerow(columns)
+    chunk = []
+    for row in rows:
+        chunk.append(writer.writerow(row))
+        if len(chunk) >= chunk_size:
+            yield "".join(chunk)
+            chunk = []
+    if chunk:
+        yield "".join(chunk)
+
+
+class ExportMixin:
+    """
+    Adds an ``export`` action streaming every row of the view's filtered
+    queryset as NDJSON or CSV, chosen with ``?format=`` or the Accept header.
+
+    Rows are read as flat ``values_list`` tuples through a server-side cursor
+    in ``export_chunk_size`` batches, so memory stays flat however many rows
+    are exported. Views declare the columns as ``(name, lookup)`` pairs in
+    ``export_fields``.
+    """
+
+    export_fields = ()
+    export_filename = "export"
+    export_chunk_size = 2000
+    export_renderer_classes = [NDJSONRenderer, CSVRenderer]
+
+    def get_renderers(self):
+        if self.action == "export":
+            return [renderer() for renderer in self.export_renderer_classes]
+        return super().get_renderers()
+
+    def finalize_response(self, request, response, *args, **kwargs):
+        if self.action == "export" and isinstance(response, Response):
+            request.accepted_renderer = JSONRenderer()
+            request.accepted_media_type = JSONRenderer.media_type
+        return super().finalize_response(request, response, *args, **kwargs)
+
+    def export(self, request, *args, **kwargs):
+        try:
+            queryset = self.filter_queryset(self.get_queryset())
+            columns = [name for name, _ in self.export_fields]
+            rows = queryset.values_list(
+                *[lookup for _, lookup in self.export_fields]
+            ).iterator(chunk_size=self.export_chunk_size)
+
+            renderer = request.accepted_renderer
+            stream = stream_csv if renderer.format == "csv" else stream_ndjson
+            response = StreamingHttpResponse(
+                stream(columns, rows, self.export_chunk_size),
+                content_type=f"{renderer.media_type}; charset={renderer.charset}",
+            )
+            response["Content-Disposition"] = (
+                f'attachment; filename="{self.export_filename}.{renderer.format}"'
+            )
+            return response
+        except Exception as e:
+            return custom_exception_handler(e, None)
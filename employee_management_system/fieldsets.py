@@ -0,0 +1,94 @@
+from rest_framework import serializers
+from rest_framework.permissions import SAFE_METHODS
+
+
+def parse_paths(value):
+    """Split ``a,b.c`` into a set of dotted field paths."""
+    return {path.strip() for path in value.split(",") if path.strip()}
+
+
+class SparseFieldsetMixin:
+    """
+    Let read requests trim a serializer with ``?fields=`` and pick the
+    relations to nest with ``?expand=``.
+
+    ``fields`` keeps only the listed fields, with dotted paths reaching into
+    nested serializers (``fields=id,employee.user.username``). Once ``expand``
+    is given, relations named in ``Meta.expandable_fields`` collapse to the
+    column mapped there unless their path is listed (``expand=employee.user``
+    nests ``employee`` and its ``user``). Without either parameter the output
+    is unchanged. ``optimize_queryset`` reads the resulting fields, so joins
+    and columns are pruned to match.
+    """
+
+    fields_query_param = "fields"
+    expand_query_param = "expand"
+
+    @property
+    def field_path(self):
+        path, node = [], self
+        while node.parent is not None:
+            if node.field_name:
+                path.append(node.field_name)
+            node = node.parent
+        return ".".join(reversed(path))
+
+    def get_fieldset_params(self):
+        request = self.context.get("request")
+        if request is None or request.method not in SAFE_METHODS:
+            return None, None
+        params = getattr(request, "query_params", request.GET)
+        selected = params.get(self.fields_query_param)
+        expand = params.get(self.expand_query_param)
+        return (
+            parse_paths(selected) if selected is not None else None,
+            parse_paths(expand) if expand is not None else None,
+        )
+
+    @property
+    def sparse(self):
+        return self.get_fieldset_params() != (None, None)
+
+    def is_expanded(self, name):
+        _, expand = self.get_fieldset_params()
+        if expand is None:
+            return True
+        path = f"{self.field_path}.{name}".lstrip(".")
+        return any(
+            candidate == path or candidate.startswith(f"{path}.")
+            for candidate in expand
+        )
+
+    def get_selected_names(self, selected):
+        path = self.field_path
+        if selected is None or path in selected:
+            return None
+        prefix = f"{path}." if path else ""
+        names = {
+            candidate[len(prefix) :].split(".")[0]
+            for candidate in selected
+            if candidate.startswith(prefix)
+        }
+        return names or None
+
+    def get_fields(self):
+        fields = super().get_fields()
+        selected, _ = self.get_fieldset_params()
+
+        names = self.get_selected_names(selected)
+        if names is not None:
+            fields = {name: field for name, field in fields.items() if name in names}
+
+        for name, source in getattr(self.Meta, "expandable_fields", {}).items():
+            if name in fields and not self.is_expanded(name):
+                fields[name] = serializers.ReadOnlyField(source=source)
+        return fields
+
+    def get_select_related(self):
+        """``Meta.select_related`` without paths through collapsed or dropped fields."""
+        return [
+            path
+            for path in getattr(self.Meta, "select_related", ())
+            if path.split("__")[0] in self.fields
+            and self.is_expanded(path.split("__")[0])
+        ]
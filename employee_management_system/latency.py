@@ -0,0 +1,28 @@
+import math
+
+
+def percentile(sorted_samples, fraction):
+    """Nearest-rank percentile of an already sorted list."""
+    if not sorted_samples:
+        return None
+    rank = max(1, math.ceil(fraction * len(sorted_samples)))
+    return sorted_samples[rank - 1]
+
+
+def summarize(samples, elapsed=None):
+    """Summarize latency samples (seconds) as milliseconds, plus throughput."""
+    samples = sorted(samples)
+    summary = {
+        "count": len(samples),
+        "mean_ms": (sum(samples) / len(samples)) * 1000 if samples else None,
+        "p50_ms": None,
+        "p95_ms": None,
+        "p99_ms": None,
+        "max_ms": samples[-1] * 1000 if samples else None,
+    }
+    for name, fraction in (("p50_ms", 0.50), ("p95_ms", 0.95), ("p99_ms", 0.99)):
+        value = percentile(samples, fraction)
+        summary[name] = value * 1000 if value is not None else None
+    if elapsed:
+        summary["throughput_per_s"] = len(samples) / elapsed
+    return summary
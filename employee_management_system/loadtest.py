@@ -0,0 +1,212 @@
+import http.client
+import json
+import random
+import threading
+import time
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
+from urllib.parse import urlsplit
+
+from django.urls import URLPattern, URLResolver, get_resolver
+
+from .latency import summarize
+
+LOAD_TEST_URLCONFS = ("authentication.urls", "employees.urls", "departments.urls")
+
+
+class Route:
+    def __init__(self, name, method, path, sample_ids=None, body=None):
+        self.name = name
+        self.method = method
+        self.path = path
+        self.sample_ids = sample_ids
+        self.body = body
+
+    def build_path(self, rng):
+        path = self.path
+        if self.sample_ids is not None:
+            path = path.replace("{pk}", str(rng.choice(self.sample_ids)))
+        return path
+
+
+def iter_patterns(patterns, prefix=""):
+    for pattern in patterns:
+        if isinstance(pattern, URLResolver):
+            urlconf = getattr(pattern.urlconf_module, "__name__", "")
+            if urlconf in LOAD_TEST_URLCONFS or prefix:
+                yield from iter_patterns(
+                    pattern.url_patterns, prefix + str(pattern.pattern)
+                )
+        elif isinstance(pattern, URLPattern) and prefix:
+            yield prefix + str(pattern.pattern), pattern
+
+
+def discover_routes(username, password, page_size=20, samples=100):
+    """
+    Build the GET routes of every API URL, plus the login POST.
+
+    Detail routes pick a random existing primary key per request and list
+    routes of paginated views ask for ``page_size`` rows. Write routes other
+    than login are listed as skipped so they show up in the report.
+    """
+    routes, skipped = [], []
+    for path, pattern in iter_patterns(get_resolver().url_patterns):
+        view_class = getattr(pattern.callback, "cls", None)
+        actions = getattr(pattern.callback, "actions", None)
+        name = pattern.name or path
+        methods = (
+            set(actions)
+            if actions
+            else {
+                method
+                for method in view_class.http_method_names
+                if hasattr(view_class, method) and method != "options"
+            }
+        )
+
+        if name == "login":
+            routes.append(
+                Route(
+                    name,
+                    "POST",
+                    f"/{path}",
+                    body={"email_or_username": username, "password": password},
+                )
+            )
+            continue
+        if "get" not in methods:
+            skipped.extend(f"{method.upper()} /{path}" for method in sorted(methods))
+            continue
+        skipped.extend(
+            f"{method.upper()} /{path}" for method in sorted(methods - {"get"})
+        )
+
+        converter = next(iter(pattern.pattern.converters), None)
+        if converter:
+            model = view_class.queryset.model
+            sample_ids = list(
+                model.objects.order_by("?").values_list("pk", flat=True)[:samples]
+            )
+            if not sample_ids:
+                skipped.append(f"GET /{path} (no rows)")
+                continue
+            route_path = "/" + path.split("<")[0] + "{pk}/"
+            routes.append(Route(name, "GET", route_path, sample_ids=sample_ids))
+            continue
+
+        route_path = f"/{path}"
+        if (
+            getattr(view_class, "pagination_class", None)
+            and (actions or {}).get("get") == "list"
+        ):
+            route_path += f"?page_size={page_size}"
+        routes.append(Route(name, "GET", route_path))
+    return routes, skipped
+
+
+class LoadTest:
+    """
+    Drive concurrent authenticated HTTP clients against ``routes`` and
+    summarize latency per route. Each worker thread keeps one keep-alive
+    connection.
+    """
+
+    def __init__(self, base_url, token, concurrency=16, timeout=30, seed=0):
+        url = urlsplit(base_url)
+        self.scheme, self.netloc = url.scheme, url.netloc
+        self.token = token
+        self.concurrency = concurrency
+        self.timeout = timeout
+        self.rng = random.Random(seed)
+        self.local = threading.local()
+
+    def connection(self):
+        connection = getattr(self.local, "connection", None)
+        if connection is None:
+            connection_class = (
+                http.client.HTTPSConnection
+                if self.scheme == "https"
+                else http.client.HTTPConnection
+            )
+            connection = connection_class(self.netloc, timeout=self.timeout)
+            self.local.connection = connection
+        return connection
+
+    def request(self, route, path):
+        headers = {"Accept": "*/*"}
+        if self.token and route.body is None:
+            headers["Authorization"] = f"Token {self.token}"
+        body = None
+        if route.body is not None:
+            body = json.dumps(route.body)
+            headers["Content-Type"] = "application/json"
+
+        started = time.perf_counter()
+        try:
+            connection = self.connection()
+            connection.request(route.method, path, body=body, headers=headers)
+            response = connection.getresponse()
+            response.read()
+            status = response.status
+        except (OSError, http.client.HTTPException):
+            self.local.connection = None
+            status = None
+        return time.perf_counter() - started, status
+
+    def run(self, routes, requests_per_route):
+        plan = [
+            (route, route.build_path(self.rng))
+            for route in routes
+            for _ in range(requests_per_route)
+        ]
+        self.rng.shuffle(plan)
+
+        samples = defaultdict(list)
+        errors = defaultdict(int)
+
+        def call(item):
+            route, path = item
+            latency, status = self.request(route, path)
+            samples[route.name].append(latency)
+            if status is None or status >= 400:
+                errors[route.name] += 1
+
+        started = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=self.concurrency) as executor:
+            list(executor.map(call, plan))
+        elapsed = time.perf_counter() - started
+
+        report = {"elapsed_s": elapsed, "throughput_per_s": len(plan) / elapsed}
+        report["routes"] = {
+            route.name: {
+                "method": route.method,
+                "path": route.path,
+                "errors": errors[route.name],
+                **summarize(samples[route.name], elapsed),
+            }
+            for route in routes
+        }
+        return report
+
+
+def login(base_url, username, password, timeout=30):
+    """Log in over HTTP and return the API token."""
+    url = urlsplit(base_url)
+    connection_class = (
+        http.client.HTTPSConnection
+        if url.scheme == "https"
+        else http.client.HTTPConnection
+    )
+    connection = connection_class(url.netloc, timeout=timeout)
+    connection.request(
+        "POST",
+        "/auth/login/",
+        body=json.dumps({"email_or_username": username, "password": password}),
+        headers={"Content-Type": "application/json"},
+    )
+    response = connection.getresponse()
+    payload = json.loads(response.read() or b"{}")
+    connection.close()
+    if response.status != 200:
+        raise ValueError(payload.get("message") or f"HTTP {response.status}")
+    return payload["data"]["token"]
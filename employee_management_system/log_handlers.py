@@ -0,0 +1,74 @@
+import atexit
+import copy
+import json
+import logging
+import queue
+from datetime import datetime, timezone
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+RESERVED_ATTRS = set(vars(logging.makeLogRecord({}))) | {"message", "asctime"}
+
+
+class JSONFormatter(logging.Formatter):
+    """Format records as compact single-line JSON objects."""
+
+    def format(self, record):
+        entry = {
+            "time": datetime.fromtimestamp(record.created, timezone.utc).isoformat(),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        for key, value in vars(record).items():
+            if key not in RESERVED_ATTRS and not key.startswith("_"):
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, separators=(",", ":"), default=str)
+
+
+class QueuedRotatingFileHandler(QueueHandler):
+    """
+    Hand records to a background thread that writes them to a rotating file.
+
+    The calling thread only resolves the message and puts the record on a
+    bounded queue; formatting and disk I/O happen in the listener thread.
+    When the queue is full the record is dropped and counted rather than
+    blocking the request.
+    """
+
+    def __init__(
+        self, filename, maxBytes=10485760, backupCount=5, queueSize=10000, **kwargs
+    ):
+        super().__init__(queue.Queue(maxsize=queueSize))
+        self.file_handler = RotatingFileHandler(
+            filename, maxBytes=maxBytes, backupCount=backupCount, **kwargs
+        )
+        self.dropped = 0
+        self.listener = QueueListener(
+            self.queue, self.file_handler, respect_handler_level=True
+        )
+        self.listener.start()
+        atexit.register(self.close)
+
+    def setFormatter(self, fmt):
+        self.file_handler.setFormatter(fmt)
+
+    def prepare(self, record):
+        record = copy.copy(record)
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self):
+        if self.listener is not None:
+            self.listener.stop()
+            self.listener = None
+            self.file_handler.close()
+        super().close()
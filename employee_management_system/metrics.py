@@ -0,0 +1,238 @@
+import atexit
+import contextvars
+import functools
+import glob
+import json
+import os
+import threading
+import time
+
+from django.conf import settings
+from django.http import HttpResponse, HttpResponseForbidden
+
+DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200, 500)
+
+HISTOGRAMS = {
+    "http_request_duration_seconds": (
+        "Wall time spent handling the request.",
+        DURATION_BUCKETS,
+    ),
+    "http_request_db_queries": (
+        "Database queries issued by the request.",
+        QUERY_COUNT_BUCKETS,
+    ),
+    "http_request_db_duration_seconds": (
+        "Time spent waiting on the database.",
+        DURATION_BUCKETS,
+    ),
+    "http_request_serializer_duration_seconds": (
+        "Time spent rendering serializer data.",
+        DURATION_BUCKETS,
+    ),
+}
+
+current_request = contextvars.ContextVar("metrics_current_request", default=None)
+
+
+class MetricsRegistry:
+    """
+    In-process histograms keyed by metric name and label values.
+
+    With ``METRICS_DIR`` set, every worker process periodically writes its
+    histograms to ``<METRICS_DIR>/<pid>.json`` from a background thread and
+    ``/metrics`` sums the snapshots of all processes, so any worker can answer
+    a scrape for the whole server. Snapshots of exited processes, or not
+    rewritten for ``max_age`` seconds, are deleted instead of merged.
+    """
+
+    def __init__(self, directory=None, flush_interval=5, max_age=60):
+        self.directory = directory
+        self.flush_interval = flush_interval
+        self.max_age = max_age
+        self.histograms = {}
+        self.lock = threading.Lock()
+        self.thread = None
+
+    def observe(self, name, labels, value):
+        buckets = HISTOGRAMS[name][1]
+        key = (name, tuple(sorted(labels.items())))
+        with self.lock:
+            histogram = self.histograms.get(key)
+            if histogram is None:
+                histogram = self.histograms[key] = [[0] * len(buckets), 0.0, 0]
+            for index, bound in enumerate(buckets):
+                if value <= bound:
+                    histogram[0][index] += 1
+            histogram[1] += value
+            histogram[2] += 1
+            if self.directory and self.thread is None:
+                self.start()
+
+    def start(self):
+        os.makedirs(self.directory, exist_ok=True)
+        self.thread = threading.Thread(
+            target=self.run, name="metrics-writer", daemon=True
+        )
+        self.thread.start()
+        atexit.register(self.remove)
+
+    def run(self):
+        while True:
+            time.sleep(self.flush_interval)
+            self.flush()
+
+    def snapshot(self):
+        with self.lock:
+            return [
+                [name, labels, counts[:], total, count]
+                for (name, labels), (counts, total, count) in self.histograms.items()
+            ]
+
+    def flush(self):
+        path = os.path.join(self.directory, f"{os.getpid()}.json")
+        with open(f"{path}.tmp", "w") as snapshot_file:
+            json.dump(self.snapshot(), snapshot_file)
+        os.replace(f"{path}.tmp", path)
+
+    def remove(self, path=None):
+        path = path or os.path.join(self.directory, f"{os.getpid()}.json")
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def is_stale(self, path):
+        """
+        Whether the snapshot at ``path`` belongs to an exited process or has
+        not been rewritten for ``max_age`` seconds.
+        """
+        try:
+            os.kill(int(os.path.basename(path)[: -len(".json")]), 0)
+        except ProcessLookupError:
+            return True
+        except (ValueError, OSError):
+            pass
+        try:
+            return time.time() - os.path.getmtime(path) > self.max_age
+        except OSError:
+            return True
+
+    def collect(self):
+        """Merge this process's histograms with every other process's snapshot."""
+        snapshots = [self.snapshot()]
+        if self.directory:
+            own = os.path.join(self.directory, f"{os.getpid()}.json")
+            for path in glob.glob(os.path.join(self.directory, "*.json")):
+                if path == own:
+                    continue
+                if self.is_stale(path):
+                    self.remove(path)
+                    continue
+                try:
+                    with open(path) as snapshot_file:
+                        snapshots.append(json.load(snapshot_file))
+                except (OSError, ValueError):
+                    continue
+
+        merged = {}
+        for snapshot in snapshots:
+            for name, labels, counts, total, count in snapshot:
+                key = (name, tuple(tuple(label) for label in labels))
+                histogram = merged.setdefault(key, [[0] * len(counts), 0.0, 0])
+                histogram[0] = [a + b for a, b in zip(histogram[0], counts)]
+                histogram[1] += total
+                histogram[2] += count
+        return merged
+
+
+registry = MetricsRegistry(
+    directory=getattr(settings, "METRICS_DIR", None),
+    flush_interval=getattr(settings, "METRICS_FLUSH_INTERVAL", 5),
+    max_age=getattr(settings, "METRICS_SNAPSHOT_MAX_AGE", 60),
+)
+
+
+def format_labels(labels, **extra):
+    pairs = [*labels, *extra.items()]
+    escaped = [
+        (name, str(value).replace("\\", "\\\\").replace('"', '\\"'))
+        for name, value in pairs
+    ]
+    return "{" + ",".join(f'{name}="{value}"' for name, value in escaped) + "}"
+
+
+def render_metrics():
+    """Render every histogram, plus token cache counters, as Prometheus text."""
+    from authentication.token_cache import token_cache
+
+    merged = registry.collect()
+    lines = []
+    for name, (help_text, buckets) in HISTOGRAMS.items():
+        lines.append(f"# HELP {name} {help_text}")
+        lines.append(f"# TYPE {name} histogram")
+        for (metric, labels), (counts, total, count) in sorted(merged.items()):
+            if metric != name:
+                continue
+            for bound, bucket_count in zip(buckets, counts):
+                lines.append(
+                    f"{name}_bucket{format_labels(labels, le=bound)} {bucket_count}"
+                )
+            lines.append(f"{name}_bucket{format_labels(labels, le='+Inf')} {count}")
+            lines.append(f"{name}_sum{format_labels(labels)} {total}")
+            lines.append(f"{name}_count{format_labels(labels)} {count}")
+
+    for stat, value in token_cache.stats().items():
+        name = f"token_cache_{stat}"
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name}{format_labels((('pid', os.getpid()),))} {value}")
+    return "\n".join(lines) + "\n"
+
+
+def metrics_view(request):
+    """
+    Serve the metrics to the addresses in ``METRICS_ALLOWED_IPS`` (loopback
+    only by default); ``"*"`` opens the endpoint to everyone.
+    """
+    allowed_ips = getattr(settings, "METRICS_ALLOWED_IPS", ("127.0.0.1", "::1")) or ()
+    if "*" not in allowed_ips and request.META.get("REMOTE_ADDR") not in allowed_ips:
+        return HttpResponseForbidden()
+    return HttpResponse(
+        render_metrics(), content_type="text/plain; version=0.0.4; charset=utf-8"
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def timed_serializer_class(serializer_class):
+    """
+    Subclass of ``serializer_class`` timing ``to_representation`` towards the
+    request being measured; ``many=True`` lists time each of their items.
+    """
+
+    class TimedSerializer(serializer_class):
+        def to_representation(self, instance):
+            measured = current_request.get()
+            if measured is None or measured["serializer_depth"]:
+                return super().to_representation(instance)
+            measured["serializer_depth"] += 1
+            started = time.perf_counter()
+            try:
+                return super().to_representation(instance)
+            finally:
+                measured["serializer_time"] += time.perf_counter() - started
+                measured["serializer_depth"] -= 1
+
+    TimedSerializer.__name__ = serializer_class.__name__
+    TimedSerializer.__qualname__ = serializer_class.__qualname__
+    TimedSerializer.__module__ = serializer_class.__module__
+    return TimedSerializer
+
+
+class SerializerTimingMixin:
+    """
+    Report the time a view spends rendering serializer data to
+    ``MetricsMiddleware``.
+    """
+
+    def get_serializer_class(self):
+        return timed_serializer_class(super().get_serializer_class())
@@ -1,71 +1,111 @@
 import json
 import logging
+import random
+import time
 
-logger = logging.getLogger("custom_logger")
-
-
-class CustomLoggingMiddleware:
-    def __init__(self, get_response):
-        self.get_response = get_response
+from django.conf import settings
+from django.core.exceptions import MiddlewareNotUsed
+from django.db import connection
 
-    def __call__(self, request):
-        request_body = request.body
-        request._body = request_body
-        self.log_request(request)
-        response = self.get_response(request)
-        self.log_response(response)
+from .metrics import current_request, registry
+from .query_inspection import QueryBudgetExceeded, QueryInspector, get_query_budget
 
-        return response
+logger = logging.getLogger("custom_logger")
 
-    def log_request(self, request):
-        method = request.method
-        path = request.path
-        ip = self.get_client_ip(request)
 
-        if method in ["POST", "PUT"]:
-            body = self.get_request_body(request)
+def get_view_name(request):
+    """Name the resolved view as ``ViewClass.action``, e.g. ``EmployeeViewSet.list``."""
+    match = getattr(request, "resolver_match", None)
+    if match is None:
+        return "unresolved"
+    view_class = getattr(match.func, "cls", None)
+    if view_class is None:
+        return match.view_name or match.func.__name__
+    method = request.method.lower()
+    actions = getattr(match.func, "actions", None) or {}
+    return f"{view_class.__name__}.{actions.get(method, method)}"
 
-            if body:
-                body_data = (
-                    json.dumps(body, indent=2) if isinstance(body, dict) else body
-                )
-                body_log = f", Body: {body_data}"
-            else:
-                body_log = ""
 
-            logger.info(f"Incoming Request: {method} {path}, IP: {ip}{body_log}")
-        else:
-            logger.info(f"Incoming Request: {method} {path}, IP: {ip}")
+class CustomLoggingMiddleware:
+    """
+    Log one structured record per request once the response is ready.
 
-    def log_response(self, response):
-        status_code = response.status_code
-        content_type = response.get("Content-Type", "")
+    The request body is never read here: for write requests a sample of the
+    data DRF already parsed is attached, with sensitive fields masked and the
+    serialized form capped at ``LOG_BODY_MAX_LENGTH`` characters.
+    """
 
-        if status_code >= 400:
-            logger.error(
-                f"Response Status: {status_code}, Content-Type: {content_type}"
-            )
-        else:
-            logger.info(f"Response Status: {status_code}, Content-Type: {content_type}")
+    body_methods = {"POST", "PUT", "PATCH"}
 
-    def get_request_body(self, request):
-        """Return request body based on content type."""
-        try:
-            request_body = getattr(request, "_body", None)
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.body_max_length = getattr(settings, "LOG_BODY_MAX_LENGTH", 2048)
+        self.body_sample_rate = getattr(settings, "LOG_BODY_SAMPLE_RATE", 0.1)
+        self.redacted_fields = set(
+            getattr(settings, "LOG_REDACTED_FIELDS", ("password", "token"))
+        )
 
-            if request.content_type == "application/json" and request_body:
-                return json.loads(request_body.decode("utf-8"))
+    def __call__(self, request):
+        started = time.perf_counter()
+        response = self.get_response(request)
+        self.log(request, response, time.perf_counter() - started)
+        return response
 
-            elif (
-                request.content_type == "application/x-www-form-urlencoded"
-                and request_body
-            ):
-                return request.POST.dict()
+    def log(self, request, response, duration):
+        data = {
+            "method": request.method,
+            "path": request.path,
+            "status": response.status_code,
+            "duration_ms": round(duration * 1000, 2),
+            "ip": self.get_client_ip(request),
+            "content_type": response.get("Content-Type", ""),
+        }
+        user = getattr(request, "user", None)
+        if user is not None and user.is_authenticated:
+            data["user_id"] = str(user.pk)
+
+        if request.method in self.body_methods:
+            body = self.get_request_body(response)
+            if body is not None:
+                data["body"] = body
+
+        level = logging.ERROR if response.status_code >= 400 else logging.INFO
+        logger.log(
+            level,
+            f"{request.method} {request.path} {response.status_code}",
+            extra=data,
+        )
+
+    def get_request_body(self, response):
+        """Return a capped, redacted copy of the data DRF parsed, if sampled."""
+        if random.random() >= self.body_sample_rate:
+            return None
 
+        renderer_context = getattr(response, "renderer_context", None) or {}
+        request = renderer_context.get("request")
+        body = getattr(request, "_full_data", None)
+        if not body:
             return None
-        except Exception as e:
-            logger.error(f"Error parsing body: {e}")
+
+        if hasattr(body, "dict"):
+            body = body.dict()
+        if not isinstance(body, (dict, list)):
             return None
+        body = json.dumps(self.redact(body), separators=(",", ":"), default=str)
+        if len(body) > self.body_max_length:
+            body = body[: self.body_max_length] + "...(truncated)"
+        return body
+
+    def redact(self, value):
+        """Mask sensitive fields at any depth of nested dicts and lists."""
+        if isinstance(value, dict):
+            return {
+                key: "***" if key in self.redacted_fields else self.redact(item)
+                for key, item in value.items()
+            }
+        if isinstance(value, (list, tuple)):
+            return [self.redact(item) for item in value]
+        return value
 
     def get_client_ip(self, request):
         """Get the IP address of the client making the request."""
@@ -75,3 +115,132 @@ class CustomLoggingMiddleware:
         else:
             ip = request.META.get("REMOTE_ADDR")
         return ip
+
+
+class QueryCounter:
+    """Database execute wrapper that counts the statements it sees."""
+
+    def __init__(self):
+        self.count = 0
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        return execute(sql, params, many, context)
+
+
+class QueryCountMiddleware:
+    """Report the number of database queries issued by a request in a header."""
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+        self.header_name = getattr(settings, "QUERY_COUNT_HEADER", "X-Query-Count")
+
+    def __call__(self, request):
+        counter = QueryCounter()
+        with connection.execute_wrapper(counter):
+            response = self.get_response(request)
+
+        response[self.header_name] = str(counter.count)
+        return response
+
+
+class QueryTimer(QueryCounter):
+    """Database execute wrapper that counts and times the statements it sees."""
+
+    def __init__(self):
+        super().__init__()
+        self.duration = 0.0
+
+    def __call__(self, execute, sql, params, many, context):
+        started = time.perf_counter()
+        try:
+            return super().__call__(execute, sql, params, many, context)
+        finally:
+            self.duration += time.perf_counter() - started
+
+
+class MetricsMiddleware:
+    """
+    Record wall time, query count, DB time and serializer time per resolved
+    view action and response status into the metrics registry.
+    """
+
+    def __init__(self, get_response):
+        self.get_response = get_response
+
+    def __call__(self, request):
+        measured = {"serializer_time": 0.0, "serializer_depth": 0}
+        context_token = current_request.set(measured)
+        timer = QueryTimer()
+        started = time.perf_counter()
+        try:
+            with connection.execute_wrapper(timer):
+                response = self.get_response(request)
+        finally:
+            current_request.reset(context_token)
+        duration = time.perf_counter() - started
+
+        labels = {
+            "view": get_view_name(request),
+            "status": str(response.status_code),
+        }
+        registry.observe("http_request_duration_seconds", labels, duration)
+        registry.observe("http_request_db_queries", labels, timer.count)
+        registry.observe("http_request_db_duration_seconds", labels, timer.duration)
+        registry.observe(
+            "http_request_serializer_duration_seconds",
+            labels,
+            measured["serializer_time"],
+        )
+        return response
+
+
+class QueryInspectionMiddleware:
+    """
+    Opt-in (``QUERY_INSPECTION_ENABLED``) detector for N+1 and duplicate
+    queries. Statement shapes repeated ``QUERY_INSPECTION_THRESHOLD`` times
+    in one request are logged with the view, the serializer field that
+    triggered them and a stack excerpt. Requests issuing more queries than the
+    view's ``query_budget`` are logged too, or fail with
+    ``QueryBudgetExceeded`` when ``QUERY_BUDGET_ENFORCED`` is set.
+    """
+
+    def __init__(self, get_response):
+        if not getattr(settings, "QUERY_INSPECTION_ENABLED", False):
+            raise MiddlewareNotUsed
+        self.get_response = get_response
+        self.threshold = getattr(settings, "QUERY_INSPECTION_THRESHOLD", 3)
+        self.enforce_budget = getattr(settings, "QUERY_BUDGET_ENFORCED", False)
+
+    def __call__(self, request):
+        inspector = QueryInspector()
+        with connection.execute_wrapper(inspector):
+            response = self.get_response(request)
+
+        view_name = get_view_name(request)
+        for count, origin in inspector.repeated(self.threshold):
+            logger.warning(
+                f"Repeated query in {view_name}: {count}x",
+                extra={
+                    "view": view_name,
+                    "count": count,
+                    "sql": origin["sql"],
+                    "serializer_field": origin["field"],
+                    "stack": origin["stack"],
+                },
+            )
+
+        self.check_budget(request, view_name, inspector.count)
+        return response
+
+    def check_budget(self, request, view_name, count):
+        match = getattr(request, "resolver_match", None)
+        view_class = getattr(getattr(match, "func", None), "cls", None)
+        budget = get_query_budget(view_class, view_name.rpartition(".")[2])
+        if budget is None or count <= budget:
+            return
+
+        message = f"{view_name} issued {count} queries, budget is {budget}."
+        if self.enforce_budget:
+            raise QueryBudgetExceeded(message)
+        logger.error(message, extra={"view": view_name, "count": count})
@@ -1,11 +1,105 @@
+import base64
+import binascii
+import hashlib
+import json
+
+from django.conf import settings
+from django.core.cache import cache
+from django.core.exceptions import (EmptyResultSet, FieldDoesNotExist,
+                                    ValidationError)
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db import connections
+from django.db.models import F, Q
+from rest_framework.exceptions import NotFound
 from rest_framework.pagination import PageNumberPagination
 from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class ExactCount:
+    """Run COUNT(*) over the filtered queryset."""
+
+    name = "exact"
+
+    def count(self, queryset):
+        try:
+            return queryset.count(), self.name
+        except EmptyResultSet:
+            return 0, self.name
+
+
+class NoCount:
+    """Skip counting altogether; clients rely on ``has_next``."""
+
+    name = "none"
+
+    def count(self, queryset):
+        return None, self.name
+
+
+class EstimatedCount:
+    """
+    Use the planner's row estimate from ``pg_class`` for unfiltered lists and
+    fall back to an exact count when the queryset is filtered or the estimate
+    is unavailable.
+    """
+
+    name = "estimate"
+
+    def count(self, queryset):
+        connection = connections[queryset.db]
+        query = queryset.query
+        if connection.vendor == "postgresql" and not query.where and not query.distinct:
+            with connection.cursor() as cursor:
+                cursor.execute(
+                    "SELECT reltuples::bigint FROM pg_class WHERE oid = to_regclass(%s)",
+                    [queryset.model._meta.db_table],
+                )
+                row = cursor.fetchone()
+            if row and row[0] > 0:
+                return row[0], self.name
+        return ExactCount().count(queryset)
+
+
+class CachedCount:
+    """Serve an exact count cached for a short time per filter signature."""
+
+    name = "cached"
+
+    def count(self, queryset):
+        try:
+            sql, params = queryset.order_by().query.sql_with_params()
+        except EmptyResultSet:
+            return 0, self.name
+
+        signature = hashlib.md5(repr((sql, params)).encode("utf-8")).hexdigest()
+        key = f"pagination-count:{queryset.db}:{signature}"
+        total = cache.get(key)
+        if total is None:
+            total, _ = ExactCount().count(queryset)
+            cache.set(
+                key, total, getattr(settings, "PAGINATION_COUNT_CACHE_TIMEOUT", 30)
+            )
+        return total, self.name
+
+
+COUNT_STRATEGIES = {
+    strategy.name: strategy
+    for strategy in (ExactCount, NoCount, EstimatedCount, CachedCount)
+}
 
 
 class CustomPageNumberPagination(PageNumberPagination):
     page_size_query_param = "page_size"
     max_page_size = 100
 
+    cursor_query_param = "cursor"
+    cursor_page_size = 20
+    invalid_cursor_message = "Invalid cursor."
+
+    count_query_param = "count"
+    cursor_count_strategy = "none"
+
     def get_page_size(self, request):
         if self.page_size_query_param:
             page_size = request.query_params.get(self.page_size_query_param, None)
@@ -16,12 +110,229 @@ class CustomPageNumberPagination(PageNumberPagination):
                 return page_size
         return self.page_size
 
+    def get_default_page_size(self, view=None):
+        """
+        Page size for actions that must never return every row, read from the
+        view's ``default_page_size`` mapping of action to size.
+        """
+        sizes = getattr(view, "default_page_size", {})
+        return sizes.get(getattr(view, "action", None))
+
+    def get_count_strategy(self, request, view=None):
+        """
+        Pick the count strategy from the ``count`` query parameter, then the
+        view's ``count_strategy``, then ``PAGINATION_COUNT_STRATEGY``.
+        """
+        name = request.query_params.get(self.count_query_param)
+        if name not in COUNT_STRATEGIES:
+            if self.cursor_mode:
+                name = self.cursor_count_strategy
+            else:
+                name = getattr(view, "count_strategy", None) or getattr(
+                    settings, "PAGINATION_COUNT_STRATEGY", ExactCount.name
+                )
+        return COUNT_STRATEGIES[name]()
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.cursor_mode = self.cursor_query_param in request.query_params
+        self.total, self.count_strategy = None, None
+        if not self.cursor_mode:
+            return self.paginate_queryset_by_page(queryset, request, view)
+
+        results = self.paginate_queryset_by_cursor(queryset, request, view)
+        strategy = self.get_count_strategy(request, view)
+        self.total, self.count_strategy = strategy.count(queryset)
+        return results
+
+    def paginate_queryset_by_page(self, queryset, request, view=None):
+        """
+        Return one OFFSET/LIMIT page, reading a row past the page to learn
+        whether another page follows so the total can come from the selected
+        count strategy instead of a mandatory COUNT(*).
+        """
+        page_size = self.get_page_size(request) or self.get_default_page_size(view)
+        if not page_size:
+            return None
+
+        self.request = request
+        self.page_size = page_size
+        strategy = self.get_count_strategy(request, view)
+
+        page_number = request.query_params.get(self.page_query_param) or 1
+        if page_number in self.last_page_strings:
+            self.total, self.count_strategy = ExactCount().count(queryset)
+            page_number = max(1, -(-self.total // page_size))
+        try:
+            page_number = int(page_number)
+            if page_number < 1:
+                raise ValueError
+        except (TypeError, ValueError):
+            raise NotFound(
+                self.invalid_page_message.format(
+                    page_number=page_number,
+                    message="That page number is not an integer",
+                )
+            )
+
+        offset = (page_number - 1) * page_size
+        results = list(queryset[offset : offset + page_size + 1])
+        if page_number > 1 and not results:
+            raise NotFound(
+                self.invalid_page_message.format(
+                    page_number=page_number, message="That page contains no results"
+                )
+            )
+
+        self.page_number = page_number
+        self.has_next = len(results) > page_size
+        self.has_previous = page_number > 1
+        if self.count_strategy is None:
+            self.total, self.count_strategy = strategy.count(queryset)
+        return results[:page_size]
+
+    def paginate_queryset_by_cursor(self, queryset, request, view=None):
+        """
+        Return the page following (or preceding) the position encoded in the
+        ``cursor`` query parameter, seeking on the view's ``cursor_ordering``
+        instead of counting and skipping rows. An empty cursor is the first page.
+        """
+        self.request = request
+        self.page_size = self.get_page_size(request) or self.cursor_page_size
+        self.ordering = [
+            (name.lstrip("-"), name.startswith("-"))
+            for name in getattr(view, "cursor_ordering", ("id",))
+        ]
+
+        position, reverse = self.decode_cursor(queryset, request)
+
+        queryset = queryset.order_by(*self.get_cursor_order_by(reverse))
+        if position is not None:
+            queryset = queryset.filter(self.get_cursor_filter(position, reverse))
+
+        results = list(queryset[: self.page_size + 1])
+        has_more = len(results) > self.page_size
+        results = results[: self.page_size]
+        if reverse:
+            results.reverse()
+
+        if reverse:
+            self.has_next, self.has_previous = position is not None, has_more
+        else:
+            self.has_next, self.has_previous = has_more, position is not None
+
+        self.next_position = self.get_position(results[-1]) if results else None
+        self.previous_position = self.get_position(results[0]) if results else None
+        return results
+
+    def get_cursor_order_by(self, reverse):
+        return [
+            F(name).desc() if descending != reverse else F(name).asc()
+            for name, descending in self.ordering
+        ]
+
+    def get_cursor_filter(self, position, reverse):
+        """
+        Build ``(k1, k2, ...) > (v1, v2, ...)`` in the direction of travel,
+        plus a bound on the leading key alone so the database can seek the
+        ordering index straight to the cursor position.
+        """
+        condition = Q()
+        equal = Q()
+        for (name, descending), value in zip(self.ordering, position):
+            lookup = "lt" if descending != reverse else "gt"
+            condition |= equal & Q(**{f"{name}__{lookup}": value})
+            equal &= Q(**{name: value})
+
+        name, descending = self.ordering[0]
+        lookup = "lte" if descending != reverse else "gte"
+        return Q(**{f"{name}__{lookup}": position[0]}) & condition
+
+    def get_position(self, instance):
+        return [getattr(instance, name) for name, _ in self.ordering]
+
+    def encode_cursor(self, position, reverse=False):
+        payload = json.dumps({"p": position, "r": reverse}, cls=DjangoJSONEncoder)
+        token = base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii")
+        return replace_query_param(
+            self.request.build_absolute_uri(), self.cursor_query_param, token
+        )
+
+    def decode_cursor(self, queryset, request):
+        token = request.query_params.get(self.cursor_query_param)
+        if not token:
+            return None, False
+
+        try:
+            payload = json.loads(base64.urlsafe_b64decode(token.encode("ascii")))
+            position = payload["p"]
+            reverse = bool(payload.get("r", False))
+            if len(position) != len(self.ordering):
+                raise ValueError
+            position = [
+                self.get_ordering_field(queryset, name).to_python(value)
+                for (name, _), value in zip(self.ordering, position)
+            ]
+        except (
+            binascii.Error,
+            FieldDoesNotExist,
+            KeyError,
+            TypeError,
+            ValueError,
+            ValidationError,
+        ):
+            raise NotFound(self.invalid_cursor_message)
+
+        return position, reverse
+
+    def get_ordering_field(self, queryset, name):
+        if name in queryset.query.annotations:
+            return queryset.query.annotations[name].output_field
+        return queryset.model._meta.get_field(name)
+
+    def get_next_link(self):
+        if not self.has_next:
+            return None
+        if not self.cursor_mode:
+            return replace_query_param(
+                self.request.build_absolute_uri(),
+                self.page_query_param,
+                self.page_number + 1,
+            )
+        if self.next_position is None:
+            return None
+        return self.encode_cursor(self.next_position)
+
+    def get_previous_link(self):
+        if not self.has_previous:
+            return None
+        if not self.cursor_mode:
+            url = self.request.build_absolute_uri()
+            if self.page_number == 2:
+                return remove_query_param(url, self.page_query_param)
+            return replace_query_param(url, self.page_query_param, self.page_number - 1)
+        if self.previous_position is None:
+            return None
+        return self.encode_cursor(self.previous_position, reverse=True)
+
     def get_paginated_response(self, data):
+        pagination = {
+            "total": self.total,
+            "has_next": self.has_next,
+            "has_previous": self.has_previous,
+            "count_strategy": self.count_strategy,
+            "next": self.get_next_link(),
+            "previous": self.get_previous_link(),
+        }
+        if not self.cursor_mode:
+            pagination["page"] = self.page_number
+            pagination["page_size"] = self.page_size
+
         return Response(
             {
                 "status": "success",
                 "code": 200,
                 "message": "Employees fetched successfully.",
                 "data": data,
+                "pagination": pagination,
             }
         )
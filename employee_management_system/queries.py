@@ -0,0 +1,121 @@
+from django.core.exceptions import FieldDoesNotExist
+from rest_framework import serializers
+
+
+def get_declared_select_related(serializer):
+    if hasattr(serializer, "get_select_related"):
+        return serializer.get_select_related()
+    return getattr(getattr(serializer, "Meta", None), "select_related", ())
+
+
+def get_related_paths(serializer, prefix=""):
+    """
+    Return the ``select_related`` and ``prefetch_related`` paths a serializer
+    reads when it renders an instance.
+
+    Nested model serializers and non-pk related fields are followed, write-only
+    fields are ignored and serializers can list the relations their custom
+    representation code touches in ``Meta.select_related``.
+    """
+    select_related, prefetch_related = set(), set()
+
+    for path in get_declared_select_related(serializer):
+        select_related.add(f"{prefix}{path}")
+
+    for field in serializer.fields.values():
+        if field.write_only or field.source == "*":
+            continue
+
+        path = prefix + "__".join(field.source_attrs)
+
+        if isinstance(
+            field, (serializers.ListSerializer, serializers.ManyRelatedField)
+        ):
+            prefetch_related.add(path)
+        elif isinstance(field, serializers.ModelSerializer):
+            select_related.add(path)
+            nested_select, nested_prefetch = get_related_paths(field, f"{path}__")
+            select_related |= nested_select
+            prefetch_related |= nested_prefetch
+        elif (
+            isinstance(field, serializers.RelatedField)
+            and not field.use_pk_only_optimization()
+        ):
+            select_related.add(path)
+
+    return select_related, prefetch_related
+
+
+def get_loaded_fields(serializer, prefix=""):
+    """
+    Return the ``only`` paths covering every column ``serializer`` reads.
+
+    Method fields, ``source="*"`` fields, properties and the relations in
+    ``Meta.select_related`` are read by code, so their models load every
+    column.
+    """
+    model = serializer.Meta.model
+
+    def all_columns(model, prefix):
+        return {f"{prefix}{field.name}" for field in model._meta.concrete_fields}
+
+    paths = {f"{prefix}{model._meta.pk.name}"}
+    for path in get_declared_select_related(serializer):
+        related_model, related_prefix = model, prefix
+        for name in path.split("__"):
+            paths.add(f"{related_prefix}{name}")
+            related_model = related_model._meta.get_field(name).related_model
+            related_prefix = f"{related_prefix}{name}__"
+            paths |= all_columns(related_model, related_prefix)
+
+    for field in serializer.fields.values():
+        if field.write_only or isinstance(
+            field, (serializers.ListSerializer, serializers.ManyRelatedField)
+        ):
+            continue
+        if field.source == "*":
+            paths |= all_columns(model, prefix)
+            continue
+
+        try:
+            model_field = model._meta.get_field(field.source_attrs[0])
+        except FieldDoesNotExist:
+            paths |= all_columns(model, prefix)
+            continue
+        if not model_field.concrete:
+            continue
+
+        paths.add(f"{prefix}{model_field.name}")
+        if isinstance(field, serializers.ModelSerializer):
+            paths |= get_loaded_fields(field, f"{prefix}{model_field.name}__")
+
+    return paths
+
+
+def optimize_queryset(queryset, serializer, extra_fields=()):
+    """
+    Join or prefetch every relation ``serializer`` reads from ``queryset``.
+
+    When a sparse fieldset was requested (see ``SparseFieldsetMixin``) the
+    columns are narrowed with ``only`` as well; ``extra_fields`` names
+    further columns the view reads, kept when their relation is joined.
+    """
+    select_related, prefetch_related = get_related_paths(serializer)
+
+    if select_related:
+        queryset = queryset.select_related(*sorted(select_related))
+    if prefetch_related:
+        queryset = queryset.prefetch_related(*sorted(prefetch_related))
+
+    if getattr(serializer, "sparse", False):
+        joined = {""} | {
+            path.rsplit("__", depth)[0]
+            for path in select_related
+            for depth in range(path.count("__") + 1)
+        }
+        only = get_loaded_fields(serializer) | {
+            path for path in extra_fields if path.rpartition("__")[0] in joined
+        }
+        queryset = queryset.only(*sorted(only))
+
+    return queryset
@@ -0,0 +1,113 @@
+import hashlib
+import re
+import sys
+from collections import defaultdict
+from contextlib import contextmanager
+
+from django.conf import settings
+from django.db import DEFAULT_DB_ALIAS, connections
+
+IN_LIST_RE = re.compile(r"IN \((?:%s, )*%s\)")
+LITERAL_RE = re.compile(r"'(?:[^']|'')*'|\b\d+\b")
+
+
+class QueryBudgetExceeded(Exception):
+    pass
+
+
+def fingerprint(sql):
+    """Reduce a statement to its shape so per-row repeats collapse together."""
+    shape = LITERAL_RE.sub("?", IN_LIST_RE.sub("IN (...)", sql))
+    return hashlib.md5(shape.encode("utf-8")).hexdigest()[:12], shape
+
+
+def find_serializer_field():
+    """Name the serializer field being rendered when the query ran, if any."""
+    frame = sys._getframe(2)
+    while frame is not None:
+        serializer = frame.f_locals.get("self")
+        if frame.f_code.co_name == "to_representation" and hasattr(
+            serializer, "fields"
+        ):
+            field = frame.f_locals.get("field")
+            if field is not None:
+                return f"{type(serializer).__name__}.{field.field_name}"
+            return f"{type(serializer).__name__}.to_representation"
+        frame = frame.f_back
+    return None
+
+
+def stack_excerpt(limit=5):
+    """Return the innermost project frames of the current stack."""
+    base_dir = str(settings.BASE_DIR)
+    lines = []
+    frame = sys._getframe(2)
+    while frame is not None and len(lines) < limit:
+        filename = frame.f_code.co_filename
+        if (
+            filename.startswith(base_dir)
+            and "site-packages" not in filename
+            and not filename.endswith("query_inspection.py")
+        ):
+            lines.append(
+                f"{filename[len(base_dir) + 1:]}:{frame.f_lineno} in {frame.f_code.co_name}"
+            )
+        frame = frame.f_back
+    return lines
+
+
+class QueryInspector:
+    """
+    Database execute wrapper grouping the statements a request issues by
+    fingerprint, remembering where the first of each shape came from.
+    """
+
+    def __init__(self):
+        self.count = 0
+        self.shapes = defaultdict(int)
+        self.origins = {}
+
+    def __call__(self, execute, sql, params, many, context):
+        self.count += 1
+        key, shape = fingerprint(sql)
+        self.shapes[key] += 1
+        if key not in self.origins:
+            self.origins[key] = {
+                "sql": shape,
+                "field": find_serializer_field(),
+                "stack": stack_excerpt(),
+            }
+        return execute(sql, params, many, context)
+
+    def repeated(self, threshold):
+        """Return ``(count, origin)`` for every shape seen ``threshold`` times or more."""
+        return [
+            (count, self.origins[key])
+            for key, count in sorted(self.shapes.items(), key=lambda item: -item[1])
+            if count >= threshold
+        ]
+
+
+def get_query_budget(view, action):
+    """Read a view's ``query_budget``: an int, or a dict keyed by action."""
+    budget = getattr(view, "query_budget", None)
+    if isinstance(budget, dict):
+        return budget.get(action)
+    return budget
+
+
+@contextmanager
+def assert_max_queries(limit, using=None):
+    """Fail with ``QueryBudgetExceeded`` when the block issues more than ``limit`` queries."""
+    inspector = QueryInspector()
+    with connections[using or DEFAULT_DB_ALIAS].execute_wrapper(inspector):
+        yield inspector
+    if inspector.count > limit:
+        repeated = [
+            f"{count}x {origin['sql'][:200]} ({origin['field'] or 'no serializer'})"
+            for count, origin in inspector.repeated(2)
+        ]
+        raise QueryBudgetExceeded(
+            f"{inspector.count} queries issued, budget is {limit}."
+            + "".join(f"\n  {line}" for line in repeated)
+        )
@@ -0,0 +1,141 @@
+import math
+from decimal import Decimal
+
+from rest_framework.exceptions import ParseError
+from rest_framework.parsers import BaseParser, JSONParser
+from rest_framework.renderers import BaseRenderer, JSONRenderer
+from rest_framework.utils.encoders import JSONEncoder
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+ORJSON_OPTIONS = orjson.OPT_PASSTHROUGH_DATETIME if orjson else 0
+
+# Types ``has_special_floats`` never needs to look into.
+PLAIN_TYPES = frozenset((str, int, bool, type(None)))
+
+
+def is_plain_float(value):
+    """
+    Whether orjson writes ``value`` exactly like ``json.dumps``: finite and
+    zero or between 1e-4 and 1e16 in magnitude, where neither uses exponents.
+    """
+    try:
+        value = float(value)
+    except (OverflowError, ValueError):
+        return False
+    return value == 0 or (math.isfinite(value) and 1e-4 <= abs(value) < 1e16)
+
+
+def has_special_floats(data):
+    """Whether ``data`` holds a float or ``Decimal`` failing ``is_plain_float``."""
+    stack = [(data,)]
+    while stack:
+        container = stack.pop()
+        if isinstance(container, dict):
+            values = container.values()
+        else:
+            values = container
+        for value in values:
+            kind = type(value)
+            if kind in PLAIN_TYPES:
+                continue
+            if kind is dict or kind is list or kind is tuple:
+                stack.append(value)
+            elif kind is float or isinstance(value, Decimal):
+                if not is_plain_float(value):
+                    return True
+            elif isinstance(value, (dict, list, tuple)):
+                stack.append(value)
+    return False
+
+
+class ORJSONRenderer(JSONRenderer):
+    """
+    ``JSONRenderer`` producing the same bytes through orjson.
+
+    Strings, numbers, containers and UUIDs are encoded natively; dates,
+    ``Decimal`` and lazy strings are handed to DRF's encoder so their format
+    does not change. Indented output, ``ensure_ascii``, a missing orjson,
+    non-string keys and payloads with floats orjson formats differently
+    (exponents, NaN and infinities, which the stdlib renderer rejects) fall
+    back to the stdlib renderer.
+    """
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        if (
+            orjson is None
+            or self.ensure_ascii
+            or not self.compact
+            or self.get_indent(accepted_media_type, renderer_context or {})
+            or has_special_floats(data)
+        ):
+            return super().render(data, accepted_media_type, renderer_context)
+
+        try:
+            ret = orjson.dumps(
+                data, default=self.encoder_class().default, option=ORJSON_OPTIONS
+            )
+        except orjson.JSONEncodeError:
+            return super().render(data, accepted_media_type, renderer_context)
+
+        # Match JSONRenderer, which escapes these for JavaScript consumers.
+        return ret.replace(b"\xe2\x80\xa8", b"\\u2028").replace(
+            b"\xe2\x80\xa9", b"\\u2029"
+        )
+
+
+class ORJSONParser(JSONParser):
+    """``JSONParser`` decoding UTF-8 bodies with orjson."""
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        parser_context = parser_context or {}
+        encoding = parser_context.get("encoding", "utf-8")
+        if orjson is None or encoding.lower().replace("_", "-") not in (
+            "utf-8",
+            "utf8",
+        ):
+            return super().parse(stream, media_type, parser_context)
+
+        try:
+            return orjson.loads(stream.read())
+        except orjson.JSONDecodeError as exc:
+            raise ParseError("JSON parse error - %s" % str(exc))
+
+
+class MessagePackRenderer(BaseRenderer):
+    """
+    Render ``application/msgpack`` for service-to-service callers.
+
+    Values without a MessagePack type are converted like the JSON renderer
+    does, so both formats carry the same payload.
+    """
+
+    media_type = "application/msgpack"
+    format = "msgpack"
+    charset = None
+    render_style = "binary"
+
+    def render(self, data, accepted_media_type=None, renderer_context=None):
+        if data is None:
+            return b""
+        return msgpack.packb(data, default=JSONEncoder().default, use_bin_type=True)
+
+
+class MessagePackParser(BaseParser):
+    media_type = "application/msgpack"
+
+    def parse(self, stream, media_type=None, parser_context=None):
+        try:
+            return msgpack.unpackb(stream.read(), raw=False, strict_map_key=False)
+        except Exception as exc:
+            raise ParseError("MessagePack parse error - %s" % str(exc))
@@ -0,0 +1,145 @@
+import functools
+import hashlib
+import time
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db import transaction
+from django.db.models.signals import post_delete, post_save
+from rest_framework.response import Response
+
+from permissions.permissions import get_effective_permissions
+
+VERSION_KEY = "model-version:{}"
+
+
+def model_label(model):
+    return model._meta.label_lower
+
+
+def get_versions(models):
+    keys = [VERSION_KEY.format(model_label(model)) for model in models]
+    versions = cache.get_many(keys)
+    return [versions.get(key, 0) for key in keys]
+
+
+def incr_version(model):
+    key = VERSION_KEY.format(model_label(model))
+    try:
+        cache.incr(key)
+    except ValueError:
+        cache.add(key, 1, timeout=None) or cache.incr(key)
+
+
+def bump_version(model):
+    """
+    Invalidate cached responses built from ``model``, again once the current
+    transaction commits so entries cached from pre-commit reads are dropped too.
+    """
+    incr_version(model)
+    transaction.on_commit(lambda: incr_version(model))
+
+
+def track_versions(model, ignore_fields=()):
+    """
+    Bump ``model``'s cache version whenever a row is saved or deleted, except
+    for saves that only touch ``ignore_fields``.
+    """
+    ignore_fields = set(ignore_fields)
+
+    def bump_on_save(sender, update_fields=None, **kwargs):
+        if update_fields and set(update_fields) <= ignore_fields:
+            return
+        bump_version(sender)
+
+    def bump_on_delete(sender, **kwargs):
+        bump_version(sender)
+
+    post_save.connect(bump_on_save, sender=model, weak=False)
+    post_delete.connect(bump_on_delete, sender=model, weak=False)
+
+
+def get_scope(user):
+    """Describe what the caller may see, so differently privileged users never share entries."""
+    if not user.is_authenticated:
+        return "anonymous"
+    if user.is_admin:
+        return "admin"
+    return ",".join(sorted(get_effective_permissions(getattr(user, "role", None))))
+
+
+def cache_response(models=(), timeout=None):
+    """
+    Cache successful responses of a view method.
+
+    Entries are keyed by view, method, path, query parameters, the method's
+    other arguments, the caller's permission scope and the current version of
+    every model in ``models``, so a save or delete of any of them makes old
+    entries unreachable. An entry stays fresh for ``timeout`` seconds and is
+    kept a while longer: once stale, one request rebuilds it under a lock
+    while the others keep serving the stale copy, and on a cold miss
+    concurrent requests wait for the first one instead of all hitting the
+    database.
+
+    Versions live in the default cache, which settings point at a backend
+    shared by every worker process, so a save in one worker invalidates the
+    entries of all of them.
+    """
+
+    def decorator(method):
+        @functools.wraps(method)
+        def wrapper(self, request, *args, **kwargs):
+            fresh_for = timeout or getattr(settings, "RESPONSE_CACHE_TIMEOUT", 300)
+            lock_timeout = getattr(settings, "RESPONSE_CACHE_LOCK_TIMEOUT", 10)
+
+            signature = hashlib.sha1(
+                repr(
+                    (
+                        request.path,
+                        sorted(request.query_params.lists()),
+                        get_scope(request.user),
+                        get_versions(models),
+                        args,
+                        sorted(kwargs.items()),
+                    )
+                ).encode("utf-8")
+            ).hexdigest()
+            key = f"response:{type(self).__name__}.{method.__name__}:{signature}"
+            lock_key = f"{key}:lock"
+
+            entry = cache.get(key)
+            if entry is not None and entry["fresh_until"] > time.time():
+                return Response(entry["data"], status=entry["status"])
+
+            locked = cache.add(lock_key, 1, lock_timeout)
+            if not locked:
+                if entry is not None:
+                    return Response(entry["data"], status=entry["status"])
+                deadline = time.monotonic() + lock_timeout
+                while time.monotonic() < deadline:
+                    time.sleep(0.05)
+                    entry = cache.get(key)
+                    if entry is not None:
+                        return Response(entry["data"], status=entry["status"])
+
+            try:
+                response = method(self, request, *args, **kwargs)
+                if isinstance(response, Response) and response.status_code == 200:
+                    cache.set(
+                        key,
+                        {
+                            "data": response.data,
+                            "status": response.status_code,
+                            "fresh_until": time.time() + fresh_for,
+                        },
+                        fresh_for
+                        + getattr(settings, "RESPONSE_CACHE_STALE_TIMEOUT", 60),
+                    )
+                return response
+            finally:
+                if locked:
+                    cache.delete(lock_key)
+
+        return wrapper
+
+    return decorator
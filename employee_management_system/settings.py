@@ -1,4 +1,5 @@
 import os
+from importlib.util import find_spec
 from pathlib import Path
 
 from dotenv import read_dotenv
@@ -31,6 +32,10 @@ INSTALLED_APPS = [
 ]
 
 MIDDLEWARE = [
+    "employee_management_system.middleware.MetricsMiddleware",
+    "employee_management_system.middleware.QueryCountMiddleware",
+    "employee_management_system.middleware.QueryInspectionMiddleware",
+    "employee_management_system.middleware.CustomLoggingMiddleware",
     "django.middleware.security.SecurityMiddleware",
     "django.contrib.sessions.middleware.SessionMiddleware",
     "django.middleware.common.CommonMiddleware",
@@ -71,17 +76,64 @@ DATABASES = {
     }
 }
 
+# Cached responses, their model versions and pagination counts must be shared
+# by every worker process, so the default cache is Redis when REDIS_URL is set
+# and otherwise a table in the main database (``manage.py createcachetable``).
+if os.environ.get("REDIS_URL"):
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.redis.RedisCache",
+            "LOCATION": os.environ["REDIS_URL"],
+        }
+    }
+else:
+    CACHES = {
+        "default": {
+            "BACKEND": "django.core.cache.backends.db.DatabaseCache",
+            "LOCATION": "django_cache",
+        }
+    }
+
 AUTHENTICATION_BACKENDS = [
     "authentication.customAuthentication.CustomAuthenticationBackend",
 ]
 
+LAST_LOGIN_ASYNC = True
+
+LAST_LOGIN_FLUSH_INTERVAL = 5
+
+TOKEN_CACHE_MAX_SIZE = 10000
+
+# Seconds another worker may keep accepting a deleted token or a deactivated
+# user; the token cache is per process and only its own signals clear it.
+TOKEN_CACHE_TIMEOUT = 5
+
 REST_FRAMEWORK = {
     "EXCEPTION_HANDLER": "employee_management_system.exceptions.custom_exception_handler",
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework.authentication.TokenAuthentication",
+        "authentication.customAuthentication.CachedTokenAuthentication",
     ),
+    "DEFAULT_RENDERER_CLASSES": [
+        "employee_management_system.renderers.ORJSONRenderer",
+        "rest_framework.renderers.BrowsableAPIRenderer",
+    ],
+    "DEFAULT_PARSER_CLASSES": [
+        "employee_management_system.renderers.ORJSONParser",
+        "rest_framework.parsers.FormParser",
+        "rest_framework.parsers.MultiPartParser",
+    ],
 }
 
+# MessagePack is offered to internal callers sending Accept: application/msgpack
+# when the optional msgpack package is installed.
+if find_spec("msgpack"):
+    REST_FRAMEWORK["DEFAULT_RENDERER_CLASSES"].append(
+        "employee_management_system.renderers.MessagePackRenderer"
+    )
+    REST_FRAMEWORK["DEFAULT_PARSER_CLASSES"].append(
+        "employee_management_system.renderers.MessagePackParser"
+    )
+
 AUTH_USER_MODEL = "authentication.User"
 
 AUTH_PASSWORD_VALIDATORS = [
@@ -114,6 +166,69 @@ STATIC_URL = "/static/"
 
 DEFAULT_AUTO_FIELD = "django.db.models.BigAutoField"
 
+QUERY_COUNT_HEADER = "X-Query-Count"
+
+PAGINATION_COUNT_STRATEGY = "cached"
+
+PAGINATION_COUNT_CACHE_TIMEOUT = 30
+
+RESPONSE_CACHE_TIMEOUT = 300
+
+RESPONSE_CACHE_STALE_TIMEOUT = 60
+
+RESPONSE_CACHE_LOCK_TIMEOUT = 10
+
+BULK_ONBOARDING_CHUNK_SIZE = 500
+
+BULK_ONBOARDING_HASH_WORKERS = os.cpu_count() or 1
+
+PAYROLL_HOURS_PER_YEAR = 2080
+
+PAYROLL_DAYS_PER_YEAR = 260
+
+PAYROLL_DEFAULT_PAY_PERIOD = "monthly"
+
+# Longest payroll range, in periods of the requested interval.
+PAYROLL_MAX_PERIODS = 120
+
+# Most salaries x periods one payroll run may prorate, bounding its time.
+PAYROLL_MAX_CELLS = 24_000_000
+
+LEAVE_CALENDAR_MAX_DAYS = 366
+
+# Days of leave granted per calendar year, by leave type; other types have none.
+LEAVE_ENTITLEMENTS = {
+    "Annual": 20,
+    "Sick": 10,
+    "Casual": 5,
+    "Parental": 90,
+}
+
+
+QUERY_INSPECTION_ENABLED = os.environ.get("QUERY_INSPECTION_ENABLED") == "1"
+
+QUERY_INSPECTION_THRESHOLD = 3
+
+QUERY_BUDGET_ENFORCED = False
+
+METRICS_DIR = os.environ.get("METRICS_DIR")
+
+METRICS_FLUSH_INTERVAL = 5
+
+# Seconds after which a worker's metrics snapshot is dropped from the scrape.
+METRICS_SNAPSHOT_MAX_AGE = 60
+
+METRICS_ALLOWED_IPS = tuple(
+    address.strip()
+    for address in os.environ.get("METRICS_ALLOWED_IPS", "127.0.0.1,::1").split(",")
+    if address.strip()
+)
+
+LOG_BODY_MAX_LENGTH = 2048
+
+LOG_BODY_SAMPLE_RATE = 0.1
+
+LOG_REDACTED_FIELDS = ("password", "token")
 
 LOGGING = {
     "version": 1,
@@ -128,13 +243,18 @@ LOGGING = {
             "format": "{levelname} {message}",
             "style": "{",
         },
+        "json": {
+            "()": "employee_management_system.log_handlers.JSONFormatter",
+        },
     },
     "handlers": {
         "file": {
             "level": "INFO",
-            "class": "logging.FileHandler",
+            "class": "employee_management_system.log_handlers.QueuedRotatingFileHandler",
             "filename": "employee_management_system_logs.log",
-            "formatter": "verbose",
+            "maxBytes": 10 * 1024 * 1024,
+            "backupCount": 5,
+            "formatter": "json",
         },
     },
     "loggers": {
@@ -1,7 +1,10 @@
 from django.urls import include, path
 
+from .metrics import metrics_view
+
 urlpatterns = [
     path("auth/", include("authentication.urls")),
     path("employees/", include("employees.urls")),
     path("departments/", include("departments.urls")),
+    path("metrics", metrics_view, name="metrics"),
 ]
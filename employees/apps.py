@@ -4,3 +4,12 @@ from django.apps import AppConfig
 class EmployeesConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "employees"
+
+    def ready(self):
+        from employee_management_system.response_cache import track_versions
+
+        from . import signals  # noqa: F401
+
+        track_versions(self.get_model("Role"))
+        track_versions(self.get_model("Employee"))
+        track_versions(self.get_model("Leave"))
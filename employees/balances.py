@@ -0,0 +1,155 @@
+import datetime
+from collections import defaultdict
+
+from django.conf import settings
+from django.db import transaction
+from django.db.models import F
+
+from .models import Leave, LeaveBalance
+
+# Ledger column counting the days of a leave in each status; cancelled
+# leaves count nowhere.
+BALANCE_FIELDS = {"Approved": "approved_days", "Pending": "pending_days"}
+
+# Leave fields a balance depends on, read back before a leave is changed.
+BALANCE_STATE_FIELDS = ("employee_id", "leave_type", "status", "start_date", "end_date")
+
+
+def days_by_year(start_date, end_date):
+    """
+    Days of ``start_date``..``end_date`` (inclusive) falling in each calendar
+    year; a missing or earlier end date makes it a single day, as in
+    ``leave_period``.
+    """
+    end_date = max(end_date or start_date, start_date)
+    days = {}
+    while start_date <= end_date:
+        year_end = min(datetime.date(start_date.year, 12, 31), end_date)
+        days[start_date.year] = (year_end - start_date).days + 1
+        start_date = year_end + datetime.timedelta(days=1)
+    return days
+
+
+def leave_state(leave):
+    return tuple(getattr(leave, name) for name in BALANCE_STATE_FIELDS)
+
+
+def add_leave(changes, state, sign=1):
+    """Add (or with ``sign=-1`` remove) one leave's days to ``changes``."""
+    employee_id, leave_type, status, start_date, end_date = state
+    field = BALANCE_FIELDS.get(status)
+    if field is None or start_date is None:
+        return
+    for year, days in days_by_year(start_date, end_date).items():
+        changes[(employee_id, year, leave_type or "")][field] += sign * days
+
+
+def apply_balance_changes(changes):
+    """
+    Add the per-row day deltas of ``changes`` to the ledger with ``F()``
+    updates, so concurrent writers never overwrite each other. Missing rows
+    are only created for keys gaining days.
+    """
+    changes = {
+        key: {field: delta for field, delta in deltas.items() if delta}
+        for key, deltas in changes.items()
+    }
+    changes = {key: deltas for key, deltas in changes.items() if deltas}
+    if not changes:
+        return
+
+    new_rows = [
+        LeaveBalance(employee_id=employee_id, year=year, leave_type=leave_type)
+        for (employee_id, year, leave_type), deltas in changes.items()
+        if any(delta > 0 for delta in deltas.values())
+    ]
+    with transaction.atomic():
+        if new_rows:
+            LeaveBalance.objects.bulk_create(new_rows, ignore_conflicts=True)
+        for (employee_id, year, leave_type), deltas in changes.items():
+            LeaveBalance.objects.filter(
+                employee_id=employee_id, year=year, leave_type=leave_type
+            ).update(**{field: F(field) + delta for field, delta in deltas.items()})
+
+
+def update_leave_balances(previous=None, current=None):
+    """Move a leave's days from its ``previous`` to its ``current`` state."""
+    changes = defaultdict(lambda: defaultdict(int))
+    if previous is not None:
+        add_leave(changes, previous, sign=-1)
+    if current is not None:
+        add_leave(changes, current)
+    apply_balance_changes(changes)
+
+
+def rebuild_leave_balances(employees=None, batch_size=1000):
+    """
+    Recompute the ledger of the given employees (everyone by default) from
+    their leaves, replacing their existing rows in one transaction.
+    """
+    leaves = Leave.objects.exclude(status="Cancelled").exclude(start_date=None)
+    balances = LeaveBalance.objects.all()
+    if employees is not None:
+        leaves = leaves.filter(employee__in=employees)
+        balances = balances.filter(employee__in=employees)
+
+    changes = defaultdict(lambda: defaultdict(int))
+    for state in leaves.values_list(*BALANCE_STATE_FIELDS).iterator(
+        chunk_size=batch_size
+    ):
+        add_leave(changes, state)
+
+    rows = [
+        LeaveBalance(
+            employee_id=employee_id, year=year, leave_type=leave_type, **deltas
+        )
+        for (employee_id, year, leave_type), deltas in changes.items()
+    ]
+    with transaction.atomic():
+        balances.delete()
+        LeaveBalance.objects.bulk_create(rows, batch_size=batch_size)
+    return len(rows)
+
+
+def get_entitlement(leave_type):
+    return getattr(settings, "LEAVE_ENTITLEMENTS", {}).get(leave_type, 0)
+
+
+def leave_balances(queryset, employee_ids, year, leave_type=None):
+    """
+    Balances of ``employee_ids`` for ``year`` read from the ledger rows in
+    ``queryset``, one entry per leave type with an entitlement or with days
+    taken. ``remaining`` is the entitlement minus the approved days.
+    """
+    queryset = queryset.filter(employee_id__in=employee_ids, year=year)
+    if leave_type is not None:
+        queryset = queryset.filter(leave_type=leave_type)
+    rows = {
+        (row["employee_id"], row["leave_type"]): row
+        for row in queryset.values(
+            "employee_id", "leave_type", "approved_days", "pending_days"
+        )
+    }
+
+    leave_types = set(getattr(settings, "LEAVE_ENTITLEMENTS", {}))
+    if leave_type is not None:
+        leave_types = {leave_type}
+
+    balances = []
+    for employee_id in sorted(employee_ids):
+        taken = {key[1] for key in rows if key[0] == employee_id}
+        for name in sorted(leave_types | taken):
+            row = rows.get((employee_id, name), {})
+            entitlement = get_entitlement(name)
+            approved_days = row.get("approved_days", 0)
+            balances.append(
+                {
+                    "employee_id": employee_id,
+                    "leave_type": name,
+                    "entitlement": entitlement,
+                    "approved_days": approved_days,
+                    "pending_days": row.get("pending_days", 0),
+                    "remaining": entitlement - approved_days,
+                }
+            )
+    return balances
@@ -0,0 +1,142 @@
+import datetime
+
+from django.db.backends.postgresql.psycopg_any import DateRange
+from rest_framework import status
+from rest_framework.exceptions import APIException
+
+from .models import Leave
+
+OVERLAP_CONSTRAINT = "leave_no_overlap"
+
+
+class LeaveConflict(APIException):
+    """A leave overlaps another non-cancelled leave of the same employee."""
+
+    status_code = status.HTTP_409_CONFLICT
+    default_code = "leave_conflict"
+
+    def __init__(self, conflict):
+        self.conflict = conflict
+        if conflict is None:
+            detail = "This leave overlaps another leave of the employee."
+        else:
+            end_date = conflict["end_date"] or conflict["start_date"]
+            detail = (
+                f"This leave overlaps leave {conflict['id']} "
+                f"({conflict['leave_type'] or 'leave'}, {conflict['status']}) "
+                f"from {conflict['start_date']} to {end_date}."
+            )
+        super().__init__(detail)
+
+
+def find_conflicting_leave(employee_id, start_date, end_date, exclude_pk=None):
+    """
+    Return the first non-cancelled leave of the employee overlapping
+    ``start_date``..``end_date`` as a dict, using the GiST index behind the
+    ``leave_no_overlap`` constraint. Leaves without a start date have an
+    unbounded period and are skipped, as the constraint skips them.
+    """
+    end_date = max(end_date or start_date, start_date)
+    conflicts = (
+        Leave.objects.filter(
+            employee_id=employee_id,
+            start_date__isnull=False,
+            period__overlap=DateRange(start_date, end_date, "[]"),
+        )
+        .exclude(status="Cancelled")
+        .order_by("start_date", "id")
+    )
+    if exclude_pk is not None:
+        conflicts = conflicts.exclude(pk=exclude_pk)
+    return conflicts.values(
+        "id", "leave_type", "status", "start_date", "end_date"
+    ).first()
+
+
+def is_overlap_violation(error):
+    """Whether an ``IntegrityError`` comes from the ``leave_no_overlap`` constraint."""
+    diag = getattr(error.__cause__, "diag", None)
+    constraint = getattr(diag, "constraint_name", None)
+    return constraint == OVERLAP_CONSTRAINT or OVERLAP_CONSTRAINT in str(error)
+
+
+def absence_calendar(start, end, queryset=None):
+    """
+    Who is off on each day of ``start``..``end`` (inclusive), from the
+    non-cancelled leaves of ``queryset`` overlapping the window. Leaves are
+    read in one query over the partial GiST index on ``period``; those
+    without a start date have an unbounded period and are left out, as in
+    the ``leave_no_overlap`` constraint.
+    """
+    if queryset is None:
+        queryset = Leave.objects.all()
+    rows = (
+        queryset.filter(
+            start_date__isnull=False, period__overlap=DateRange(start, end, "[]")
+        )
+        .exclude(status="Cancelled")
+        .order_by("start_date", "id")
+        .values_list(
+            "id",
+            "employee_id",
+            "employee__user__username",
+            "employee__user__first_name",
+            "employee__user__last_name",
+            "leave_type",
+            "status",
+            "period",
+        )
+    )
+
+    window = (end - start).days + 1
+    days = [[] for _ in range(window)]
+    employees, leaves = {}, []
+    for (
+        leave_id,
+        employee_id,
+        username,
+        first_name,
+        last_name,
+        leave_type,
+        leave_status,
+        period,
+    ) in rows:
+        # Canonical date ranges are [lower, upper), upper being the day after.
+        leave_end = period.upper - datetime.timedelta(days=1)
+        employees.setdefault(
+            employee_id,
+            {
+                "id": employee_id,
+                "username": username,
+                "first_name": first_name,
+                "last_name": last_name,
+            },
+        )
+        leaves.append(
+            {
+                "id": leave_id,
+                "employee_id": employee_id,
+                "leave_type": leave_type,
+                "status": leave_status,
+                "start_date": period.lower,
+                "end_date": leave_end,
+            }
+        )
+        first = max((period.lower - start).days, 0)
+        last = min((leave_end - start).days, window - 1)
+        for index in range(first, last + 1):
+            days[index].append(employee_id)
+
+    return {
+        "start": start,
+        "end": end,
+        "employees": sorted(employees.values(), key=lambda employee: employee["id"]),
+        "leaves": leaves,
+        "days": [
+            {
+                "date": start + datetime.timedelta(days=index),
+                "employee_ids": sorted(set(employee_ids)),
+            }
+            for index, employee_ids in enumerate(days)
+        ],
+    }
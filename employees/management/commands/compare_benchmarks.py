@@ -0,0 +1,50 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = "Compare benchmark results against a baseline and flag slowdowns."
+
+    def add_arguments(self, parser):
+        parser.add_argument("baseline", help="Baseline results file.")
+        parser.add_argument("current", help="Results file to check.")
+        parser.add_argument(
+            "--threshold",
+            type=float,
+            default=0.2,
+            help="Allowed relative slowdown of the median before failing (0.2 = 20%%).",
+        )
+
+    def handle(self, *args, **options):
+        baseline = self.load(options["baseline"])
+        current = self.load(options["current"])
+
+        slower = []
+        for name in sorted(set(baseline) & set(current)):
+            before = baseline[name]["p50_ms"]
+            after = current[name]["p50_ms"]
+            change = (after - before) / before if before else 0.0
+            line = f"{name}: {before:.3f} ms -> {after:.3f} ms ({change:+.1%})"
+            if change > options["threshold"]:
+                slower.append(name)
+                self.stdout.write(self.style.ERROR(line))
+            else:
+                self.stdout.write(line)
+
+        for name in sorted(set(baseline) - set(current)):
+            self.stdout.write(self.style.WARNING(f"{name}: missing from current run"))
+
+        if slower:
+            raise CommandError(
+                f"{len(slower)} benchmark(s) slowed down by more than "
+                f"{options['threshold']:.0%}: {', '.join(slower)}"
+            )
+        self.stdout.write(self.style.SUCCESS("No slowdowns beyond the threshold."))
+
+    def load(self, path):
+        try:
+            with open(path) as results:
+                return json.load(results)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Could not read {path}: {e}")
@@ -0,0 +1,47 @@
+import json
+import os
+from pathlib import Path
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+from employees.onboarding import BulkOnboarding, parse_rows
+
+
+class Command(BaseCommand):
+    help = "Onboard employees in bulk from a CSV or JSON file."
+
+    def add_arguments(self, parser):
+        parser.add_argument("path", help="CSV or JSON file with one employee per row.")
+        parser.add_argument("--format", choices=["csv", "json"])
+        parser.add_argument("--chunk-size", type=int)
+        parser.add_argument("--workers", type=int, help="Password hashing processes.")
+        parser.add_argument("--report", help="Write the per-row error report here.")
+
+    def handle(self, *args, **options):
+        path = Path(options["path"])
+        file_format = options["format"] or (
+            "csv" if path.suffix.lower() == ".csv" else "json"
+        )
+        try:
+            rows = parse_rows(path.read_text(encoding="utf-8-sig"), file_format)
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Could not read {path}: {e}")
+
+        workers = options["workers"] or getattr(
+            settings, "BULK_ONBOARDING_HASH_WORKERS", os.cpu_count() or 1
+        )
+        report = BulkOnboarding(chunk_size=options["chunk_size"], workers=workers).run(
+            rows
+        )
+
+        if options["report"]:
+            Path(options["report"]).write_text(json.dumps(report, indent=2))
+        for error in report["errors"][:20]:
+            self.stderr.write(f"Row {error['row']}: {json.dumps(error['errors'])}")
+
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{report['created']} employees onboarded, {report['failed']} rows rejected."
+            )
+        )
@@ -0,0 +1,79 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from employee_management_system.loadtest import LoadTest, discover_routes, login
+
+
+class Command(BaseCommand):
+    help = "Load test every API route of a running server and report latency per route."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--base-url", default="http://127.0.0.1:8000")
+        parser.add_argument("--username", required=True)
+        parser.add_argument("--password", required=True)
+        parser.add_argument("--concurrency", type=int, default=16)
+        parser.add_argument("--requests", type=int, default=200, help="Per route.")
+        parser.add_argument("--page-size", type=int, default=20)
+        parser.add_argument("--timeout", type=float, default=30)
+        parser.add_argument(
+            "--route",
+            action="append",
+            help="Only run routes whose name or path contains this; may be repeated.",
+        )
+        parser.add_argument("--output", help="Also write the report as JSON here.")
+
+    def handle(self, *args, **options):
+        try:
+            token = login(
+                options["base_url"],
+                options["username"],
+                options["password"],
+                options["timeout"],
+            )
+        except (OSError, ValueError) as e:
+            raise CommandError(f"Could not log in: {e}")
+
+        routes, skipped = discover_routes(
+            options["username"], options["password"], options["page_size"]
+        )
+        if options["route"]:
+            routes = [
+                route
+                for route in routes
+                if any(
+                    text in route.name or text in route.path
+                    for text in options["route"]
+                )
+            ]
+        if not routes:
+            raise CommandError("No routes to run.")
+
+        report = LoadTest(
+            options["base_url"],
+            token,
+            concurrency=options["concurrency"],
+            timeout=options["timeout"],
+        ).run(routes, options["requests"])
+        report["skipped"] = skipped
+
+        self.stdout.write(
+            f"{'route':<28} {'method':<6} {'req':>6} {'err':>5} {'rps':>8} "
+            f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+        )
+        for name, stats in report["routes"].items():
+            self.stdout.write(
+                f"{name:<28} {stats['method']:<6} {stats['count']:>6} "
+                f"{stats['errors']:>5} {stats['throughput_per_s']:>8.1f} "
+                f"{stats['p50_ms']:>9.1f} {stats['p95_ms']:>9.1f} {stats['p99_ms']:>9.1f}"
+            )
+        self.stdout.write(
+            f"{report['throughput_per_s']:.1f} requests/s overall "
+            f"over {report['elapsed_s']:.1f}s"
+        )
+        if skipped:
+            self.stdout.write(f"Skipped write routes: {', '.join(skipped)}")
+
+        if options["output"]:
+            with open(options["output"], "w") as output:
+                json.dump(report, output, indent=2)
@@ -0,0 +1,97 @@
+import csv
+import datetime
+import json
+import time
+
+from django.core.management.base import BaseCommand, CommandError
+from django.core.serializers.json import DjangoJSONEncoder
+from django.utils.dateparse import parse_date
+
+from employees.models import Salary
+from employees.payroll import GROUPS, INTERVALS, payroll_report
+
+
+def date_argument(value):
+    try:
+        parsed = parse_date(value)
+    except ValueError:
+        parsed = None
+    if parsed is None:
+        raise CommandError(f"Invalid date: {value} (expected YYYY-MM-DD).")
+    return parsed
+
+
+class Command(BaseCommand):
+    help = "Compute payroll cost per period and department or employee from salary history."
+
+    def add_arguments(self, parser):
+        year = datetime.date.today().year
+        parser.add_argument("--start", default=f"{year}-01-01")
+        parser.add_argument("--end", default=f"{year}-12-31")
+        parser.add_argument("--interval", choices=INTERVALS, default="month")
+        parser.add_argument("--group-by", choices=GROUPS, default="department")
+        parser.add_argument("--department", type=int, help="Limit to one department.")
+        parser.add_argument(
+            "--format", choices=("table", "csv", "json"), default="table"
+        )
+
+    def handle(self, *args, **options):
+        start = date_argument(options["start"])
+        end = date_argument(options["end"])
+
+        queryset = Salary.objects.all()
+        if options["department"]:
+            queryset = queryset.filter(employee__department_id=options["department"])
+
+        started = time.perf_counter()
+        try:
+            report = payroll_report(
+                start,
+                end,
+                interval=options["interval"],
+                group_by=options["group_by"],
+                queryset=queryset,
+            )
+        except ValueError as e:
+            raise CommandError(str(e))
+        elapsed = time.perf_counter() - started
+
+        if options["format"] == "json":
+            self.stdout.write(json.dumps(report, cls=DjangoJSONEncoder, indent=2))
+            return
+
+        header = [
+            options["group_by"],
+            *[period["start"].isoformat() for period in report["periods"]],
+            "total",
+        ]
+        rows = [
+            [group.get("name") or group["id"], *group["by_period"], group["total"]]
+            for group in report["groups"]
+        ]
+        rows.append(["total", *report["by_period"], report["total"]])
+
+        if options["format"] == "csv":
+            writer = csv.writer(self.stdout)
+            writer.writerow(header)
+            writer.writerows(rows)
+            return
+
+        for row in [header, *rows]:
+            self.stdout.write(
+                "  ".join(
+                    f"{value:>14.2f}" if isinstance(value, float) else f"{value!s:>14}"
+                    for value in row
+                )
+            )
+        for value, count in report["unrecognized_pay_periods"].items():
+            self.stdout.write(
+                self.style.WARNING(
+                    f"Skipped {count} salaries with unknown pay period {value!r}."
+                )
+            )
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"{report['salaries']} salaries aggregated in {elapsed:.2f}s."
+            )
+        )
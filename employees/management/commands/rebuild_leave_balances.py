@@ -0,0 +1,25 @@
+from django.core.management.base import BaseCommand
+
+from employees.balances import rebuild_leave_balances
+from employees.models import Employee
+
+
+class Command(BaseCommand):
+    help = "Recompute the leave balance ledger from the leave history."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--employee",
+            type=int,
+            action="append",
+            dest="employees",
+            help="Only rebuild this employee's balances; may be repeated.",
+        )
+        parser.add_argument("--batch-size", type=int, default=1000)
+
+    def handle(self, *args, **options):
+        employees = None
+        if options["employees"]:
+            employees = Employee.objects.filter(pk__in=options["employees"])
+        rows = rebuild_leave_balances(employees, batch_size=options["batch_size"])
+        self.stdout.write(self.style.SUCCESS(f"Rebuilt {rows} leave balances."))
@@ -0,0 +1,16 @@
+from django.core.management.base import BaseCommand
+
+from employees.search import refresh_employee_search, refresh_leave_search
+
+
+class Command(BaseCommand):
+    help = "Rebuild the stored search documents and vectors for employees and leaves."
+
+    def handle(self, *args, **options):
+        employees = refresh_employee_search()
+        leaves = refresh_leave_search()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Rebuilt search index for {employees} employees and {leaves} leaves."
+            )
+        )
@@ -0,0 +1,47 @@
+import json
+
+from django.core.management.base import BaseCommand, CommandError
+
+from employee_management_system.benchmarks import (BENCHMARKS, DEFAULT_SIZES,
+                                                   run_benchmarks)
+
+
+class Command(BaseCommand):
+    help = "Time serializers, permission checks and pagination and save the results as JSON."
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--output",
+            default="benchmark_results.json",
+            help="File to write the results to.",
+        )
+        parser.add_argument(
+            "--sizes",
+            default=",".join(str(size) for size in DEFAULT_SIZES),
+            help="Comma separated object counts to benchmark.",
+        )
+        parser.add_argument("--repeat", type=int, default=5)
+        parser.add_argument(
+            "--only",
+            action="append",
+            choices=sorted(BENCHMARKS),
+            help="Run only this benchmark; may be repeated.",
+        )
+
+    def handle(self, *args, **options):
+        try:
+            sizes = [int(size) for size in options["sizes"].split(",")]
+        except ValueError:
+            raise CommandError("--sizes must be a comma separated list of integers.")
+
+        results = run_benchmarks(
+            names=options["only"],
+            sizes=sizes,
+            repeat=options["repeat"],
+            stdout=self.stdout,
+        )
+        with open(options["output"], "w") as output:
+            json.dump(results, output, indent=2, sort_keys=True)
+        self.stdout.write(
+            self.style.SUCCESS(f"Wrote {len(results)} results to {options['output']}.")
+        )
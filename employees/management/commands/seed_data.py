@@ -0,0 +1,40 @@
+import time
+
+from django.core.management.base import BaseCommand
+
+from employees.seeding import Seeder
+
+
+class Command(BaseCommand):
+    help = "Generate synthetic departments, employees, salary histories and leaves."
+
+    def add_arguments(self, parser):
+        parser.add_argument("--users", type=int, default=200000)
+        parser.add_argument("--departments", type=int, default=500)
+        parser.add_argument("--salaries-per-employee", type=int, default=10)
+        parser.add_argument("--leaves-per-employee", type=int, default=5)
+        parser.add_argument("--batch-size", type=int, default=10000)
+        parser.add_argument(
+            "--password",
+            default="Passw0rd!",
+            help="Password shared by every generated user.",
+        )
+        parser.add_argument("--seed", type=int, default=0)
+
+    def handle(self, *args, **options):
+        started = time.perf_counter()
+        created = Seeder(
+            users=options["users"],
+            departments=options["departments"],
+            salaries_per_employee=options["salaries_per_employee"],
+            leaves_per_employee=options["leaves_per_employee"],
+            batch_size=options["batch_size"],
+            password=options["password"],
+            seed=options["seed"],
+            stdout=self.stdout,
+        ).run()
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Seeded {created} employees in {time.perf_counter() - started:.1f}s."
+            )
+        )
@@ -0,0 +1,133 @@
+import django.contrib.postgres.indexes
+import django.contrib.postgres.search
+from django.contrib.postgres.operations import TrigramExtension
+from django.contrib.postgres.search import SearchVector
+from django.db import migrations, models
+from django.db.models import F, OuterRef, Subquery, TextField, Value
+from django.db.models.functions import Coalesce, Concat, Lower
+
+
+def join_fields(*fields):
+    parts = []
+    for field in fields:
+        if parts:
+            parts.append(Value(" "))
+        parts.append(Coalesce(F(field), Value(""), output_field=TextField()))
+    return Concat(*parts, output_field=TextField())
+
+
+def populate_search_documents(apps, schema_editor):
+    User = apps.get_model("authentication", "User")
+    Department = apps.get_model("departments", "Department")
+    Employee = apps.get_model("employees", "Employee")
+    Leave = apps.get_model("employees", "Leave")
+
+    employee_user = User.objects.filter(pk=OuterRef("user_id")).annotate(
+        document=join_fields("first_name", "last_name", "email", "username")
+    )
+    department = Department.objects.filter(pk=OuterRef("department_id"))
+    employee_document = Lower(
+        Concat(
+            Coalesce(
+                Subquery(employee_user.values("document")[:1]),
+                Value(""),
+                output_field=TextField(),
+            ),
+            Value(" "),
+            Coalesce(
+                Subquery(department.values("name")[:1]),
+                Value(""),
+                output_field=TextField(),
+            ),
+            output_field=TextField(),
+        )
+    )
+
+    leave_user = User.objects.filter(employee__pk=OuterRef("employee_id")).annotate(
+        document=join_fields("first_name", "last_name")
+    )
+    leave_document = Lower(
+        Concat(
+            Coalesce(F("reason"), Value(""), output_field=TextField()),
+            Value(" "),
+            Coalesce(
+                Subquery(leave_user.values("document")[:1]),
+                Value(""),
+                output_field=TextField(),
+            ),
+            output_field=TextField(),
+        )
+    )
+
+    is_postgres = schema_editor.connection.vendor == "postgresql"
+    for model, document in ((Employee, employee_document), (Leave, leave_document)):
+        values = {"search_document": document}
+        if is_postgres:
+            values["search_vector"] = SearchVector(document, config="simple")
+        model.objects.using(schema_editor.connection.alias).update(**values)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("authentication", "0004_alter_user_first_name_alter_user_last_name"),
+        ("departments", "0002_alter_department_description"),
+        ("employees", "0002_alter_employee_hire_date_alter_leave_end_date_and_more"),
+    ]
+
+    operations = [
+        TrigramExtension(),
+        migrations.AddField(
+            model_name="employee",
+            name="search_document",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddField(
+            model_name="employee",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.AddField(
+            model_name="leave",
+            name="search_document",
+            field=models.TextField(blank=True, default="", editable=False),
+        ),
+        migrations.AddField(
+            model_name="leave",
+            name="search_vector",
+            field=django.contrib.postgres.search.SearchVectorField(
+                editable=False, null=True
+            ),
+        ),
+        migrations.RunPython(populate_search_documents, migrations.RunPython.noop),
+        migrations.AddIndex(
+            model_name="employee",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="employee_search_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="employee",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_document"],
+                name="employee_search_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="leave",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_vector"], name="leave_search_vector_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="leave",
+            index=django.contrib.postgres.indexes.GinIndex(
+                fields=["search_document"],
+                name="leave_search_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ),
+    ]
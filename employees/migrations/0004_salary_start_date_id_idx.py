@@ -0,0 +1,28 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:31
+
+import datetime
+import django.db.models.functions.comparison
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0003_employee_search_leave_search"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="salary",
+            index=models.Index(
+                models.OrderBy(
+                    django.db.models.functions.comparison.Coalesce(
+                        "start_date", models.Value(datetime.date(1, 1, 1))
+                    ),
+                    descending=True,
+                ),
+                models.F("id"),
+                name="salary_start_date_id_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,84 @@
+# Generated by Django 5.2.18 on 2026-10-18 05:38
+
+import django.contrib.postgres.fields
+from django.db import migrations, models
+
+PERMISSION_NAMES = {
+    "employee_list": "Can list all employees",
+    "employee_update": "Can update all employees",
+    "employee_create": "Can create employees",
+    "employee_destroy": "Can delete employees",
+    "salary_view_all": "Can view salaries of all employees",
+    "salary_update": "Can update salaries",
+    "salary_delete": "Can delete salaries",
+    "leave_view_all": "Can view all leave requests",
+    "leave_update_status": "Can update leave status",
+    "leave_delete": "Can delete leave records",
+    "department_create": "Can create departments",
+    "department_view_all": "Can view all departments",
+    "department_delete": "Can delete departments",
+    "department_update": "Can update departments",
+}
+
+
+def store_permission_names(apps, schema_editor):
+    """Rewrite permissions saved as keys into the names the model stores."""
+    Role = apps.get_model("employees", "Role")
+    roles = Role.objects.using(schema_editor.connection.alias).exclude(
+        permissions__isnull=True
+    )
+    for role in roles:
+        permissions = list(
+            dict.fromkeys(PERMISSION_NAMES.get(name, name) for name in role.permissions)
+        )
+        if permissions != role.permissions:
+            role.permissions = permissions
+            role.save(update_fields=["permissions"])
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0004_salary_start_date_id_idx"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="role",
+            name="permissions_version",
+            field=models.PositiveIntegerField(default=0, editable=False),
+        ),
+        migrations.AlterField(
+            model_name="role",
+            name="permissions",
+            field=django.contrib.postgres.fields.ArrayField(
+                base_field=models.CharField(
+                    choices=[
+                        ("Can list all employees", "Can list all employees"),
+                        ("Can update all employees", "Can update all employees"),
+                        ("Can create employees", "Can create employees"),
+                        ("Can delete employees", "Can delete employees"),
+                        (
+                            "Can view salaries of all employees",
+                            "Can view salaries of all employees",
+                        ),
+                        ("Can update salaries", "Can update salaries"),
+                        ("Can delete salaries", "Can delete salaries"),
+                        ("Can view all leave requests", "Can view all leave requests"),
+                        ("Can update leave status", "Can update leave status"),
+                        ("Can delete leave records", "Can delete leave records"),
+                        ("Can create departments", "Can create departments"),
+                        ("Can view all departments", "Can view all departments"),
+                        ("Can delete departments", "Can delete departments"),
+                        ("Can update departments", "Can update departments"),
+                    ],
+                    max_length=255,
+                ),
+                blank=True,
+                help_text="List of permissions assigned to this role",
+                null=True,
+                size=None,
+            ),
+        ),
+        migrations.RunPython(store_permission_names, migrations.RunPython.noop),
+    ]
@@ -0,0 +1,58 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:02
+
+import datetime
+import django.db.models.deletion
+import django.db.models.functions.comparison
+from django.db import migrations, models
+from django.db.models import OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+
+
+def populate_current_salaries(apps, schema_editor):
+    Employee = apps.get_model("employees", "Employee")
+    Salary = apps.get_model("employees", "Salary")
+
+    latest = Salary.objects.filter(employee_id=OuterRef("pk")).order_by(
+        Coalesce("start_date", Value(datetime.date.min)).desc(), "-id"
+    )
+    Employee.objects.using(schema_editor.connection.alias).update(
+        current_salary=Subquery(latest.values("pk")[:1])
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0006_updated_at"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="employee",
+            name="current_salary",
+            field=models.ForeignKey(
+                blank=True,
+                editable=False,
+                help_text="Latest salary record, kept up to date by refresh_current_salaries",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="+",
+                to="employees.salary",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="salary",
+            index=models.Index(
+                models.F("employee"),
+                models.OrderBy(
+                    django.db.models.functions.comparison.Coalesce(
+                        "start_date", models.Value(datetime.date(1, 1, 1))
+                    ),
+                    descending=True,
+                ),
+                models.OrderBy(models.F("id"), descending=True),
+                name="salary_employee_latest_idx",
+            ),
+        ),
+        migrations.RunPython(populate_current_salaries, migrations.RunPython.noop),
+    ]
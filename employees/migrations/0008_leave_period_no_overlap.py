@@ -0,0 +1,92 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:06
+
+import django.contrib.postgres.constraints
+import django.contrib.postgres.fields.ranges
+import django.db.models.functions.comparison
+import employees.models
+from django.contrib.postgres.operations import BtreeGistExtension
+from django.db import migrations, models
+
+
+def check_overlapping_leaves(apps, schema_editor):
+    """
+    Refuse to add the constraint while active leaves of an employee
+    overlap, listing each leave with the one it overlaps (approved leaves,
+    then older ones, being kept) so operators can cancel or correct them.
+    """
+    Leave = apps.get_model("employees", "Leave")
+    leaves = Leave.objects.using(schema_editor.connection.alias)
+    active = leaves.filter(start_date__isnull=False).exclude(status="Cancelled")
+
+    rows = active.order_by("employee_id").values_list(
+        "employee_id", "id", "status", "start_date", "end_date"
+    )
+    by_employee = {}
+    for employee_id, *row in rows.iterator():
+        by_employee.setdefault(employee_id, []).append(row)
+
+    conflicts = []
+    for employee_rows in by_employee.values():
+        kept = []
+        for pk, status, start, end in sorted(
+            employee_rows, key=lambda row: (row[1] != "Approved", row[0])
+        ):
+            end = max(end or start, start)
+            overlapped = [
+                kept_pk
+                for kept_pk, kept_start, kept_end in kept
+                if start <= kept_end and kept_start <= end
+            ]
+            if overlapped:
+                conflicts.append(f"{pk} (overlaps {overlapped[0]})")
+            else:
+                kept.append((pk, start, end))
+
+    if conflicts:
+        raise RuntimeError(
+            "These active leaves overlap another leave of the same employee "
+            "and would violate leave_no_overlap. Cancel or correct them, then "
+            f"run the migration again: {', '.join(conflicts)}."
+        )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0007_employee_current_salary"),
+    ]
+
+    operations = [
+        BtreeGistExtension(),
+        migrations.RunPython(check_overlapping_leaves, migrations.RunPython.noop),
+        migrations.AddField(
+            model_name="leave",
+            name="period",
+            field=models.GeneratedField(
+                db_persist=True,
+                expression=employees.models.DateRangeFunc(
+                    "start_date",
+                    django.db.models.functions.comparison.Greatest(
+                        django.db.models.functions.comparison.Coalesce(
+                            "end_date", "start_date"
+                        ),
+                        "start_date",
+                    ),
+                    models.Value("[]"),
+                ),
+                output_field=django.contrib.postgres.fields.ranges.DateRangeField(),
+            ),
+        ),
+        migrations.AddConstraint(
+            model_name="leave",
+            constraint=django.contrib.postgres.constraints.ExclusionConstraint(
+                condition=models.Q(
+                    ("start_date__isnull", False),
+                    models.Q(("status", "Cancelled"), _negated=True),
+                ),
+                expressions=[("employee", "="), ("period", "&&")],
+                name="leave_no_overlap",
+                violation_error_message="This leave overlaps another leave of the employee.",
+            ),
+        ),
+    ]
@@ -0,0 +1,22 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:08
+
+import django.contrib.postgres.indexes
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0008_leave_period_no_overlap"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="leave",
+            index=django.contrib.postgres.indexes.GistIndex(
+                condition=models.Q(("status", "Cancelled"), _negated=True),
+                fields=["period"],
+                name="leave_active_period_idx",
+            ),
+        ),
+    ]
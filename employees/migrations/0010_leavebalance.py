@@ -0,0 +1,88 @@
+# Generated by Django 5.2.18 on 2026-10-18 06:11
+
+import datetime
+from collections import defaultdict
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+def populate_leave_balances(apps, schema_editor):
+    Leave = apps.get_model("employees", "Leave")
+    LeaveBalance = apps.get_model("employees", "LeaveBalance")
+    alias = schema_editor.connection.alias
+    fields = {"Approved": "approved_days", "Pending": "pending_days"}
+
+    balances = defaultdict(lambda: defaultdict(int))
+    leaves = (
+        Leave.objects.using(alias)
+        .filter(status__in=list(fields))
+        .exclude(start_date=None)
+        .values_list("employee_id", "leave_type", "status", "start_date", "end_date")
+    )
+    for employee_id, leave_type, status, start_date, end_date in leaves.iterator():
+        end_date = max(end_date or start_date, start_date)
+        while start_date <= end_date:
+            year_end = min(datetime.date(start_date.year, 12, 31), end_date)
+            key = (employee_id, start_date.year, leave_type or "")
+            balances[key][fields[status]] += (year_end - start_date).days + 1
+            start_date = year_end + datetime.timedelta(days=1)
+
+    LeaveBalance.objects.using(alias).bulk_create(
+        [
+            LeaveBalance(
+                employee_id=employee_id, year=year, leave_type=leave_type, **days
+            )
+            for (employee_id, year, leave_type), days in balances.items()
+        ],
+        batch_size=1000,
+    )
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("employees", "0009_leave_active_period_idx"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="LeaveBalance",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                ("year", models.PositiveSmallIntegerField()),
+                (
+                    "leave_type",
+                    models.CharField(blank=True, default="", max_length=100),
+                ),
+                ("approved_days", models.IntegerField(default=0)),
+                ("pending_days", models.IntegerField(default=0)),
+                ("updated_at", models.DateTimeField(auto_now=True)),
+                (
+                    "employee",
+                    models.ForeignKey(
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="leave_balances",
+                        to="employees.employee",
+                    ),
+                ),
+            ],
+            options={
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("employee", "year", "leave_type"),
+                        name="leave_balance_unique",
+                    )
+                ],
+            },
+        ),
+        migrations.RunPython(populate_leave_balances, migrations.RunPython.noop),
+    ]
@@ -1,7 +1,14 @@
 # models.py
+import datetime
+
 from django.conf import settings
-from django.contrib.postgres.fields import ArrayField
+from django.contrib.postgres.constraints import ExclusionConstraint
+from django.contrib.postgres.fields import ArrayField, DateRangeField, RangeOperators
+from django.contrib.postgres.indexes import GinIndex, GistIndex
+from django.contrib.postgres.search import SearchVectorField
 from django.db import models
+from django.db.models import F, Func, Q, Value
+from django.db.models.functions import Coalesce, Greatest
 
 from departments.models import Department
 
@@ -35,12 +42,21 @@ class Role(models.Model):
         null=True,
         help_text="List of permissions assigned to this role",
     )
+    permissions_version = models.PositiveIntegerField(default=0, editable=False)
 
     def __str__(self):
         return self.name
 
+    def save(self, *args, **kwargs):
+        self.permissions_version += 1
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None:
+            kwargs["update_fields"] = {*update_fields, "permissions_version"}
+        super().save(*args, **kwargs)
+
     def get_permission_keys(self):
-        return [key for key, value in CUSTOM_PERMISSIONS.items() if value in self.permissions]
+        permissions = self.permissions or []
+        return [key for key, value in CUSTOM_PERMISSIONS.items() if value in permissions or key in permissions]
 
     def set_permissions_from_keys(self, permission_keys):
         self.permissions = [CUSTOM_PERMISSIONS[key] for key in permission_keys if key in CUSTOM_PERMISSIONS]
@@ -58,6 +74,44 @@ class Employee(models.Model):
         help_text="Each employee must belong to one department",
     )
     hire_date = models.DateField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+    current_salary = models.ForeignKey(
+        "Salary",
+        on_delete=models.SET_NULL,
+        null=True,
+        blank=True,
+        editable=False,
+        related_name="+",
+        help_text="Latest salary record, kept up to date by refresh_current_salaries",
+    )
+    search_document = models.TextField(blank=True, default="", editable=False)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        indexes = [
+            GinIndex(fields=["search_vector"], name="employee_search_vector_idx"),
+            GinIndex(
+                fields=["search_document"],
+                name="employee_search_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
+
+    def save(self, *args, **kwargs):
+        # ``current_salary`` is only written by refresh_current_salaries, so
+        # saving a loaded employee must not write back a stale pointer.
+        if not self._state.adding and kwargs.get("update_fields") is None:
+            kwargs["update_fields"] = [
+                field.name
+                for field in self._meta.concrete_fields
+                if not field.primary_key and field.name != "current_salary"
+            ]
+        super().save(*args, **kwargs)
+
+
+def salary_start_date_sort_key():
+    """Salary start date with missing dates sorting as the oldest."""
+    return Coalesce("start_date", Value(datetime.date.min))
 
 
 class Salary(models.Model):
@@ -69,11 +123,44 @@ class Salary(models.Model):
     pay_period = models.CharField(max_length=50, null=True, blank=True)
     start_date = models.DateField(null=True, blank=True)
     end_date = models.DateField(null=True, blank=True)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        indexes = [
+            models.Index(
+                salary_start_date_sort_key().desc(),
+                "id",
+                name="salary_start_date_id_idx",
+            ),
+            models.Index(
+                "employee",
+                salary_start_date_sort_key().desc(),
+                F("id").desc(),
+                name="salary_employee_latest_idx",
+            ),
+        ]
 
     def __str__(self):
         return f"Salary for {self.employee.user.username}"
 
 
+class DateRangeFunc(Func):
+    function = "DATERANGE"
+    output_field = DateRangeField()
+
+
+def leave_period():
+    """
+    Inclusive date range of a leave; a missing or earlier end date makes it a
+    single day.
+    """
+    return DateRangeFunc(
+        "start_date",
+        Greatest(Coalesce("end_date", "start_date"), "start_date"),
+        Value("[]"),
+    )
+
+
 class Leave(models.Model):
     LEAVE_STATUS_CHOICES = [
         ("Pending", "Pending"),
@@ -92,6 +179,69 @@ class Leave(models.Model):
     status = models.CharField(
         max_length=10, choices=LEAVE_STATUS_CHOICES, default="Pending"
     )
+    updated_at = models.DateTimeField(auto_now=True)
+    period = models.GeneratedField(
+        expression=leave_period(),
+        output_field=DateRangeField(),
+        db_persist=True,
+    )
+    search_document = models.TextField(blank=True, default="", editable=False)
+    search_vector = SearchVectorField(null=True, editable=False)
+
+    class Meta:
+        constraints = [
+            ExclusionConstraint(
+                name="leave_no_overlap",
+                expressions=[
+                    ("employee", RangeOperators.EQUAL),
+                    ("period", RangeOperators.OVERLAPS),
+                ],
+                condition=Q(start_date__isnull=False) & ~Q(status="Cancelled"),
+                violation_error_message="This leave overlaps another leave of the employee.",
+            ),
+        ]
+        indexes = [
+            GinIndex(fields=["search_vector"], name="leave_search_vector_idx"),
+            GistIndex(
+                fields=["period"],
+                name="leave_active_period_idx",
+                condition=~Q(status="Cancelled"),
+            ),
+            GinIndex(
+                fields=["search_document"],
+                name="leave_search_trgm_idx",
+                opclasses=["gin_trgm_ops"],
+            ),
+        ]
 
     def __str__(self):
         return f"Leave ({self.leave_type}) for {self.employee.user.username}"
+
+
+class LeaveBalance(models.Model):
+    """
+    Days of leave taken by an employee in a calendar year, per leave type.
+    Rows are kept up to date as leaves are saved and deleted, see
+    ``employees.balances``.
+    """
+
+    employee = models.ForeignKey(
+        Employee, on_delete=models.CASCADE, related_name="leave_balances"
+    )
+    year = models.PositiveSmallIntegerField()
+    leave_type = models.CharField(max_length=100, blank=True, default="")
+    approved_days = models.IntegerField(default=0)
+    pending_days = models.IntegerField(default=0)
+    updated_at = models.DateTimeField(auto_now=True)
+
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(
+                fields=["employee", "year", "leave_type"],
+                name="leave_balance_unique",
+            ),
+        ]
+
+    def __str__(self):
+        leave_type = self.leave_type or "Leave"
+        return f"{leave_type} balance {self.year} for employee {self.employee_id}"
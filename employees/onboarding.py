@@ -0,0 +1,237 @@
+import csv
+import io
+import json
+
+from django.conf import settings
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+
+from authentication.hashing import hash_passwords, password_hashing_pool
+from authentication.models import User
+from departments.models import Department
+from departments.stats import count_new_employees
+from employee_management_system.response_cache import bump_version
+
+from .models import Employee, Role, Salary
+from .salaries import refresh_current_salaries
+from .search import refresh_employee_search
+from .serializers import EmployeeImportSerializer
+
+
+def clean_rows(rows):
+    """Drop blank cells so optional columns can be left empty."""
+    return [
+        (
+            {
+                key: value
+                for key, value in row.items()
+                if key and value is not None and value != ""
+            }
+            if isinstance(row, dict)
+            else row
+        )
+        for row in rows
+    ]
+
+
+def parse_rows(content, file_format):
+    """Parse CSV or JSON text into a list of row dicts."""
+    if file_format == "csv":
+        return clean_rows(csv.DictReader(io.StringIO(content)))
+
+    rows = json.loads(content)
+    if isinstance(rows, dict):
+        rows = rows.get("employees")
+    if not isinstance(rows, list):
+        raise ValueError("Expected a list of employees.")
+    return clean_rows(rows)
+
+
+class BulkOnboarding:
+    """
+    Onboard many employees at once.
+
+    Rows are validated and inserted in chunks: per-row checks run through
+    ``EmployeeImportSerializer``, uniqueness, department and role checks run as
+    one query per chunk, passwords are hashed across a process pool and users,
+    employees and salaries are written with ``bulk_create`` inside one
+    transaction per chunk. ``run`` returns a report with the created count and
+    the errors of every rejected row (1-based row numbers).
+
+    Passwords are hashed inline unless ``workers`` is above one. Starting a
+    process pool costs seconds of interpreter and Django start-up, so only the
+    ``import_employees`` command asks for one; web requests hash inline.
+    """
+
+    def __init__(self, chunk_size=None, workers=None):
+        self.chunk_size = chunk_size or getattr(
+            settings, "BULK_ONBOARDING_CHUNK_SIZE", 500
+        )
+        self.workers = workers or 1
+        self.inline_hash_limit = getattr(
+            settings, "BULK_ONBOARDING_INLINE_HASH_LIMIT", 20
+        )
+
+    def run(self, rows):
+        self.report = {"created": 0, "failed": 0, "errors": []}
+        self.seen_usernames, self.seen_emails, self.new_managers = set(), set(), set()
+
+        executor = None
+        if len(rows) > self.inline_hash_limit and self.workers > 1:
+            executor = password_hashing_pool(self.workers)
+        try:
+            for start in range(0, len(rows), self.chunk_size):
+                self.process_chunk(
+                    rows[start : start + self.chunk_size], start, executor
+                )
+        finally:
+            if executor:
+                executor.shutdown()
+
+        self.report["errors"].sort(key=lambda error: error["row"])
+        return self.report
+
+    def reject(self, row_number, errors):
+        self.report["failed"] += 1
+        self.report["errors"].append({"row": row_number, "errors": errors})
+
+    def process_chunk(self, rows, offset, executor):
+        valid = []
+        for index, row in enumerate(rows, start=offset + 1):
+            if not isinstance(row, dict):
+                self.reject(index, {"detail": ["Expected an object."]})
+                continue
+            serializer = EmployeeImportSerializer(data=row)
+            if serializer.is_valid():
+                valid.append((index, serializer.validated_data))
+            else:
+                self.reject(index, serializer.errors)
+
+        valid = self.check_against_database(valid)
+        if not valid:
+            return
+
+        hashes = hash_passwords(
+            [data.get("password") for _, data in valid], executor, self.workers
+        )
+
+        try:
+            with transaction.atomic():
+                employees = self.insert(valid, hashes)
+        except IntegrityError as e:
+            for index, _ in valid:
+                self.reject(index, {"detail": [str(e)]})
+            return
+
+        created = Employee.objects.filter(
+            pk__in=[employee.pk for employee in employees]
+        )
+        refresh_employee_search(created)
+        refresh_current_salaries(created)
+        count_new_employees(employees)
+        bump_version(Employee)
+        self.report["created"] += len(employees)
+
+    def check_against_database(self, valid):
+        """Reject rows clashing with existing data or earlier rows of the import."""
+        usernames = {data["username"] for _, data in valid}
+        emails = {data["email"] for _, data in valid if data.get("email")}
+        department_ids = {data["department"] for _, data in valid}
+        role_ids = {data["role"] for _, data in valid if data.get("role")}
+
+        taken_usernames = set(
+            User.objects.filter(username__in=usernames).values_list(
+                "username", flat=True
+            )
+        )
+        taken_emails = set(
+            User.objects.filter(email__in=emails).values_list("email", flat=True)
+        )
+        departments = Department.objects.in_bulk(department_ids)
+        roles = set(Role.objects.filter(pk__in=role_ids).values_list("pk", flat=True))
+
+        accepted = []
+        for index, data in valid:
+            errors = {}
+            username, email = data["username"], data.get("email")
+            department = departments.get(data["department"])
+
+            if username in taken_usernames or username in self.seen_usernames:
+                errors["username"] = ["A user with this username already exists."]
+            if email and (email in taken_emails or email in self.seen_emails):
+                errors["email"] = ["A user with this email already exists."]
+            if department is None:
+                errors["department"] = [
+                    f"Department with ID {data['department']} does not exist."
+                ]
+            elif data.get("manager") and (
+                department.manager_id or department.pk in self.new_managers
+            ):
+                errors["manager"] = ["This department already has a manager."]
+            if data.get("role") and data["role"] not in roles:
+                errors["role"] = [f"Role with ID {data['role']} does not exist."]
+
+            if errors:
+                self.reject(index, errors)
+                continue
+
+            self.seen_usernames.add(username)
+            if email:
+                self.seen_emails.add(email)
+            if data.get("manager"):
+                self.new_managers.add(department.pk)
+            accepted.append((index, {**data, "department": department}))
+
+        return accepted
+
+    def insert(self, valid, hashes):
+        users = [
+            User(
+                username=data["username"],
+                email=data.get("email"),
+                first_name=data.get("first_name"),
+                last_name=data.get("last_name"),
+                password=password_hash,
+                role_id=data.get("role"),
+            )
+            for (_, data), password_hash in zip(valid, hashes)
+        ]
+        User.objects.bulk_create(users)
+
+        employees = Employee.objects.bulk_create(
+            [
+                Employee(
+                    user=user,
+                    department=data["department"],
+                    hire_date=data.get("hire_date"),
+                    manager=data.get("manager", False),
+                )
+                for (_, data), user in zip(valid, users)
+            ]
+        )
+
+        Salary.objects.bulk_create(
+            [
+                Salary(
+                    employee=employee,
+                    pay_rate=data["pay_rate"],
+                    pay_period=data.get("pay_period"),
+                    start_date=data.get("salary_start_date"),
+                    end_date=data.get("salary_end_date"),
+                )
+                for (_, data), employee in zip(valid, employees)
+                if data.get("pay_rate") is not None
+            ]
+        )
+
+        managed = []
+        for (_, data), user in zip(valid, users):
+            if data.get("manager"):
+                data["department"].manager = user
+                data["department"].updated_at = timezone.now()
+                managed.append(data["department"])
+        if managed:
+            Department.objects.bulk_update(managed, ["manager", "updated_at"])
+            bump_version(Department)
+
+        return employees
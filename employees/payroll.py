@@ -0,0 +1,336 @@
+import calendar
+import datetime
+import itertools
+
+from django.conf import settings
+from django.core.exceptions import ImproperlyConfigured
+from django.db.models import Case, CharField, F, Func, Q, Value, When, Window
+from django.db.models.functions import Lead, Lower
+from django.db.models.lookups import Exact
+
+from departments.models import Department
+
+from .models import Salary, salary_start_date_sort_key
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+# Pay periods per year for every recognised ``Salary.pay_period``; hourly and
+# daily rates are scaled by the configured working hours and days.
+PAY_PERIODS = {
+    "hourly": None,
+    "daily": None,
+    "weekly": 52,
+    "biweekly": 26,
+    "semimonthly": 24,
+    "monthly": 12,
+    "quarterly": 4,
+    "annual": 1,
+}
+
+PAY_PERIOD_ALIASES = {
+    "hour": "hourly",
+    "perhour": "hourly",
+    "day": "daily",
+    "perday": "daily",
+    "week": "weekly",
+    "perweek": "weekly",
+    "fortnightly": "biweekly",
+    "twicemonthly": "semimonthly",
+    "month": "monthly",
+    "permonth": "monthly",
+    "quarter": "quarterly",
+    "year": "annual",
+    "yearly": "annual",
+    "annually": "annual",
+    "peryear": "annual",
+}
+
+INTERVALS = ("month", "quarter", "year")
+
+GROUPS = ("department", "employee")
+
+LOAD_CHUNK_SIZE = 10000
+
+
+def normalize_pay_period(value):
+    """Map free-text pay periods such as ``Bi-Weekly`` to a ``PAY_PERIODS`` key."""
+    if not value:
+        return getattr(settings, "PAYROLL_DEFAULT_PAY_PERIOD", "monthly")
+    key = "".join(character for character in value.lower() if character.isalpha())
+    return PAY_PERIOD_ALIASES.get(key, key)
+
+
+def periods_per_year(pay_period):
+    if pay_period == "hourly":
+        return getattr(settings, "PAYROLL_HOURS_PER_YEAR", 2080)
+    if pay_period == "daily":
+        return getattr(settings, "PAYROLL_DAYS_PER_YEAR", 260)
+    return PAY_PERIODS.get(pay_period)
+
+
+def annual_pay(prefix=""):
+    """
+    Annual amount of the salary reached through ``prefix`` as a database
+    expression, scaled with the same pay period factors as ``PayrollEngine``.
+    Unrecognised pay periods count as nothing.
+    """
+    pay_period = Lower(
+        Func(
+            F(f"{prefix}pay_period"),
+            Value("[^A-Za-z]"),
+            Value(""),
+            Value("g"),
+            function="REGEXP_REPLACE",
+            output_field=CharField(),
+        )
+    )
+    names = {**{name: name for name in PAY_PERIODS}, **PAY_PERIOD_ALIASES}
+    default = periods_per_year(normalize_pay_period(None)) or 0
+    factor = Case(
+        When(
+            Q(**{f"{prefix}pay_period__isnull": True})
+            | Q(**{f"{prefix}pay_period": ""}),
+            then=Value(default),
+        ),
+        *[
+            When(Exact(pay_period, Value(key)), then=Value(periods_per_year(name)))
+            for key, name in names.items()
+            if periods_per_year(name)
+        ],
+        default=Value(0),
+    )
+    return F(f"{prefix}pay_rate") * factor
+
+
+EPOCH = datetime.date(1970, 1, 1)
+
+
+def day_number(value):
+    return (value - EPOCH).days
+
+
+def to_days(values, default):
+    """Dates as days since 1970-01-01, ``None`` becoming ``default``."""
+    return np.array(
+        [default if value is None else (value - EPOCH).days for value in values],
+        dtype=np.int64,
+    )
+
+
+def count_periods(start, end, interval):
+    """Number of periods ``split_periods`` cuts ``start``..``end`` into."""
+    months = {"month": 1, "quarter": 3, "year": 12}[interval]
+    first = (start.year * 12 + start.month - 1) // months
+    last = (end.year * 12 + end.month - 1) // months
+    return last - first + 1
+
+
+def concatenate(chunks, dtype="int64"):
+    return np.concatenate(chunks) if chunks else np.array([], dtype=dtype)
+
+
+def split_periods(start, end, interval):
+    """Split ``start``..``end`` (inclusive) at calendar month, quarter or year ends."""
+    months = {"month": 1, "quarter": 3, "year": 12}[interval]
+    periods = []
+    period_start = start
+    while period_start <= end:
+        month = (period_start.month - 1) // months * months + months
+        period_end = datetime.date(
+            period_start.year,
+            month,
+            calendar.monthrange(period_start.year, month)[1],
+        )
+        periods.append((period_start, min(period_end, end)))
+        if period_end >= end:
+            break
+        period_start = period_end + datetime.timedelta(days=1)
+    return periods
+
+
+class PayrollEngine:
+    """
+    Payroll cost of a salary queryset between two dates.
+
+    Every salary is turned into an annual amount from its pay period and
+    prorated by calendar days over the ``interval`` periods of the range,
+    a full calendar year costing exactly the annual amount. A salary stops
+    the day before the employee's next salary starts, even when its
+    ``end_date`` was never set, so overlapping records are not paid twice.
+    Rows are streamed from one query into NumPy vectors and costs are summed
+    per period, so memory grows with the salaries, not salaries x periods.
+    """
+
+    def __init__(self, start, end, interval="month"):
+        if np is None:
+            raise ImproperlyConfigured("The payroll engine requires NumPy.")
+        if interval not in INTERVALS:
+            raise ValueError(f"interval must be one of {', '.join(INTERVALS)}.")
+        if end < start:
+            raise ValueError("end must not be before start.")
+        max_periods = getattr(settings, "PAYROLL_MAX_PERIODS", 120)
+        if count_periods(start, end, interval) > max_periods:
+            raise ValueError(
+                f"The range cannot span more than {max_periods} {interval} periods."
+            )
+        self.start, self.end, self.interval = start, end, interval
+        self.periods = split_periods(start, end, interval)
+
+    def get_rows(self, queryset):
+        """
+        Salaries in effect at some point of the range. The next start date is
+        computed over every earlier salary of the employee, so history closed
+        before the range still ends the salaries it superseded.
+        """
+        sort_key = salary_start_date_sort_key()
+        return (
+            queryset.annotate(
+                sort_start=sort_key,
+                next_start=Window(
+                    Lead(sort_key),
+                    partition_by=[F("employee_id")],
+                    order_by=[sort_key.asc(), F("id").asc()],
+                ),
+            )
+            .filter(sort_start__lte=self.end)
+            .filter(Q(next_start__isnull=True) | Q(next_start__gt=self.start))
+            .order_by()
+            .values_list(
+                "employee_id",
+                "employee__department_id",
+                "sort_start",
+                "end_date",
+                "next_start",
+                "pay_rate",
+                "pay_period",
+            )
+        )
+
+    def load(self, queryset):
+        return self.load_rows(
+            self.get_rows(queryset).iterator(chunk_size=LOAD_CHUNK_SIZE)
+        )
+
+    def load_rows(self, rows):
+        """
+        Read ``get_rows`` tuples into one NumPy vector per column, a chunk at
+        a time, failing once salaries x periods exceeds
+        ``PAYROLL_MAX_CELLS``.
+        """
+        max_cells = getattr(settings, "PAYROLL_MAX_CELLS", 24_000_000)
+        max_rows = max_cells // len(self.periods)
+        first, last = day_number(self.start), day_number(self.end)
+        factors, self.unrecognized = {}, {}
+        columns = {
+            name: [] for name in ("employee", "department", "start", "end", "annual")
+        }
+
+        self.salary_count = 0
+        rows = iter(rows)
+        while chunk := list(itertools.islice(rows, LOAD_CHUNK_SIZE)):
+            self.salary_count += len(chunk)
+            if self.salary_count > max_rows:
+                raise ValueError(
+                    f"The range covers more than {max_rows} salaries over "
+                    f"{len(self.periods)} periods; narrow the range or filter it."
+                )
+            employees, departments, starts, ends, next_starts, rates, pay_periods = zip(
+                *chunk
+            )
+            for value in pay_periods:
+                if value not in factors:
+                    factors[value] = periods_per_year(normalize_pay_period(value))
+                if factors[value] is None:
+                    self.unrecognized[value] = self.unrecognized.get(value, 0) + 1
+
+            columns["employee"].append(np.array(employees, dtype=np.int64))
+            columns["department"].append(
+                np.array(
+                    [-1 if value is None else value for value in departments],
+                    dtype=np.int64,
+                )
+            )
+            columns["start"].append(np.maximum(to_days(starts, first), first))
+            columns["end"].append(
+                np.minimum(
+                    np.minimum(to_days(ends, last), to_days(next_starts, last + 1) - 1),
+                    last,
+                )
+            )
+            columns["annual"].append(
+                np.array(rates, dtype=np.float64)
+                * np.array(
+                    [factors[value] or 0 for value in pay_periods], dtype=np.float64
+                )
+            )
+
+        self.employee_ids = concatenate(columns["employee"])
+        self.department_ids = concatenate(columns["department"])
+        self.start_days = concatenate(columns["start"])
+        self.end_days = concatenate(columns["end"])
+        self.annual = concatenate(columns["annual"], "float64")
+        return self
+
+    def totals_by(self, keys):
+        """
+        Cost per key and period, accumulated one period at a time so memory
+        stays proportional to the salaries rather than salaries x periods.
+        """
+        ids, inverse = np.unique(keys, return_inverse=True)
+        totals = np.zeros((len(ids), len(self.periods)))
+        for index, (start, end) in enumerate(self.periods):
+            days = np.minimum(self.end_days, day_number(end)) - np.maximum(
+                self.start_days, day_number(start)
+            )
+            np.clip(days + 1, 0, None, out=days)
+            year_days = 366 if calendar.isleap(start.year) else 365
+            totals[:, index] = np.bincount(
+                inverse, weights=self.annual * days / year_days, minlength=len(ids)
+            )
+        return ids, totals
+
+    def report(self, group_by="department"):
+        """Totals for the range, per period and per department or employee."""
+        if group_by not in GROUPS:
+            raise ValueError(f"group_by must be one of {', '.join(GROUPS)}.")
+
+        keys = self.department_ids if group_by == "department" else self.employee_ids
+        ids, totals = self.totals_by(keys)
+        ids = [None if value == -1 else int(value) for value in ids]
+        names = {}
+        if group_by == "department":
+            names = dict(
+                Department.objects.filter(pk__in=ids).values_list("id", "name")
+            )
+
+        groups = []
+        for group_id, row in zip(ids, totals):
+            group = {"id": group_id}
+            if group_by == "department":
+                group["name"] = names.get(group_id)
+            group["total"] = round(float(row.sum()), 2)
+            group["by_period"] = [round(float(value), 2) for value in row]
+            groups.append(group)
+
+        return {
+            "start": self.start,
+            "end": self.end,
+            "interval": self.interval,
+            "group_by": group_by,
+            "periods": [{"start": start, "end": end} for start, end in self.periods],
+            "total": round(float(totals.sum()), 2),
+            "by_period": [round(float(value), 2) for value in totals.sum(axis=0)],
+            "salaries": self.salary_count,
+            "unrecognized_pay_periods": self.unrecognized,
+            "groups": groups,
+        }
+
+
+def payroll_report(start, end, interval="month", group_by="department", queryset=None):
+    """Run the engine over ``queryset`` (every salary by default)."""
+    if queryset is None:
+        queryset = Salary.objects.all()
+    return PayrollEngine(start, end, interval).load(queryset).report(group_by)
@@ -0,0 +1,21 @@
+from django.db.models import OuterRef, Subquery
+
+from .models import Employee, Salary, salary_start_date_sort_key
+
+
+def latest_salary():
+    """Subquery selecting the newest salary of the outer employee."""
+    salaries = Salary.objects.filter(employee_id=OuterRef("pk")).order_by(
+        salary_start_date_sort_key().desc(), "-id"
+    )
+    return Subquery(salaries.values("pk")[:1])
+
+
+def refresh_current_salaries(queryset=None):
+    """
+    Point ``current_salary`` of the given employees at their newest salary,
+    in a single UPDATE served by ``salary_employee_latest_idx``.
+    """
+    if queryset is None:
+        queryset = Employee.objects.all()
+    return queryset.update(current_salary=latest_salary())
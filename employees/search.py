@@ -0,0 +1,138 @@
+import operator
+from functools import reduce
+
+from django.contrib.postgres.search import (SearchQuery, SearchRank,
+                                            SearchVector,
+                                            TrigramWordSimilarity)
+from django.db import connection
+from django.db.models import F, OuterRef, Q, Subquery, TextField, Value
+from django.db.models.functions import Coalesce, Concat, Lower
+
+from authentication.models import User
+from departments.models import Department
+
+from .models import Employee, Leave
+
+SEARCH_CONFIG = "simple"
+
+EMPLOYEE_SEARCH_FIELDS = [
+    "user__first_name",
+    "user__last_name",
+    "user__email",
+    "user__username",
+    "department__name",
+]
+
+LEAVE_SEARCH_FIELDS = [
+    "reason",
+    "employee__user__first_name",
+    "employee__user__last_name",
+]
+
+
+def join_fields(*fields):
+    """Concatenate nullable text columns into a single space separated value."""
+    parts = []
+    for field in fields:
+        if parts:
+            parts.append(Value(" "))
+        parts.append(Coalesce(F(field), Value(""), output_field=TextField()))
+    return Concat(*parts, output_field=TextField())
+
+
+def employee_document():
+    user = User.objects.filter(pk=OuterRef("user_id")).annotate(
+        document=join_fields("first_name", "last_name", "email", "username")
+    )
+    department = Department.objects.filter(pk=OuterRef("department_id"))
+    return Lower(
+        Concat(
+            Coalesce(
+                Subquery(user.values("document")[:1]),
+                Value(""),
+                output_field=TextField(),
+            ),
+            Value(" "),
+            Coalesce(
+                Subquery(department.values("name")[:1]),
+                Value(""),
+                output_field=TextField(),
+            ),
+            output_field=TextField(),
+        )
+    )
+
+
+def leave_document():
+    user = User.objects.filter(employee__pk=OuterRef("employee_id")).annotate(
+        document=join_fields("first_name", "last_name")
+    )
+    return Lower(
+        Concat(
+            Coalesce(F("reason"), Value(""), output_field=TextField()),
+            Value(" "),
+            Coalesce(
+                Subquery(user.values("document")[:1]),
+                Value(""),
+                output_field=TextField(),
+            ),
+            output_field=TextField(),
+        )
+    )
+
+
+def _refresh(queryset, document):
+    values = {"search_document": document}
+    if connection.vendor == "postgresql":
+        values["search_vector"] = SearchVector(document, config=SEARCH_CONFIG)
+    return queryset.update(**values)
+
+
+def refresh_employee_search(queryset=None):
+    """Rebuild the stored search document and vector of the given employees."""
+    if queryset is None:
+        queryset = Employee.objects.all()
+    return _refresh(queryset, employee_document())
+
+
+def refresh_leave_search(queryset=None):
+    """Rebuild the stored search document and vector of the given leaves."""
+    if queryset is None:
+        queryset = Leave.objects.all()
+    return _refresh(queryset, leave_document())
+
+
+def search(queryset, query, fallback_fields):
+    """
+    Filter ``queryset`` down to the rows matching ``query``, best match first.
+
+    On PostgreSQL this uses the indexed ``search_vector`` (whole words) and the
+    trigram indexed ``search_document`` (substrings). Other databases fall back
+    to ``icontains`` over ``fallback_fields``.
+    """
+    if connection.vendor != "postgresql":
+        condition = reduce(
+            operator.or_,
+            (Q(**{f"{field}__icontains": query}) for field in fallback_fields),
+        )
+        return queryset.filter(condition).order_by("id")
+
+    search_query = SearchQuery(query, config=SEARCH_CONFIG, search_type="websearch")
+    return (
+        queryset.filter(
+            Q(search_vector=search_query) | Q(search_document__contains=query.lower())
+        )
+        .annotate(
+            search_rank=SearchRank(F("search_vector"), search_query)
+            + TrigramWordSimilarity(query.lower(), "search_document")
+        )
+        .order_by("-search_rank", "id")
+    )
+
+
+def search_employees(queryset, query):
+    return search(queryset, query, EMPLOYEE_SEARCH_FIELDS)
+
+
+def search_leaves(queryset, query):
+    return search(queryset, query, LEAVE_SEARCH_FIELDS)
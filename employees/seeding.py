@@ -0,0 +1,214 @@
+import datetime
+import random
+import uuid
+from decimal import Decimal
+
+from django.contrib.auth.hashers import make_password
+from django.db import transaction
+from django.utils import timezone
+
+from authentication.models import User
+from departments.models import Department
+from departments.stats import reconcile_department_stats
+from employee_management_system.bulk import copy_instances, reset_sequences
+from employee_management_system.response_cache import bump_version
+
+from .balances import rebuild_leave_balances
+from .models import Employee, Leave, Salary
+from .salaries import refresh_current_salaries
+from .search import refresh_employee_search, refresh_leave_search
+
+FIRST_NAMES = (
+    "Ali Amina Bilal Chen Dana Elena Farah Grace Hassan Ines James Kiran Lena "
+    "Musa Nora Omar Priya Quinn Rosa Sami Tara Umar Vera Wei Yusuf Zara"
+).split()
+LAST_NAMES = (
+    "Ahmed Brown Costa Diaz Evans Fischer Garcia Haddad Ito Jensen Khan Lopez "
+    "Martin Nguyen Okafor Patel Rossi Silva Tanaka Usman Varga Walker Yilmaz Zhou"
+).split()
+LEAVE_TYPES = ["Annual", "Sick", "Casual", "Unpaid", "Parental"]
+LEAVE_REASONS = [
+    "family trip",
+    "medical appointment",
+    "moving house",
+    "conference",
+    "personal errands",
+    "wedding",
+    "school holidays",
+]
+PAY_PERIODS = ["monthly", "monthly", "monthly", "biweekly", "hourly"]
+
+
+class Seeder:
+    """
+    Generate synthetic users, employees, salary histories and leaves.
+
+    Rows are built in memory one batch of employees at a time and written
+    with ``COPY`` on PostgreSQL (``bulk_create`` elsewhere). Every user shares
+    one password hash, and leaves of an employee never overlap. Search
+    documents are rebuilt once at the end.
+    """
+
+    def __init__(
+        self,
+        users=200000,
+        departments=500,
+        salaries_per_employee=10,
+        leaves_per_employee=5,
+        batch_size=10000,
+        password="Passw0rd!",
+        seed=0,
+        stdout=None,
+    ):
+        self.users = users
+        self.departments = departments
+        self.salaries_per_employee = salaries_per_employee
+        self.leaves_per_employee = leaves_per_employee
+        self.batch_size = batch_size
+        self.password_hash = make_password(password)
+        self.random = random.Random(seed)
+        self.stdout = stdout
+        self.prefix = uuid.uuid4().hex[:6]
+
+    def log(self, message):
+        if self.stdout:
+            self.stdout.write(message)
+
+    def run(self):
+        department_ids = self.create_departments()
+        next_employee_id = (
+            Employee.objects.order_by("-id").values_list("id", flat=True).first() or 0
+        ) + 1
+
+        created = 0
+        managers = {}
+        while created < self.users:
+            count = min(self.batch_size, self.users - created)
+            with transaction.atomic():
+                employees = self.create_batch(
+                    created, count, next_employee_id, department_ids, managers
+                )
+            next_employee_id += len(employees)
+            created += count
+            self.log(f"{created}/{self.users} employees")
+
+        reset_sequences(Employee, Salary, Leave)
+        self.assign_managers(managers)
+        bump_version(Employee)
+        bump_version(Leave)
+
+        self.log("Reconciling department statistics")
+        reconcile_department_stats(department_ids)
+
+        self.log("Rebuilding search documents")
+        refresh_employee_search()
+        refresh_leave_search()
+        return created
+
+    def create_departments(self):
+        departments = [
+            Department(
+                name=f"Department {self.prefix}-{index}",
+                description=f"Synthetic department {index}",
+            )
+            for index in range(self.departments)
+        ]
+        Department.objects.bulk_create(departments, batch_size=self.batch_size)
+        return [department.pk for department in departments]
+
+    def create_batch(self, offset, count, first_id, department_ids, managers):
+        now = timezone.now()
+        users, employees, salaries, leaves = [], [], [], []
+        for index in range(offset, offset + count):
+            first_name = self.random.choice(FIRST_NAMES)
+            last_name = self.random.choice(LAST_NAMES)
+            username = f"{first_name.lower()}.{last_name.lower()}.{self.prefix}{index}"
+            user = User(
+                id=uuid.uuid4(),
+                username=username,
+                email=f"{username}@example.com",
+                first_name=first_name,
+                last_name=last_name,
+                password=self.password_hash,
+                date_joined=now,
+                created_at=now,
+                updated_at=now,
+            )
+            users.append(user)
+
+            department_id = department_ids[index % len(department_ids)]
+            hire_date = datetime.date(2010, 1, 1) + datetime.timedelta(
+                days=self.random.randrange(5000)
+            )
+            employee = Employee(
+                id=first_id + index - offset,
+                user_id=user.id,
+                department_id=department_id,
+                hire_date=hire_date,
+                manager=department_id not in managers,
+            )
+            if employee.manager:
+                managers[department_id] = user.id
+            employees.append(employee)
+
+            salaries.extend(self.salary_history(employee))
+            leaves.extend(self.leave_history(employee))
+
+        copy_instances(User, users)
+        copy_instances(Employee, employees)
+        copy_instances(Salary, salaries)
+        copy_instances(Leave, leaves)
+        created = Employee.objects.filter(pk__range=(first_id, first_id + count - 1))
+        refresh_current_salaries(created)
+        rebuild_leave_balances(created)
+        return employees
+
+    def salary_history(self, employee):
+        pay_rate = Decimal(self.random.randrange(2000, 9000))
+        start = employee.hire_date
+        history = []
+        for step in range(self.salaries_per_employee):
+            end = start + datetime.timedelta(days=self.random.randrange(90, 400))
+            last = step == self.salaries_per_employee - 1
+            history.append(
+                Salary(
+                    employee_id=employee.id,
+                    pay_rate=pay_rate,
+                    pay_period=self.random.choice(PAY_PERIODS),
+                    start_date=start,
+                    end_date=None if last else end,
+                )
+            )
+            pay_rate = (pay_rate * Decimal("1.04")).quantize(Decimal("0.01"))
+            start = end + datetime.timedelta(days=1)
+        return history
+
+    def leave_history(self, employee):
+        start = employee.hire_date
+        history = []
+        for _ in range(self.leaves_per_employee):
+            start += datetime.timedelta(days=self.random.randrange(20, 200))
+            end = start + datetime.timedelta(days=self.random.randrange(0, 10))
+            history.append(
+                Leave(
+                    employee_id=employee.id,
+                    leave_type=self.random.choice(LEAVE_TYPES),
+                    start_date=start,
+                    end_date=end,
+                    reason=self.random.choice(LEAVE_REASONS),
+                    status=self.random.choice(["Approved", "Approved", "Pending"]),
+                )
+            )
+            start = end + datetime.timedelta(days=1)
+        return history
+
+    def assign_managers(self, managers):
+        departments = Department.objects.in_bulk(list(managers))
+        now = timezone.now()
+        for department_id, user_id in managers.items():
+            departments[department_id].manager_id = user_id
+            departments[department_id].updated_at = now
+        Department.objects.bulk_update(
+            departments.values(), ["manager", "updated_at"], batch_size=self.batch_size
+        )
+        bump_version(Department)
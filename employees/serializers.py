@@ -1,5 +1,4 @@
-from django.contrib.auth.models import Permission
-from django.db import transaction
+from django.db import IntegrityError, transaction
 from django.utils.timezone import now
 from rest_framework import serializers
 from rest_framework.exceptions import ValidationError
@@ -8,25 +7,29 @@ from authentication.models import User
 from authentication.serializers import UserSerializer
 from departments.models import Department
 from departments.serializers import DepartmentSerializer
+from employee_management_system.fieldsets import SparseFieldsetMixin
 
-from .models import Employee, Leave, Role, Salary
+from .leaves import LeaveConflict, find_conflicting_leave, is_overlap_violation
+from .models import CUSTOM_PERMISSIONS, Employee, Leave, Role, Salary
 
 
-class EmployeeDetailedSerializer(serializers.ModelSerializer):
+class EmployeeDetailedSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     user = UserSerializer()
     department = DepartmentSerializer()
 
     class Meta:
         model = Employee
         fields = ["id", "hire_date", "department", "user"]
+        expandable_fields = {"user": "user_id", "department": "department_id"}
 
 
-class SalarySerializer(serializers.ModelSerializer):
+class SalarySerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     employee = EmployeeDetailedSerializer(read_only=True)
 
     class Meta:
         model = Salary
         fields = ["id", "pay_rate", "pay_period", "start_date", "end_date", "employee"]
+        expandable_fields = {"employee": "employee_id"}
 
     def update(self, instance, validated_data):
         has_changes = any(
@@ -41,18 +44,33 @@ class SalarySerializer(serializers.ModelSerializer):
 
 
 class RoleSerializer(serializers.ModelSerializer):
+    permissions = serializers.ListField(
+        child=serializers.ChoiceField(
+            choices=[*CUSTOM_PERMISSIONS, *CUSTOM_PERMISSIONS.values()]
+        ),
+        required=False,
+        allow_null=True,
+    )
     permissions_display = serializers.SerializerMethodField()
 
     class Meta:
         model = Role
         fields = ["id", "name", "description", "permissions", "permissions_display"]
 
+    def validate_permissions(self, value):
+        """Accept permission keys or names and store the names."""
+        if value is None:
+            return value
+        return list(dict.fromkeys(CUSTOM_PERMISSIONS.get(name, name) for name in value))
+
     def get_permissions_display(self, obj):
-        permissions = Permission.objects.filter(codename__in=obj.permissions or [])
-        return [{"codename": perm.codename, "name": perm.name} for perm in permissions]
+        return [
+            {"codename": key, "name": CUSTOM_PERMISSIONS[key]}
+            for key in obj.get_permission_keys()
+        ]
 
 
-class EmployeeSerializer(serializers.ModelSerializer):
+class EmployeeSerializer(SparseFieldsetMixin, serializers.ModelSerializer):
     user = UserSerializer()
     role = RoleSerializer(write_only=True, required=False)
     salary = SalarySerializer(write_only=True, required=False)
@@ -71,12 +89,16 @@ class EmployeeSerializer(serializers.ModelSerializer):
             "role",
             "salary",
         ]
+        select_related = ["department__manager"]
+        expandable_fields = {"user": "user_id", "department": "department_id"}
 
     def to_representation(self, instance):
         """
         Customize the serialized output to include detailed department information.
         """
         representation = super().to_representation(instance)
+        if "department" not in representation or not self.is_expanded("department"):
+            return representation
         department = instance.department
         if department:
             representation["department"] = {
@@ -227,9 +249,107 @@ class EmployeeSerializer(serializers.ModelSerializer):
 class LeaveSerializer(serializers.ModelSerializer):
     class Meta:
         model = Leave
-        fields = "__all__"
+        exclude = ["search_document", "search_vector", "updated_at", "period"]
+
+    def validate(self, attrs):
+        """
+        Require a start date on new leaves, reject an end date before it and
+        raise ``LeaveConflict`` when the leave would overlap another active
+        leave of the employee. Updates only change the status, so they are
+        checked with the stored dates.
+        """
+        instance = self.instance
+        if instance is None:
+            employee = attrs.get("employee")
+            employee_id = employee.pk if employee else None
+            start_date, end_date = attrs.get("start_date"), attrs.get("end_date")
+            if start_date is None:
+                raise ValidationError({"start_date": "Start date is required."})
+        else:
+            employee_id = instance.employee_id
+            start_date, end_date = instance.start_date, instance.end_date
+
+        if start_date and end_date and end_date < start_date:
+            raise ValidationError(
+                {"end_date": "End date must not be before start date."}
+            )
+
+        status = attrs.get("status", getattr(instance, "status", None) or "Pending")
+        if employee_id and start_date and status != "Cancelled":
+            conflict = find_conflicting_leave(
+                employee_id, start_date, end_date, getattr(instance, "pk", None)
+            )
+            if conflict:
+                raise LeaveConflict(conflict)
+        return attrs
+
+    def conflict_error(self, error, employee_id, start_date, end_date, exclude_pk=None):
+        """Turn an overlap caught by the database constraint into ``LeaveConflict``."""
+        if not is_overlap_violation(error):
+            return error
+        return LeaveConflict(
+            find_conflicting_leave(employee_id, start_date, end_date, exclude_pk)
+        )
+
+    def create(self, validated_data):
+        try:
+            with transaction.atomic():
+                return super().create(validated_data)
+        except IntegrityError as e:
+            raise self.conflict_error(
+                e,
+                validated_data["employee"].pk,
+                validated_data["start_date"],
+                validated_data.get("end_date"),
+            )
 
     def update(self, instance, validated_data):
         instance.status = validated_data.get("status", instance.status)
-        instance.save()
+        try:
+            with transaction.atomic():
+                instance.save()
+        except IntegrityError as e:
+            raise self.conflict_error(
+                e,
+                instance.employee_id,
+                instance.start_date,
+                instance.end_date,
+                instance.pk,
+            )
         return instance
+
+
+class EmployeeImportSerializer(serializers.Serializer):
+    """
+    One row of a bulk onboarding file. Only per-row checks live here; checks
+    that need the database run once per chunk in ``employees.onboarding``.
+    """
+
+    username = serializers.CharField(max_length=150)
+    email = serializers.EmailField(required=False, allow_null=True)
+    first_name = serializers.CharField(max_length=40, required=False, allow_null=True)
+    last_name = serializers.CharField(max_length=40, required=False, allow_null=True)
+    password = serializers.CharField(required=False, allow_null=True)
+    department = serializers.IntegerField()
+    hire_date = serializers.DateField(required=False, allow_null=True)
+    manager = serializers.BooleanField(required=False, default=False)
+    role = serializers.IntegerField(required=False, allow_null=True)
+    pay_rate = serializers.DecimalField(
+        max_digits=10, decimal_places=2, required=False, allow_null=True
+    )
+    pay_period = serializers.CharField(max_length=50, required=False, allow_null=True)
+    salary_start_date = serializers.DateField(required=False, allow_null=True)
+    salary_end_date = serializers.DateField(required=False, allow_null=True)
+
+    def validate_password(self, value):
+        if value is None:
+            return value
+        return UserSerializer().validate_password(value)
+
+    def validate(self, attrs):
+        salary_fields = ["pay_period", "salary_start_date", "salary_end_date"]
+        if attrs.get("pay_rate") is None and any(attrs.get(f) for f in salary_fields):
+            raise ValidationError(
+                {"pay_rate": "A pay rate is required for salary data."}
+            )
+        return attrs
@@ -0,0 +1,154 @@
+from django.db import transaction
+from django.db.models.signals import (post_delete, post_save, pre_delete,
+                                      pre_save)
+from django.dispatch import receiver
+
+from authentication.models import User
+from departments.models import Department
+from departments.stats import (payroll_shares, update_department_stats,
+                               update_payroll_totals)
+
+from .balances import BALANCE_STATE_FIELDS, leave_state, update_leave_balances
+from .models import Employee, Leave, Salary
+from .salaries import refresh_current_salaries
+from .search import refresh_employee_search, refresh_leave_search
+
+EMPLOYEE_SEARCH_SOURCES = {"user", "user_id", "department", "department_id"}
+LEAVE_SEARCH_SOURCES = {"reason", "employee", "employee_id"}
+USER_SEARCH_SOURCES = {"first_name", "last_name", "email", "username"}
+DEPARTMENT_SEARCH_SOURCES = {"name"}
+LEAVE_BALANCE_SOURCES = {"employee", *BALANCE_STATE_FIELDS}
+DEPARTMENT_STATS_SOURCES = {"department", "department_id", "manager"}
+
+
+def _touches(update_fields, sources):
+    return update_fields is None or bool(set(update_fields) & sources)
+
+
+@receiver(post_save, sender=Employee)
+def refresh_employee_search_document(sender, instance, update_fields=None, **kwargs):
+    if _touches(update_fields, EMPLOYEE_SEARCH_SOURCES):
+        refresh_employee_search(Employee.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=Leave)
+def refresh_leave_search_document(sender, instance, update_fields=None, **kwargs):
+    if _touches(update_fields, LEAVE_SEARCH_SOURCES):
+        refresh_leave_search(Leave.objects.filter(pk=instance.pk))
+
+
+@receiver(post_save, sender=User)
+def refresh_user_search_documents(
+    sender, instance, created, update_fields=None, **kwargs
+):
+    if created or not _touches(update_fields, USER_SEARCH_SOURCES):
+        return
+    refresh_employee_search(Employee.objects.filter(user=instance))
+    refresh_leave_search(Leave.objects.filter(employee__user=instance))
+
+
+@receiver(post_save, sender=Department)
+def refresh_department_search_documents(
+    sender, instance, created, update_fields=None, **kwargs
+):
+    if created or not _touches(update_fields, DEPARTMENT_SEARCH_SOURCES):
+        return
+    refresh_employee_search(Employee.objects.filter(department=instance))
+
+
+@receiver(pre_save, sender=Salary)
+@receiver(pre_delete, sender=Salary)
+def read_previous_current_salary(sender, instance, **kwargs):
+    """
+    Keep the payroll share of the employee whose current salary is about to
+    change or go away, since it can no longer be read back afterwards.
+    """
+    instance._previous_payroll_shares = {}
+    if instance._state.adding:
+        return
+    rows = Employee.objects.filter(current_salary_id=instance.pk)
+    if transaction.get_connection().in_atomic_block:
+        rows = rows.select_for_update(of=("self",))
+    instance._previous_payroll_shares = payroll_shares(rows)
+
+
+@receiver(post_save, sender=Salary)
+@receiver(post_delete, sender=Salary)
+def refresh_current_salary(sender, instance, **kwargs):
+    """
+    Repoint the affected employees at their newest salary and move the
+    difference in their annual pay into the departments' ``payroll_total``.
+    """
+    previous = getattr(instance, "_previous_payroll_shares", {})
+    employees = Employee.objects.filter(pk__in={instance.employee_id, *previous})
+    rows = employees
+    if transaction.get_connection().in_atomic_block:
+        rows = rows.select_for_update(of=("self",))
+    before = {**payroll_shares(rows), **previous}
+    refresh_current_salaries(employees)
+    update_payroll_totals(before, payroll_shares(employees))
+
+
+@receiver(pre_save, sender=Employee)
+def read_previous_department(sender, instance, update_fields=None, **kwargs):
+    """
+    Keep the stored department and manager flag of an employee about to
+    change them, locking the row when inside a transaction.
+    """
+    instance._previous_department_state = None
+    if instance._state.adding or not _touches(update_fields, DEPARTMENT_STATS_SOURCES):
+        return
+    rows = Employee.objects.filter(pk=instance.pk)
+    if transaction.get_connection().in_atomic_block:
+        rows = rows.select_for_update()
+    instance._previous_department_state = rows.values_list(
+        "department_id", "manager"
+    ).first()
+
+
+@receiver(post_save, sender=Employee)
+def refresh_department_stats(sender, instance, created, update_fields=None, **kwargs):
+    if not created and not _touches(update_fields, DEPARTMENT_STATS_SOURCES):
+        return
+    previous = getattr(instance, "_previous_department_state", None)
+    payroll = 0
+    if previous is not None and previous[0] != instance.department_id:
+        share = payroll_shares(Employee.objects.filter(pk=instance.pk))
+        payroll = share.get(instance.pk, (None, 0))[1]
+    update_department_stats(
+        previous, (instance.department_id, instance.manager), payroll
+    )
+
+
+@receiver(post_delete, sender=Employee)
+def remove_from_department_stats(sender, instance, **kwargs):
+    update_department_stats(previous=(instance.department_id, instance.manager))
+
+
+@receiver(pre_save, sender=Leave)
+def read_previous_leave_state(sender, instance, update_fields=None, **kwargs):
+    """
+    Keep the stored state of a leave about to change its balance fields,
+    locking the row when inside a transaction so concurrent status changes
+    are applied one after the other.
+    """
+    instance._previous_balance_state = None
+    if instance._state.adding or not _touches(update_fields, LEAVE_BALANCE_SOURCES):
+        return
+    rows = Leave.objects.filter(pk=instance.pk)
+    if transaction.get_connection().in_atomic_block:
+        rows = rows.select_for_update()
+    instance._previous_balance_state = rows.values_list(*BALANCE_STATE_FIELDS).first()
+
+
+@receiver(post_save, sender=Leave)
+def refresh_leave_balance(sender, instance, update_fields=None, **kwargs):
+    if _touches(update_fields, LEAVE_BALANCE_SOURCES):
+        update_leave_balances(
+            getattr(instance, "_previous_balance_state", None), leave_state(instance)
+        )
+
+
+@receiver(post_delete, sender=Leave)
+def remove_leave_balance(sender, instance, **kwargs):
+    update_leave_balances(previous=leave_state(instance))
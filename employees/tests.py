@@ -1,3 +1,337 @@
-from django.test import TestCase
+import datetime
+from decimal import Decimal
 
-# Create your tests here.
+from django.test import SimpleTestCase, TestCase, override_settings
+from rest_framework.test import APIClient
+
+from authentication.models import User
+from departments.models import Department
+
+from .balances import rebuild_leave_balances
+from .leaves import absence_calendar
+from .models import Employee, Leave, LeaveBalance, Salary
+from .payroll import (PayrollEngine, count_periods, normalize_pay_period,
+                      split_periods)
+
+
+class AbsenceCalendarTests(TestCase):
+    def setUp(self):
+        department = Department.objects.create(name="Engineering")
+        user = User.objects.create(username="ada", email="ada@example.com")
+        self.employee = Employee.objects.create(user=user, department=department)
+
+    def test_lists_leaves_overlapping_the_window(self):
+        leave = Leave.objects.create(
+            employee=self.employee,
+            leave_type="Annual",
+            start_date=datetime.date(2025, 2, 27),
+            end_date=datetime.date(2025, 3, 2),
+        )
+
+        calendar = absence_calendar(
+            datetime.date(2025, 3, 1), datetime.date(2025, 3, 3)
+        )
+
+        self.assertEqual([row["id"] for row in calendar["leaves"]], [leave.pk])
+        self.assertEqual(
+            [day["employee_ids"] for day in calendar["days"]],
+            [[self.employee.pk], [self.employee.pk], []],
+        )
+
+    def test_ignores_leaves_without_a_start_date(self):
+        Leave.objects.create(
+            employee=self.employee,
+            leave_type="Sick",
+            start_date=None,
+            end_date=datetime.date(2025, 3, 2),
+        )
+
+        calendar = absence_calendar(
+            datetime.date(2025, 3, 1), datetime.date(2025, 3, 3)
+        )
+
+        self.assertEqual(calendar["leaves"], [])
+        self.assertEqual(calendar["employees"], [])
+        self.assertEqual(
+            [day["employee_ids"] for day in calendar["days"]], [[], [], []]
+        )
+
+
+class LeaveBalanceTests(TestCase):
+    def setUp(self):
+        department = Department.objects.create(name="Engineering")
+        user = User.objects.create(username="ada", email="ada@example.com")
+        self.employee = Employee.objects.create(user=user, department=department)
+
+    def create_leave(self, start_date, end_date, **kwargs):
+        return Leave.objects.create(
+            employee=self.employee,
+            leave_type=kwargs.pop("leave_type", "Annual"),
+            start_date=start_date,
+            end_date=end_date,
+            **kwargs,
+        )
+
+    def ledger(self):
+        """Non-empty ledger rows as ``{(year, leave_type): (approved, pending)}``."""
+        return {
+            (row.year, row.leave_type): (row.approved_days, row.pending_days)
+            for row in LeaveBalance.objects.filter(employee=self.employee)
+            if row.approved_days or row.pending_days
+        }
+
+    def test_status_changes_move_the_days(self):
+        leave = self.create_leave(datetime.date(2025, 3, 3), datetime.date(2025, 3, 7))
+        self.assertEqual(self.ledger(), {(2025, "Annual"): (0, 5)})
+
+        leave.status = "Approved"
+        leave.save()
+        self.assertEqual(self.ledger(), {(2025, "Annual"): (5, 0)})
+
+        leave.status = "Cancelled"
+        leave.save()
+        self.assertEqual(self.ledger(), {})
+
+        leave.status = "Pending"
+        leave.save()
+        self.assertEqual(self.ledger(), {(2025, "Annual"): (0, 5)})
+
+        leave.delete()
+        self.assertEqual(self.ledger(), {})
+
+    def test_leave_spanning_two_years_is_split(self):
+        leave = self.create_leave(
+            datetime.date(2024, 12, 30), datetime.date(2025, 1, 2), status="Approved"
+        )
+        self.assertEqual(
+            self.ledger(), {(2024, "Annual"): (2, 0), (2025, "Annual"): (2, 0)}
+        )
+
+        leave.end_date = datetime.date(2024, 12, 31)
+        leave.save()
+        self.assertEqual(self.ledger(), {(2024, "Annual"): (2, 0)})
+
+    def test_rebuild_matches_the_incremental_ledger(self):
+        self.create_leave(
+            datetime.date(2024, 12, 20), datetime.date(2025, 1, 5), status="Approved"
+        )
+        self.create_leave(
+            datetime.date(2025, 2, 3), datetime.date(2025, 2, 4), leave_type="Sick"
+        )
+        cancelled = self.create_leave(
+            datetime.date(2025, 4, 1), datetime.date(2025, 4, 2), status="Approved"
+        )
+        cancelled.status = "Cancelled"
+        cancelled.save()
+        self.create_leave(datetime.date(2025, 5, 5), None, status="Approved")
+        incremental = self.ledger()
+
+        rebuild_leave_balances()
+
+        self.assertEqual(self.ledger(), incremental)
+        self.assertEqual(
+            incremental,
+            {
+                (2024, "Annual"): (12, 0),
+                (2025, "Annual"): (6, 0),
+                (2025, "Sick"): (0, 2),
+            },
+        )
+
+
+class CurrentSalaryTests(TestCase):
+    def setUp(self):
+        department = Department.objects.create(name="Engineering")
+        for index in range(3):
+            user = User.objects.create(
+                username=f"user{index}", email=f"user{index}@example.com"
+            )
+            employee = Employee.objects.create(user=user, department=department)
+            for year in (2023, 2024):
+                Salary.objects.create(
+                    employee=employee,
+                    pay_rate=1000 + index,
+                    start_date=datetime.date(year, 1, 1),
+                )
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create(
+                username="admin", email="admin@example.com", is_admin=True
+            )
+        )
+
+    def test_pages_by_default(self):
+        response = self.client.get("/employees/salaries/current/")
+        body = response.json()
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(len(body["data"]), 3)
+        self.assertEqual(body["pagination"]["page_size"], 100)
+        self.assertEqual({row["start_date"] for row in body["data"]}, {"2024-01-01"})
+
+    def test_cursor_walks_every_employee_once(self):
+        seen = []
+        url = "/employees/salaries/current/?cursor=&page_size=2"
+        while url:
+            body = self.client.get(url).json()
+            seen += [row["id"] for row in body["data"]]
+            url = body["pagination"]["next"]
+        self.assertEqual(
+            sorted(seen),
+            sorted(Employee.objects.values_list("current_salary", flat=True)),
+        )
+
+
+class PayrollPeriodTests(SimpleTestCase):
+    def test_split_periods_cuts_at_calendar_boundaries(self):
+        self.assertEqual(
+            split_periods(
+                datetime.date(2024, 1, 15), datetime.date(2024, 3, 10), "month"
+            ),
+            [
+                (datetime.date(2024, 1, 15), datetime.date(2024, 1, 31)),
+                (datetime.date(2024, 2, 1), datetime.date(2024, 2, 29)),
+                (datetime.date(2024, 3, 1), datetime.date(2024, 3, 10)),
+            ],
+        )
+        self.assertEqual(
+            split_periods(
+                datetime.date(2024, 2, 1), datetime.date(2024, 7, 1), "quarter"
+            ),
+            [
+                (datetime.date(2024, 2, 1), datetime.date(2024, 3, 31)),
+                (datetime.date(2024, 4, 1), datetime.date(2024, 6, 30)),
+                (datetime.date(2024, 7, 1), datetime.date(2024, 7, 1)),
+            ],
+        )
+        self.assertEqual(
+            split_periods(datetime.date(2024, 5, 5), datetime.date(2024, 5, 5), "year"),
+            [(datetime.date(2024, 5, 5), datetime.date(2024, 5, 5))],
+        )
+
+    def test_split_periods_reaches_the_last_representable_day(self):
+        end = datetime.date(9999, 12, 31)
+        self.assertEqual(
+            split_periods(datetime.date(9999, 1, 1), end, "year")[-1][1], end
+        )
+
+    def test_count_periods_matches_split_periods(self):
+        ranges = [
+            (datetime.date(2024, 1, 1), datetime.date(2024, 1, 1)),
+            (datetime.date(2023, 12, 31), datetime.date(2024, 1, 1)),
+            (datetime.date(2021, 2, 14), datetime.date(2024, 11, 30)),
+            (datetime.date(2000, 3, 31), datetime.date(2009, 4, 1)),
+        ]
+        for start, end in ranges:
+            for interval in ("month", "quarter", "year"):
+                with self.subTest(start=start, end=end, interval=interval):
+                    self.assertEqual(
+                        count_periods(start, end, interval),
+                        len(split_periods(start, end, interval)),
+                    )
+
+    def test_normalize_pay_period(self):
+        self.assertEqual(normalize_pay_period("Bi-Weekly"), "biweekly")
+        self.assertEqual(normalize_pay_period("per hour"), "hourly")
+        self.assertEqual(normalize_pay_period("Fortnightly"), "biweekly")
+        self.assertEqual(normalize_pay_period("ANNUALLY"), "annual")
+        self.assertEqual(normalize_pay_period("bogus"), "bogus")
+        self.assertEqual(normalize_pay_period(None), "monthly")
+        self.assertEqual(normalize_pay_period(""), "monthly")
+
+
+class PayrollProrationTests(SimpleTestCase):
+    def report(self, rows, start, end, interval="month"):
+        engine = PayrollEngine(start, end, interval).load_rows(rows)
+        return engine.report(group_by="employee")
+
+    def test_full_year_costs_the_annual_amount(self):
+        report = self.report(
+            [
+                (
+                    1,
+                    10,
+                    datetime.date(2020, 1, 1),
+                    None,
+                    None,
+                    Decimal("1000"),
+                    "monthly",
+                )
+            ],
+            datetime.date(2024, 1, 1),
+            datetime.date(2024, 12, 31),
+        )
+        self.assertEqual(report["total"], 12000)
+        self.assertEqual(report["by_period"][0], round(12000 * 31 / 366, 2))
+        self.assertEqual(report["by_period"][1], round(12000 * 29 / 366, 2))
+
+    def test_next_salary_ends_the_previous_one(self):
+        rows = [
+            (
+                1,
+                10,
+                datetime.date(2023, 1, 1),
+                None,
+                datetime.date(2023, 7, 1),
+                365,
+                "daily",
+            ),
+            (1, 10, datetime.date(2023, 7, 1), None, None, 36500, "annual"),
+        ]
+        report = self.report(
+            rows, datetime.date(2023, 1, 1), datetime.date(2023, 12, 31), "quarter"
+        )
+        first_half = 365 * 260 * 181 / 365
+        second_half = 36500 * 184 / 365
+        self.assertEqual(
+            report["by_period"],
+            [
+                round(365 * 260 * 90 / 365, 2),
+                round(365 * 260 * 91 / 365, 2),
+                round(36500 * 92 / 365, 2),
+                round(36500 * 92 / 365, 2),
+            ],
+        )
+        self.assertEqual(report["total"], round(first_half + second_half, 2))
+
+    def test_end_date_and_range_clip_the_salary(self):
+        report = self.report(
+            [
+                (
+                    1,
+                    None,
+                    datetime.date(2023, 12, 1),
+                    datetime.date(2024, 1, 10),
+                    None,
+                    3660,
+                    "annual",
+                )
+            ],
+            datetime.date(2024, 1, 1),
+            datetime.date(2024, 2, 29),
+        )
+        self.assertEqual(report["by_period"], [100, 0])
+
+    def test_unrecognized_pay_periods_cost_nothing(self):
+        rows = [
+            (1, 10, datetime.date(2024, 1, 1), None, None, 500, "per lunar cycle"),
+            (2, 10, datetime.date(2024, 1, 1), None, None, 500, "per lunar cycle"),
+        ]
+        report = self.report(
+            rows, datetime.date(2024, 1, 1), datetime.date(2024, 1, 31)
+        )
+        self.assertEqual(report["total"], 0)
+        self.assertEqual(report["unrecognized_pay_periods"], {"per lunar cycle": 2})
+
+    @override_settings(PAYROLL_MAX_CELLS=24)
+    def test_rejects_more_salaries_than_the_cell_budget(self):
+        rows = [
+            (index, 10, datetime.date(2024, 1, 1), None, None, 1000, "monthly")
+            for index in range(3)
+        ]
+        with self.assertRaises(ValueError):
+            self.report(rows, datetime.date(2024, 1, 1), datetime.date(2024, 12, 31))
+
+    @override_settings(PAYROLL_MAX_PERIODS=12)
+    def test_rejects_ranges_longer_than_the_period_cap(self):
+        with self.assertRaises(ValueError):
+            PayrollEngine(datetime.date(2024, 1, 1), datetime.date(2025, 1, 1))
@@ -9,6 +9,16 @@ urlpatterns = [
         EmployeeViewSet.as_view({"post": "create", "get": "list", "delete": "destroy"}),
         name="manage-employees",
     ),
+    path(
+        "bulk/",
+        EmployeeViewSet.as_view({"post": "bulk_onboard"}),
+        name="bulk-onboard-employees",
+    ),
+    path(
+        "export/",
+        EmployeeViewSet.as_view({"get": "export"}),
+        name="export-employees",
+    ),
     path(
         "<int:pk>/",
         EmployeeViewSet.as_view(
@@ -22,6 +32,21 @@ urlpatterns = [
         LeaveViewSet.as_view({"post": "create", "get": "list"}),
         name="manage-leaves",
     ),
+    path(
+        "leaves/balances/",
+        LeaveViewSet.as_view({"get": "balances"}),
+        name="leave-balances",
+    ),
+    path(
+        "leaves/calendar/",
+        LeaveViewSet.as_view({"get": "calendar"}),
+        name="leave-calendar",
+    ),
+    path(
+        "leaves/export/",
+        LeaveViewSet.as_view({"get": "export"}),
+        name="export-leaves",
+    ),
     path(
         "leaves/<int:pk>/",
         LeaveViewSet.as_view(
@@ -53,6 +78,21 @@ urlpatterns = [
         SalaryViewSet.as_view({"post": "create", "get": "list"}),
         name="manage-salaries",
     ),
+    path(
+        "salaries/current/",
+        SalaryViewSet.as_view({"get": "current"}),
+        name="current-salaries",
+    ),
+    path(
+        "salaries/payroll/",
+        SalaryViewSet.as_view({"get": "payroll"}),
+        name="salary-payroll",
+    ),
+    path(
+        "salaries/export/",
+        SalaryViewSet.as_view({"get": "export"}),
+        name="export-salaries",
+    ),
     path(
         "salaries/<int:pk>/",
         SalaryViewSet.as_view(
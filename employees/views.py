@@ -1,22 +1,68 @@
+import datetime
+
+from django.conf import settings
+from django.db.models import F, Q
+from django.utils.dateparse import parse_date
 from rest_framework import status
-from rest_framework.exceptions import ValidationError
+from rest_framework.exceptions import NotFound, ValidationError
 from rest_framework.viewsets import ModelViewSet
 
+from authentication.models import User
+from departments.models import Department
+from employee_management_system.conditional import ConditionalGetMixin
 from employee_management_system.CustomResponse import CustomResponse
 from employee_management_system.exceptions import custom_exception_handler
+from employee_management_system.exports import ExportMixin
+from employee_management_system.metrics import SerializerTimingMixin
 from employee_management_system.pagination import CustomPageNumberPagination
+from employee_management_system.queries import optimize_queryset
+from employee_management_system.response_cache import cache_response
 from permissions.permissions import *
-
-from .models import Employee, Leave, Role, Salary
+from permissions.scoping import RowScopingMixin
+
+from .balances import leave_balances
+from .leaves import LeaveConflict, absence_calendar
+from .models import (Employee, Leave, LeaveBalance, Role, Salary,
+                     salary_start_date_sort_key)
+from .onboarding import BulkOnboarding, clean_rows, parse_rows
+from .payroll import payroll_report
+from .search import search_employees, search_leaves
 from .serializers import (EmployeeSerializer, LeaveSerializer, RoleSerializer,
                           SalarySerializer)
 
 
-class EmployeeViewSet(ModelViewSet):
+class EmployeeViewSet(
+    SerializerTimingMixin,
+    RowScopingMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    ModelViewSet,
+):
     queryset = Employee.objects.all()
     serializer_class = EmployeeSerializer
     permission_classes = [DynamicRolePermission]
+    query_budget = {"list": 3, "retrieve": 2}
+    scope_field = "id"
+    conditional_timestamp_fields = (
+        "updated_at",
+        "user__updated_at",
+        "department__updated_at",
+        "department__manager__updated_at",
+    )
     pagination_class = CustomPageNumberPagination
+    cursor_ordering = ("id",)
+    export_filename = "employees"
+    export_fields = (
+        ("id", "id"),
+        ("username", "user__username"),
+        ("first_name", "user__first_name"),
+        ("last_name", "user__last_name"),
+        ("email", "user__email"),
+        ("department_id", "department_id"),
+        ("department", "department__name"),
+        ("manager", "manager"),
+        ("hire_date", "hire_date"),
+    )
 
     def format_validation_errors(self, exc):
         error_messages = []
@@ -39,32 +85,33 @@ class EmployeeViewSet(ModelViewSet):
         return " ".join(error_messages)
 
     def get_queryset(self):
-        queryset = super().get_queryset()
+        queryset = self.scope_queryset(super().get_queryset())
         search_query = self.request.query_params.get("q", None)
         department_id = self.request.query_params.get("department_id", None)
 
-        if search_query:
-            queryset = queryset.filter(
-                Q(user__first_name__icontains=search_query)
-                | Q(user__last_name__icontains=search_query)
-                | Q(user__email__icontains=search_query)
-                | Q(user__username__icontains=search_query)
-                | Q(department__name__icontains=search_query)
-            )
         if department_id:
             queryset = queryset.filter(department_id=department_id)
 
+        queryset = optimize_queryset(
+            queryset, self.get_serializer(), self.conditional_timestamp_fields
+        )
+        if search_query:
+            return search_employees(queryset, search_query)
         return queryset.order_by("id")
 
     def list(self, request, *args, **kwargs):
         try:
             queryset = self.get_queryset()
             page = self.paginate_queryset(queryset)
+            rows = page if page is not None else list(queryset)
+            not_modified = self.check_list_modified(request, rows)
+            if not_modified is not None:
+                return not_modified
             if page is not None:
                 serializer = self.get_serializer(page, many=True)
                 return self.get_paginated_response(serializer.data)
 
-            serializer = self.get_serializer(queryset, many=True)
+            serializer = self.get_serializer(rows, many=True)
             return CustomResponse(
                 status_code=status.HTTP_200_OK,
                 message="Employees fetched successfully.",
@@ -94,9 +141,45 @@ class EmployeeViewSet(ModelViewSet):
         except Exception as e:
             return custom_exception_handler(e, None)
 
+    def bulk_onboard(self, request, *args, **kwargs):
+        try:
+            upload = request.FILES.get("file")
+            if upload is not None:
+                file_format = "csv" if upload.name.lower().endswith(".csv") else "json"
+                rows = parse_rows(upload.read().decode("utf-8-sig"), file_format)
+            elif isinstance(request.data, list):
+                rows = clean_rows(request.data)
+            else:
+                rows = clean_rows(request.data.get("employees") or [])
+
+            if not rows:
+                return CustomResponse(
+                    status_code=status.HTTP_400_BAD_REQUEST,
+                    message="Provide a list of employees or a CSV/JSON file.",
+                    data={},
+                )
+
+            report = BulkOnboarding().run(rows)
+            return CustomResponse(
+                status_code=status.HTTP_200_OK,
+                message=f"{report['created']} employees onboarded, {report['failed']} rows rejected.",
+                data=report,
+            )
+        except (UnicodeDecodeError, ValueError) as e:
+            return CustomResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=f"Could not read the uploaded file: {e}",
+                data={},
+            )
+        except Exception as e:
+            return custom_exception_handler(e, None)
+
     def retrieve(self, request, *args, **kwargs):
         try:
             instance = self.get_object()
+            not_modified = self.check_object_modified(request, instance)
+            if not_modified is not None:
+                return not_modified
             serializer = self.get_serializer(instance)
             return CustomResponse(
                 status_code=status.HTTP_200_OK,
@@ -143,30 +226,48 @@ class EmployeeViewSet(ModelViewSet):
             return custom_exception_handler(e, None)
 
 
-class LeaveViewSet(ModelViewSet):
+class LeaveViewSet(
+    SerializerTimingMixin,
+    RowScopingMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    ModelViewSet,
+):
     queryset = Leave.objects.all()
     serializer_class = LeaveSerializer
     permission_classes = [DynamicRolePermission]
+    query_budget = {"list": 3, "retrieve": 2, "calendar": 3, "balances": 2}
+    export_filename = "leaves"
+    export_fields = (
+        ("id", "id"),
+        ("employee_id", "employee_id"),
+        ("username", "employee__user__username"),
+        ("leave_type", "leave_type"),
+        ("start_date", "start_date"),
+        ("end_date", "end_date"),
+        ("status", "status"),
+        ("reason", "reason"),
+    )
 
     def get_queryset(self):
-        queryset = super().get_queryset()
+        queryset = self.scope_queryset(super().get_queryset())
         search_query = self.request.query_params.get("q", None)
         employee_id = self.request.query_params.get("employee_id", None)
 
-        if search_query:
-            queryset = queryset.filter(
-                Q(reason__icontains=search_query)
-                | Q(employee__user__first_name__icontains=search_query)
-                | Q(employee__user__last_name__icontains=search_query)
-            )
         if employee_id:
             queryset = queryset.filter(employee_id=employee_id)
 
+        queryset = optimize_queryset(queryset, self.get_serializer())
+        if search_query:
+            return search_leaves(queryset, search_query)
         return queryset.order_by("id")
 
     def retrieve(self, request, *args, **kwargs):
         try:
             instance = self.get_object()
+            not_modified = self.check_object_modified(request, instance)
+            if not_modified is not None:
+                return not_modified
             serializer = self.get_serializer(instance)
             return CustomResponse(
                 status_code=status.HTTP_200_OK,
@@ -187,6 +288,12 @@ class LeaveViewSet(ModelViewSet):
                 message="Leave request created successfully.",
                 data=response_serializer.data,
             )
+        except LeaveConflict as e:
+            return CustomResponse(
+                status_code=status.HTTP_409_CONFLICT,
+                message=str(e.detail),
+                data={"conflict": e.conflict},
+            )
         except ValidationError as e:
             error_message = "; ".join(
                 [str(error) for errors in e.detail.values() for error in errors]
@@ -203,11 +310,15 @@ class LeaveViewSet(ModelViewSet):
         try:
             queryset = self.get_queryset()
             page = self.paginate_queryset(queryset)
+            rows = page if page is not None else list(queryset)
+            not_modified = self.check_list_modified(request, rows)
+            if not_modified is not None:
+                return not_modified
             if page is not None:
                 serializer = self.get_serializer(page, many=True)
                 return self.get_paginated_response(serializer.data)
 
-            serializer = self.get_serializer(queryset, many=True)
+            serializer = self.get_serializer(rows, many=True)
             return CustomResponse(
                 status_code=status.HTTP_200_OK,
                 message="Leave requests fetched successfully.",
@@ -216,6 +327,120 @@ class LeaveViewSet(ModelViewSet):
         except Exception as e:
             return custom_exception_handler(e, None)
 
+    def balances(self, request, *args, **kwargs):
+        """
+        Leave balances for ``year`` (the current year by default) of
+        ``employee_id``, or of the caller's own employee records, read from
+        the ``LeaveBalance`` ledger. Users without access to every balance
+        only get their own, whatever ``employee_id`` they ask for.
+        """
+        try:
+            params = request.query_params
+            try:
+                year = int(params.get("year") or datetime.date.today().year)
+                employee_id = params.get("employee_id", None)
+                if employee_id:
+                    employee_ids = [int(employee_id)]
+                else:
+                    employee_ids = sorted(get_employee_ids(request.user))
+            except ValueError:
+                raise ValueError("year and employee_id must be integers.")
+            if not has_unscoped_access(request.user, self):
+                own_ids = get_employee_ids(request.user)
+                employee_ids = [value for value in employee_ids if value in own_ids]
+
+            balances = leave_balances(
+                self.scope_queryset(LeaveBalance.objects.all()),
+                employee_ids,
+                year,
+                leave_type=params.get("leave_type", None),
+            )
+            return CustomResponse(
+                status_code=status.HTTP_200_OK,
+                message="Leave balances fetched successfully.",
+                data={"year": year, "balances": balances},
+            )
+        except ValueError as e:
+            return CustomResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=str(e),
+                data={},
+            )
+        except Exception as e:
+            return custom_exception_handler(e, None)
+
+    def calendar(self, request, *args, **kwargs):
+        """
+        Who in ``department_id`` is off on each day between ``start`` and
+        ``end`` (the current month by default). Department managers and users
+        allowed to see every leave get the whole team, everyone else only
+        their own leaves. Windows inside the current month are cached.
+        """
+        try:
+            params = request.query_params
+            today = datetime.date.today()
+            month_start = today.replace(day=1)
+            month_end = (month_start + datetime.timedelta(days=31)).replace(
+                day=1
+            ) - datetime.timedelta(days=1)
+            start = parse_date(params.get("start") or month_start.isoformat())
+            end = parse_date(params.get("end") or month_end.isoformat())
+            if start is None or end is None:
+                raise ValueError("start and end must be dates formatted YYYY-MM-DD.")
+            if end < start:
+                raise ValueError("end must not be before start.")
+            max_days = getattr(settings, "LEAVE_CALENDAR_MAX_DAYS", 366)
+            if (end - start).days + 1 > max_days:
+                raise ValueError(f"The window cannot be longer than {max_days} days.")
+            try:
+                department_id = int(params.get("department_id"))
+            except (TypeError, ValueError):
+                raise ValueError("department_id must be an integer.")
+
+            department = (
+                Department.objects.filter(pk=department_id).values("manager_id").first()
+            )
+            if department is None:
+                raise NotFound(f"Department with ID {department_id} does not exist.")
+
+            user = request.user
+            owner = None
+            if not has_unscoped_access(user, self) and (
+                department["manager_id"] != user.pk
+            ):
+                owner = user.pk
+
+            if month_start <= start and end <= month_end:
+                return self.cached_calendar(request, department_id, start, end, owner)
+            return self.build_calendar(request, department_id, start, end, owner)
+        except ValueError as e:
+            return CustomResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=str(e),
+                data={},
+            )
+        except Exception as e:
+            return custom_exception_handler(e, None)
+
+    @cache_response(models=(Leave, Employee, User))
+    def cached_calendar(self, request, department_id, start, end, owner):
+        return self.build_calendar(request, department_id, start, end, owner)
+
+    def build_calendar(self, request, department_id, start, end, owner):
+        queryset = Leave.objects.filter(employee__department_id=department_id)
+        if owner is not None:
+            queryset = queryset.filter(employee__user_id=owner)
+        leave_status = request.query_params.get("status", None)
+        if leave_status:
+            queryset = queryset.filter(status=leave_status)
+
+        report = absence_calendar(start, end, queryset)
+        return CustomResponse(
+            status_code=status.HTTP_200_OK,
+            message="Absence calendar fetched successfully.",
+            data={"department_id": department_id, **report},
+        )
+
     def update(self, request, *args, **kwargs):
         try:
             instance = self.get_object()
@@ -227,6 +452,12 @@ class LeaveViewSet(ModelViewSet):
                 message="Leave request updated successfully",
                 data=serializer.data,
             )
+        except LeaveConflict as e:
+            return CustomResponse(
+                status_code=status.HTTP_409_CONFLICT,
+                message=str(e.detail),
+                data={"conflict": e.conflict},
+            )
         except ValidationError as e:
             error_message = "; ".join(
                 [str(error) for errors in e.detail.values() for error in errors]
@@ -240,10 +471,11 @@ class LeaveViewSet(ModelViewSet):
             return custom_exception_handler(e, None)
 
 
-class RoleViewSet(ModelViewSet):
+class RoleViewSet(SerializerTimingMixin, ModelViewSet):
     queryset = Role.objects.all()
     serializer_class = RoleSerializer
     permission_classes = [DynamicRolePermission]
+    query_budget = {"list": 2, "retrieve": 2}
 
     def get_queryset(self):
         queryset = super().get_queryset()
@@ -255,6 +487,7 @@ class RoleViewSet(ModelViewSet):
             )
         return queryset.order_by("id")
 
+    @cache_response(models=(Role,))
     def list(self, request, *args, **kwargs):
         try:
             queryset = self.get_queryset()
@@ -266,14 +499,45 @@ class RoleViewSet(ModelViewSet):
             return custom_exception_handler(e, None)
 
 
-class SalaryViewSet(ModelViewSet):
+class SalaryViewSet(
+    SerializerTimingMixin,
+    RowScopingMixin,
+    ConditionalGetMixin,
+    ExportMixin,
+    ModelViewSet,
+):
     queryset = Salary.objects.all()
     serializer_class = SalarySerializer
     permission_classes = [DynamicRolePermission]
+    query_budget = {"list": 3, "retrieve": 2, "current": 3, "payroll": 2}
+    default_page_size = {"current": 100}
+    conditional_timestamp_fields = (
+        "updated_at",
+        "employee__updated_at",
+        "employee__user__updated_at",
+        "employee__department__updated_at",
+        "employee__department__manager__updated_at",
+    )
     pagination_class = CustomPageNumberPagination
+    export_filename = "salaries"
+    export_fields = (
+        ("id", "id"),
+        ("employee_id", "employee_id"),
+        ("username", "employee__user__username"),
+        ("pay_rate", "pay_rate"),
+        ("pay_period", "pay_period"),
+        ("start_date", "start_date"),
+        ("end_date", "end_date"),
+    )
+
+    @property
+    def cursor_ordering(self):
+        if self.action == "current":
+            return ("employee_id",)
+        return ("-sort_start_date", "id")
 
     def get_queryset(self):
-        queryset = super().get_queryset()
+        queryset = self.scope_queryset(super().get_queryset())
         search_query = self.request.query_params.get("q", None)
         employee_id = self.request.query_params.get("employee_id", None)
 
@@ -287,17 +551,25 @@ class SalaryViewSet(ModelViewSet):
         if employee_id:
             queryset = queryset.filter(employee_id=employee_id)
 
-        return queryset.order_by("-start_date")
+        queryset = optimize_queryset(
+            queryset, self.get_serializer(), self.conditional_timestamp_fields
+        )
+        queryset = queryset.annotate(sort_start_date=salary_start_date_sort_key())
+        return queryset.order_by("-sort_start_date", "id")
 
     def list(self, request, *args, **kwargs):
         try:
             queryset = self.get_queryset()
             page = self.paginate_queryset(queryset)
+            rows = page if page is not None else list(queryset)
+            not_modified = self.check_list_modified(request, rows)
+            if not_modified is not None:
+                return not_modified
             if page is not None:
                 serializer = self.get_serializer(page, many=True)
                 return self.get_paginated_response(serializer.data)
 
-            serializer = self.get_serializer(queryset, many=True)
+            serializer = self.get_serializer(rows, many=True)
             return CustomResponse(
                 status_code=status.HTTP_200_OK,
                 message="Salaries fetched successfully.",
@@ -306,6 +578,71 @@ class SalaryViewSet(ModelViewSet):
         except Exception as e:
             return custom_exception_handler(e, None)
 
+    def current(self, request, *args, **kwargs):
+        """
+        Current salary of every visible employee, optionally filtered by
+        ``department_id``, read through ``current_salary`` one page at a time
+        (``default_page_size`` applies when no ``page_size`` is given).
+        """
+        try:
+            queryset = (
+                self.get_queryset()
+                .filter(employee__current_salary=F("pk"))
+                .order_by("employee_id")
+            )
+            department_id = request.query_params.get("department_id", None)
+            if department_id:
+                queryset = queryset.filter(employee__department_id=department_id)
+
+            page = self.paginate_queryset(queryset)
+            serializer = self.get_serializer(page, many=True)
+            return self.get_paginated_response(serializer.data)
+        except Exception as e:
+            return custom_exception_handler(e, None)
+
+    def payroll(self, request, *args, **kwargs):
+        """
+        Payroll cost of the visible salaries between ``start`` and ``end``
+        (the current year by default), split by ``interval`` and grouped by
+        department or employee. See ``employees.payroll.PayrollEngine``.
+        """
+        try:
+            params = request.query_params
+            year = datetime.date.today().year
+            start = parse_date(params.get("start") or f"{year}-01-01")
+            end = parse_date(params.get("end") or f"{year}-12-31")
+            if start is None or end is None:
+                raise ValueError("start and end must be dates formatted YYYY-MM-DD.")
+
+            queryset = self.scope_queryset(Salary.objects.all())
+            employee_id = params.get("employee_id", None)
+            department_id = params.get("department_id", None)
+            if employee_id:
+                queryset = queryset.filter(employee_id=employee_id)
+            if department_id:
+                queryset = queryset.filter(employee__department_id=department_id)
+
+            report = payroll_report(
+                start,
+                end,
+                interval=params.get("interval", "month"),
+                group_by=params.get("group_by", "department"),
+                queryset=queryset,
+            )
+            return CustomResponse(
+                status_code=status.HTTP_200_OK,
+                message="Payroll computed successfully.",
+                data=report,
+            )
+        except ValueError as e:
+            return CustomResponse(
+                status_code=status.HTTP_400_BAD_REQUEST,
+                message=str(e),
+                data={},
+            )
+        except Exception as e:
+            return custom_exception_handler(e, None)
+
     def create(self, request, *args, **kwargs):
         try:
             serializer = self.get_serializer(data=request.data)
@@ -332,6 +669,9 @@ class SalaryViewSet(ModelViewSet):
     def retrieve(self, request, *args, **kwargs):
         try:
             instance = self.get_object()
+            not_modified = self.check_object_modified(request, instance)
+            if not_modified is not None:
+                return not_modified
             serializer = self.get_serializer(instance)
             return CustomResponse(
                 status_code=status.HTTP_200_OK,
@@ -1,6 +1,6 @@
 from rest_framework.permissions import BasePermission
 from rest_framework.exceptions import PermissionDenied
-from employees.models import Employee
+from employees.models import CUSTOM_PERMISSIONS, Employee
 
 PERMISSION_MAPPING = {
     "employee_list": {"view_name": "EmployeeViewSet", "action": "list"},
@@ -19,6 +19,94 @@ PERMISSION_MAPPING = {
     "department_update": {"view_name": "DepartmentViewSet", "action": "update"},
 }
 
+ACTION_ALIASES = {
+    "retrieve": "update",
+    "partial_update": "update",
+    "export": "list",
+    "bulk_onboard": "create",
+    "current": "list",
+    "payroll": "list",
+    "calendar": "list",
+    "balances": "list",
+}
+
+
+def compile_permission_mapping(mapping, aliases):
+    """Build the (view name, action) -> permission key lookup, aliases included."""
+    required = {}
+    for perm_key, target in mapping.items():
+        required.setdefault((target["view_name"], target["action"]), perm_key)
+    for alias, action in aliases.items():
+        for (view_name, mapped_action), perm_key in list(required.items()):
+            if mapped_action == action:
+                required.setdefault((view_name, alias), perm_key)
+    return required
+
+
+REQUIRED_PERMISSIONS = compile_permission_mapping(PERMISSION_MAPPING, ACTION_ALIASES)
+
+# Actions any user may run on a row-scoped view; they only see their own rows.
+SCOPED_ACTIONS = {
+    "list",
+    "retrieve",
+    "export",
+    "current",
+    "payroll",
+    "calendar",
+    "balances",
+}
+
+# Roles store permission names; older rows may hold the keys themselves.
+PERMISSION_KEYS = {
+    **{key: key for key in CUSTOM_PERMISSIONS},
+    **{name: key for key, name in CUSTOM_PERMISSIONS.items()},
+}
+
+_effective_permissions = {}
+
+
+def get_effective_permissions(role):
+    """
+    Return the frozenset of permission keys granted by ``role``, cached per
+    role and recomputed when its ``permissions_version`` changes.
+    """
+    if role is None:
+        return frozenset()
+    cached = _effective_permissions.get(role.pk)
+    if cached is not None and cached[0] == role.permissions_version:
+        return cached[1]
+    permissions = frozenset(
+        PERMISSION_KEYS[name] for name in role.permissions or [] if name in PERMISSION_KEYS
+    )
+    _effective_permissions[role.pk] = (role.permissions_version, permissions)
+    return permissions
+
+
+def get_employee_ids(user):
+    """
+    Return the IDs of the employee records belonging to ``user``. Token
+    authentication loads them with the user; otherwise they are read once per
+    request and kept on the user object.
+    """
+    employee_ids = getattr(user, "employee_ids", None)
+    if employee_ids is None:
+        employee_ids = frozenset(
+            Employee.objects.filter(user_id=user.pk).values_list("id", flat=True)
+        )
+        user.employee_ids = employee_ids
+    return employee_ids
+
+
+def has_unscoped_access(user, view):
+    """Whether ``user`` may see every row of ``view`` for its current action."""
+    if user.is_admin:
+        return True
+    permission = REQUIRED_PERMISSIONS.get((view.__class__.__name__, view.action))
+    return permission is not None and permission in get_effective_permissions(
+        getattr(user, "role", None)
+    )
+
+
 class DynamicRolePermission(BasePermission):
     def has_permission(self, request, view):
         if not request.user.is_authenticated:
@@ -35,12 +123,15 @@ class DynamicRolePermission(BasePermission):
         if required_permission and self._check_role_permission(request.user, required_permission):
             return True
 
-        if view_name in ["EmployeeViewSet", "LeaveViewSet", "SalaryViewSet"]:
+        if getattr(view, "scope_field", None):
             if employee_id:
                 if self._is_own_employee(request.user, employee_id):
                     return True
                 self._raise_permission_denied("You do not have permission to access this employee's data.")
 
+            if action in SCOPED_ACTIONS:
+                return True
+
             if action == "create" and view_name == "LeaveViewSet":
                 employee_id = request.data.get("employee")
                 if employee_id and self._is_own_employee(request.user, employee_id):
@@ -52,43 +143,29 @@ class DynamicRolePermission(BasePermission):
         if request.user.is_admin:
             return True
 
-        if hasattr(obj, "user") and obj.user == request.user:
+        if getattr(obj, "user_id", None) == request.user.pk:
             return True
-        if hasattr(obj, "employee") and obj.employee.user == request.user:
+        if getattr(obj, "employee_id", None) in get_employee_ids(request.user):
             return True
 
-        user_role = getattr(request.user, "role", None)
-        if user_role:
-            view_name = view.__class__.__name__
-            action = view.action
-            required_permission = self._get_required_permission(view_name, action)
-            if required_permission and required_permission in (user_role.permissions or []):
-                return True
+        view_name = view.__class__.__name__
+        required_permission = self._get_required_permission(view_name, view.action)
+        if required_permission and self._check_role_permission(request.user, required_permission):
+            return True
 
         self._raise_permission_denied("You do not have permission to perform this action.")
 
     def _is_own_employee(self, user, employee_id):
         try:
-            employee = Employee.objects.get(id=employee_id)
-            return employee.user == user
-        except Employee.DoesNotExist:
-            self._raise_permission_denied(f"Employee with ID {employee_id} does not exist.")
+            return int(employee_id) in get_employee_ids(user)
+        except (TypeError, ValueError):
+            return False
 
     def _get_required_permission(self, view_name, action):
-        if action in ["retrieve", "partial_update"]:
-            action = "update"  
-        if action == "retrieve":
-            action = "list" 
-        for perm_key, mapping in PERMISSION_MAPPING.items():
-            if mapping["view_name"] == view_name and mapping["action"] == action:
-                return perm_key
-        return None
+        return REQUIRED_PERMISSIONS.get((view_name, action))
 
     def _check_role_permission(self, user, permission):
-        user_role = getattr(user, "role", None)
-        if user_role and permission in (user_role.permissions or []):
-            return True
-        return False
+        return permission in get_effective_permissions(getattr(user, "role", None))
 
     def _raise_permission_denied(self, message):
         raise PermissionDenied(detail=message)
@@ -0,0 +1,22 @@
+from .permissions import get_employee_ids, has_unscoped_access
+
+
+class RowScopingMixin:
+    """
+    Limit a view's queryset to the rows its user may see.
+
+    Users whose role grants the permission for the current action (and
+    admins) see every row; everyone else only sees rows whose
+    ``scope_field`` points at one of their own employee records. The filter
+    is part of the SQL, so ownership never costs an extra query.
+    """
+
+    scope_field = "employee_id"
+
+    def scope_queryset(self, queryset):
+        user = self.request.user
+        if not user.is_authenticated:
+            return queryset.none()
+        if has_unscoped_access(user, self):
+            return queryset
+        return queryset.filter(**{f"{self.scope_field}__in": get_employee_ids(user)})